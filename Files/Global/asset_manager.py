@@ -0,0 +1,193 @@
+from Global.settings import ASSET_LOADING_THREADS
+
+from os import walk as os_walk
+from concurrent.futures import ThreadPoolExecutor as concurrent_futures_ThreadPoolExecutor
+
+from pygame.image import load as pygame_image_load
+from pygame.mixer import Sound as pygame_mixer_Sound
+from pygame.transform import flip as pygame_transform_flip
+
+""" Asset manager:
+- The "graphics" and "sounds" directories are indexed once (the first time an asset is requested), instead of listing directories every time an animation or the sounds are loaded
+- Paths are looked up without matching case (the same as on Windows, which the game was made on), e.g. "graphics/Player/Normal/Idle/Downright" finds "DownRight"
+- Requesting an asset starts decoding the file on a thread pool and returns a handle. The handle is resolved (waiting for the decoding to finish if it has not yet) when the asset is needed
+- Requesting a file that is already being decoded (e.g. prefetched) shares the same decoding, and every resolved handle converts its own copy of the image, so images can still be changed by whatever loaded them (e.g. set_alpha)
+- The decoding of a file is removed from the asset manager once a handle to it has been resolved (the caller keeps the converted asset), so decoded files are not kept for the lifetime of the program. Requesting the file again decodes it again
+- So each file should only be loaded once by whatever uses it, e.g. mirrored animations / images are flipped from the loaded frames (see flip_animation) instead of loading the file a second time
+"""
+
+# The directories that are indexed
+asset_directories = ("graphics", "sounds")
+
+# The file extensions of each type of asset
+image_extensions = (".png", ".jpg")
+sound_extensions = (".wav", ".ogg")
+
+# Dictionary holding the state of the asset manager
+asset_manager_dict = {
+                    # Whether the asset directories have been indexed
+                    "Indexed": False,
+
+                    # Format: {lower case path: path} (for every file and directory)
+                    "PathsDict": {},
+
+                    # Format: {lower case directory path: (file names sorted alphabetically)}
+                    "DirectoriesDict": {},
+
+                    # The thread pool that decodes the files (Created the first time an asset is requested)
+                    "ThreadPool": None,
+
+                    # The decoding of each file that has been requested / prefetched but not resolved yet, format: {path: future}
+                    "DecodingFuturesDict": {},
+                    }
+
+class AssetHandle:
+
+    # A handle to an asset that is being decoded on the thread pool, which is resolved the first time the asset is needed
+
+    def __init__(self, path, future, conversion):
+
+        # The path of the file and the decoding of the file
+        self.path = path
+        self.future = future
+
+        # How the image should be converted once it has been decoded ("Alpha" = convert_alpha, "Opaque" = convert, None = not converted / not an image)
+        self.conversion = conversion
+
+        # The asset, once resolved
+        self.asset = None
+
+    def resolve(self):
+
+        # Returns the asset, waiting for the file to be decoded if it has not finished decoding yet
+
+        # If the handle has not been resolved yet
+        if self.asset == None:
+
+            # Wait for the file to be decoded
+            asset = self.future.result()
+
+            # Remove the decoding from the asset manager (if it has not already been replaced), so that the decoded file is not kept after it has been converted
+            if asset_manager_dict["DecodingFuturesDict"].get(self.path) == self.future:
+                del asset_manager_dict["DecodingFuturesDict"][self.path]
+            self.future = None
+
+            # Convert the image to the display's pixel format (This must be done on the main thread, and creates a copy of the decoded image)
+            match self.conversion:
+                case "Alpha":
+                    asset = asset.convert_alpha()
+                case "Opaque":
+                    asset = asset.convert()
+
+            self.asset = asset
+
+        return self.asset
+
+def index_assets():
+
+    # Indexes every file and directory inside of the asset directories
+    for asset_directory in asset_directories:
+        for directory_path, directory_names, file_names in os_walk(asset_directory):
+
+            # Use "/" so that the paths are the same as the paths used in the code
+            directory_path = directory_path.replace("\\", "/")
+
+            asset_manager_dict["PathsDict"][directory_path.lower()] = directory_path
+            asset_manager_dict["DirectoriesDict"][directory_path.lower()] = tuple(sorted(file_names))
+
+            for file_name in file_names:
+                asset_manager_dict["PathsDict"][f"{directory_path}/{file_name}".lower()] = f"{directory_path}/{file_name}"
+
+    asset_manager_dict["Indexed"] = True
+
+def find_asset_path(path):
+
+    # Returns the path of an asset with the correct case (or the path given if the asset is not indexed)
+
+    # If the asset directories have not been indexed yet
+    if asset_manager_dict["Indexed"] == False:
+        index_assets()
+
+    return asset_manager_dict["PathsDict"].get(path.replace("\\", "/").lower(), path)
+
+def list_asset_directory(directory):
+
+    # Returns the names of the files inside of an asset directory (sorted alphabetically)
+
+    # If the asset directories have not been indexed yet
+    if asset_manager_dict["Indexed"] == False:
+        index_assets()
+
+    return asset_manager_dict["DirectoriesDict"][directory.replace("\\", "/").rstrip("/").lower()]
+
+def decode_asset(path):
+
+    # Decodes an image or sound file (Run on the thread pool)
+    if path.lower().endswith(sound_extensions):
+        return pygame_mixer_Sound(path)
+    return pygame_image_load(path)
+
+def find_decoding_future(path):
+
+    # Returns the path of a file (with the correct case) and the decoding of the file, starting to decode it if it has not been started already
+    path = find_asset_path(path = path)
+
+    if path not in asset_manager_dict["DecodingFuturesDict"]:
+
+        # If the thread pool has not been created yet
+        if asset_manager_dict["ThreadPool"] == None:
+            asset_manager_dict["ThreadPool"] = concurrent_futures_ThreadPoolExecutor(max_workers = ASSET_LOADING_THREADS, thread_name_prefix = "AssetLoader")
+
+        asset_manager_dict["DecodingFuturesDict"][path] = asset_manager_dict["ThreadPool"].submit(decode_asset, path)
+
+    return path, asset_manager_dict["DecodingFuturesDict"][path]
+
+def request_image(path, conversion = "Alpha"):
+
+    # Starts decoding an image and returns a handle to it
+    path, future = find_decoding_future(path = path)
+    return AssetHandle(path = path, future = future, conversion = conversion)
+
+def request_sound(path):
+
+    # Starts decoding a sound and returns a handle to it
+    path, future = find_decoding_future(path = path)
+    return AssetHandle(path = path, future = future, conversion = None)
+
+def load_image(path, conversion = "Alpha"):
+
+    # Returns an image (waiting for it to be decoded)
+    return request_image(path = path, conversion = conversion).resolve()
+
+def load_animation(directory):
+
+    # Returns the frames of an animation, where the images inside of the directory are named by their frame number (0.png, 1.png, ...)
+    # Note: All of the frames are requested before any are resolved, so that they are decoded at the same time (Mirrored animations are created with flip_animation)
+    handles = [request_image(path = f"{directory}/{i}.png") for i in range(0, len(list_asset_directory(directory = directory)))]
+    return tuple(handle.resolve() for handle in handles)
+
+def flip_animation(animation, flip_x = False, flip_y = False):
+
+    # Returns a flipped copy of each frame of an animation that has already been loaded (e.g. the "Left" frames from the "Right" frames)
+    return tuple(pygame_transform_flip(surface = frame, flip_x = flip_x, flip_y = flip_y) for frame in animation)
+
+def prefetch_asset(path):
+
+    # Starts decoding an image or sound, so that it has been decoded by the time it is loaded
+    find_decoding_future(path = path)
+
+def prefetch_asset_directory(directory):
+
+    # Starts decoding every image and sound inside of a directory (and the directories inside of it), so that they have been decoded by the time they are loaded
+
+    # If the asset directories have not been indexed yet
+    if asset_manager_dict["Indexed"] == False:
+        index_assets()
+
+    directory = directory.replace("\\", "/").rstrip("/").lower()
+    for directory_path, file_names in asset_manager_dict["DirectoriesDict"].items():
+        # If this is the directory or a directory inside of it
+        if directory_path == directory or directory_path.startswith(directory + "/"):
+            for file_name in file_names:
+                if file_name.lower().endswith(image_extensions + sound_extensions):
+                    find_decoding_future(path = f"{directory_path}/{file_name}")
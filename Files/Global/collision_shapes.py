@@ -0,0 +1,137 @@
+from math import pi
+
+from pygame import Surface as pygame_Surface
+from pygame import SRCALPHA as pygame_SRCALPHA
+from pygame.mask import Mask as pygame_mask_Mask
+from pygame.mask import from_surface as pygame_mask_from_surface
+from pygame.draw import circle as pygame_draw_circle
+
+""" Collision shapes:
+- "Rect": The image is fully opaque, so a rect collision is the same as a pixel-perfect collision
+- "Circle": The image is a filled circle, so an analytic circle test can be used (the object must have a "radius" attribute and the center of the circle is the center of its rect)
+- "Mask": Any other image, which needs a pixel-perfect collision with a mask (the object must have a "mask" attribute)
+"""
+
+# The maximum difference (as a proportion) between the number of opaque pixels in an image and the area of a circle with the same diameter for the image to be considered a circle
+circle_area_tolerance = 0.1
+
+# Dictionaries holding filled masks for rects (key = size) and circles (key = radius), so that they are only created once
+rect_masks_dict = {}
+circle_masks_dict = {}
+
+def find_rect_mask(size):
+
+    # Returns a filled mask the size of a rect
+
+    # If a mask has not been created for this size yet
+    if size not in rect_masks_dict:
+        # Create a filled mask
+        rect_masks_dict[size] = pygame_mask_Mask(size, fill = True)
+
+    return rect_masks_dict[size]
+
+def find_circle_mask(radius):
+
+    # Returns a filled circle mask with the given radius
+
+    # If a mask has not been created for this radius yet
+    if radius not in circle_masks_dict:
+        # Draw a filled circle onto a transparent surface and create a mask from it
+        circle_surface = pygame_Surface((radius * 2, radius * 2), pygame_SRCALPHA)
+        pygame_draw_circle(surface = circle_surface, color = (255, 255, 255, 255), center = (radius, radius), radius = radius)
+        circle_masks_dict[radius] = pygame_mask_from_surface(circle_surface)
+
+    return circle_masks_dict[radius]
+
+def find_collision_shape(image):
+
+    # Analyses the alpha of an image and returns the collision shape of the image and its mask
+
+    # Create a mask of the image
+    mask = pygame_mask_from_surface(image)
+
+    # If every pixel of the image is opaque
+    if mask.count() == image.get_width() * image.get_height():
+        return "Rect", mask
+
+    # If the image is square and the opaque pixels are roughly the same as a filled circle with the same diameter
+    if image.get_width() == image.get_height() and image.get_width() > 0:
+
+        # The area of a circle with the same diameter as the image
+        circle_area = pi * ((image.get_width() / 2) ** 2)
+
+        # If the number of opaque pixels is close to the area of the circle and almost all of the opaque pixels are inside of the circle
+        if abs(mask.count() - circle_area) <= circle_area * circle_area_tolerance and \
+            mask.overlap_area(find_circle_mask(radius = image.get_width() // 2), (0, 0)) >= mask.count() * (1 - circle_area_tolerance):
+            return "Circle", mask
+
+    # Otherwise the image requires pixel-perfect collisions
+    return "Mask", mask
+
+def find_mask(sprite):
+
+    # Returns the mask of a sprite (creating it from the sprite's image if the sprite does not have one)
+    return sprite.mask if hasattr(sprite, "mask") else pygame_mask_from_surface(sprite.image)
+
+def collide_circle_and_rect(circle_sprite, rect):
+
+    # Returns whether a circle collides with a rect (by finding the closest point on the rect to the center of the circle)
+    closest_x = max(rect.left, min(circle_sprite.rect.centerx, rect.right))
+    closest_y = max(rect.top, min(circle_sprite.rect.centery, rect.bottom))
+
+    return ((circle_sprite.rect.centerx - closest_x) ** 2) + ((circle_sprite.rect.centery - closest_y) ** 2) <= (circle_sprite.radius ** 2)
+
+def collide_shapes(sprite_a, sprite_b):
+
+    # Checks for a collision between two sprites using their collision shapes
+    """ Notes:
+    - Returns True if they collide, otherwise returns None (The same as pygame.sprite.collide_mask, so that it can be used in the same way)
+    - Sprites without a collision shape are treated as "Mask"
+    """
+
+    # Find the collision shape of both sprites
+    shape_a = sprite_a.collision_shape if hasattr(sprite_a, "collision_shape") else "Mask"
+    shape_b = sprite_b.collision_shape if hasattr(sprite_b, "collision_shape") else "Mask"
+
+    # Order the sprites so that there are fewer combinations ("Rect" first, then "Circle", then "Mask")
+    shapes_order = ("Rect", "Circle", "Mask")
+    if shapes_order.index(shape_a) > shapes_order.index(shape_b):
+        sprite_a, sprite_b = sprite_b, sprite_a
+        shape_a, shape_b = shape_b, shape_a
+
+    match (shape_a, shape_b):
+
+        # Rect and rect
+        case ("Rect", "Rect"):
+            collided = sprite_a.rect.colliderect(sprite_b.rect)
+
+        # Rect and circle
+        case ("Rect", "Circle"):
+            collided = collide_circle_and_rect(circle_sprite = sprite_b, rect = sprite_a.rect)
+
+        # Rect and mask
+        case ("Rect", "Mask"):
+            # If the rect completely contains the other sprite, there must be a collision (as long as the mask is not empty)
+            if sprite_a.rect.contains(sprite_b.rect):
+                collided = find_mask(sprite_b).count() > 0
+            # Otherwise check the mask against the opaque rect
+            else:
+                collided = find_mask(sprite_b).overlap(find_rect_mask(size = sprite_a.rect.size), (sprite_a.rect.x - sprite_b.rect.x, sprite_a.rect.y - sprite_b.rect.y)) != None
+
+        # Circle and circle
+        case ("Circle", "Circle"):
+            collided = ((sprite_a.rect.centerx - sprite_b.rect.centerx) ** 2) + ((sprite_a.rect.centery - sprite_b.rect.centery) ** 2) <= ((sprite_a.radius + sprite_b.radius) ** 2)
+
+        # Circle and mask
+        case ("Circle", "Mask"):
+            collided = find_mask(sprite_b).overlap(
+                                                find_circle_mask(radius = sprite_a.radius),
+                                                ((sprite_a.rect.centerx - sprite_a.radius) - sprite_b.rect.x, (sprite_a.rect.centery - sprite_a.radius) - sprite_b.rect.y)
+                                                ) != None
+
+        # Mask and mask
+        case _:
+            collided = find_mask(sprite_a).overlap(find_mask(sprite_b), (sprite_b.rect.x - sprite_a.rect.x, sprite_b.rect.y - sprite_a.rect.y)) != None
+
+    # Return True if the sprites collided, otherwise None
+    return True if collided == True else None
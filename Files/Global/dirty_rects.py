@@ -0,0 +1,58 @@
+from Global.settings import DIRTY_RECTS_FULL_UPDATE_PROPORTION
+
+from pygame import Rect as pygame_Rect
+from pygame.display import update as pygame_display_update
+from pygame.display import get_surface as pygame_display_get_surface
+
+""" Dirty rects:
+- Anything drawn onto the screen reports the region of the screen that it changed (a "dirty" rect), or that the entire screen has changed
+- When the display is updated, only the dirty rects of this frame and the previous frame are pushed to the display (The previous frame's rects are included so that anything that moved or disappeared is also updated)
+- If the entire screen has changed, or the dirty rects cover more than DIRTY_RECTS_FULL_UPDATE_PROPORTION of the screen, the entire display is updated instead
+"""
+
+# Dictionary holding the dirty rects
+dirty_rects_dict = {
+                    # The dirty rects of the current frame and the previous frame
+                    "RectsList": [],
+                    "PreviousRectsList": [],
+
+                    # Whether the entire screen has changed this frame (The first frame always updates the entire display)
+                    "FullScreen": True,
+                    }
+
+def mark_dirty_rect(rect):
+
+    # Reports that a region of the screen has changed this frame
+    dirty_rects_dict["RectsList"].append(pygame_Rect(rect))
+
+def mark_full_screen_dirty():
+
+    # Reports that the entire screen has changed this frame (e.g. the level is drawn, or the menu has changed)
+    dirty_rects_dict["FullScreen"] = True
+
+def present_dirty_rects():
+
+    # Updates the display with the regions of the screen that have changed, then starts tracking the next frame
+
+    # If the entire screen has changed
+    if dirty_rects_dict["FullScreen"] == True:
+        pygame_display_update()
+
+    else:
+        # The dirty rects of this frame and the previous frame, limited to the screen (removing any rects that are completely off the screen)
+        screen_rect = pygame_display_get_surface().get_rect()
+        dirty_rects = [rect.clip(screen_rect) for rect in dirty_rects_dict["PreviousRectsList"] + dirty_rects_dict["RectsList"]]
+        dirty_rects = [rect for rect in dirty_rects if rect.width > 0 and rect.height > 0]
+
+        # If the dirty rects cover too much of the screen, update the entire display (Overlapping rects are counted more than once, so this may update the entire display slightly early)
+        if sum(rect.width * rect.height for rect in dirty_rects) > (screen_rect.width * screen_rect.height) * DIRTY_RECTS_FULL_UPDATE_PROPORTION:
+            pygame_display_update()
+
+        # If anything has changed, only update the dirty rects
+        elif len(dirty_rects) > 0:
+            pygame_display_update(dirty_rects)
+
+    # Start tracking the next frame
+    dirty_rects_dict["PreviousRectsList"] = dirty_rects_dict["RectsList"]
+    dirty_rects_dict["RectsList"] = []
+    dirty_rects_dict["FullScreen"] = False
@@ -0,0 +1,180 @@
+from Global.settings import PROFILER_RING_BUFFER_LENGTH
+
+from time import perf_counter
+
+from numpy import zeros as np_zeros
+from numpy import concatenate as np_concatenate
+
+""" Frame profiler:
+- Times how long each section of a frame takes (e.g. collisions, the boss AI, the player, the UI and scaling the game onto the screen)
+- The methods of each section are wrapped with timing code only while the profiler is enabled, so there is no cost when it is disabled
+- The time of a section does not include the time of any other section called inside of it (e.g. if the player calls a UI method, that time is counted as "UI")
+- Any time in a frame that is not part of a section is counted as "Other"
+- The times of the most recent frames are kept in a ring buffer (used by the profiler overlay), all frames are only kept when "KeepAllFrames" is enabled (used by the benchmark runner)
+"""
+
+# The sections of a frame, in the order that they are displayed
+profiler_sections = ("Collisions", "AI", "Player", "UI", "ScalingAndBlit", "Other")
+
+# The columns of the ring buffer (the total frame time, followed by the time of each section)
+ring_buffer_columns = ("Frame",) + profiler_sections
+
+# Dictionary holding the state of the frame profiler
+profiler_dict = {
+                "Enabled": False,
+
+                # Format: [(owner, method_name, original_method)] (Used to restore the original methods when the profiler is disabled)
+                "OriginalMethods": [],
+
+                # The sections that are currently running (the last section is the one currently being timed) and the time that the current section was last started / resumed
+                "SectionsStack": [],
+                "SectionStartTime": None,
+
+                # The time that the current frame started and the time spent in each section during the current frame
+                "FrameStartTime": None,
+                "CurrentFrameTimes": {section: 0 for section in profiler_sections},
+
+                # The section times (and total time) of every frame that has finished since the profiler was enabled, format: [{"Frame": total_time, "Collisions": time, ...}]
+                "KeepAllFrames": False,
+                "FramesList": [],
+
+                # Ring buffer holding the times of the most recent frames, one row per frame with the columns in the order of ring_buffer_columns
+                # Note: "RingBufferIndex" is the row that the next frame will be written to, and "RingBufferCount" is the number of rows that have been filled
+                "RingBuffer": np_zeros((PROFILER_RING_BUFFER_LENGTH, len(ring_buffer_columns))),
+                "RingBufferIndex": 0,
+                "RingBufferCount": 0,
+                }
+
+def find_profiled_methods():
+
+    # Returns the methods that are timed by the profiler, and the section that each method is a part of
+    # Note: The imports are here so that the profiler can be imported by anything (without importing the entire level)
+    from Level.game import Game
+    from Level.game_ui import GameUI
+    from Level.Player.player import Player
+    from Level.Support.objects_collision_detector import ObjectCollisionDetector
+
+    return (
+            (ObjectCollisionDetector, "handle_collisions", "Collisions"),
+            (Game, "find_neighbouring_tiles", "Collisions"),
+            (Game, "update_and_run_boss", "AI"),
+            (Game, "draw_boss", "AI"),
+            (Player, "run", "Player"),
+            (Player, "draw_player", "Player"),
+            (Game, "update_game_ui", "UI"),
+            (GameUI, "update", "UI"),
+            (GameUI, "run", "UI"),
+            (GameUI, "update_angled_polygons_effects", "UI"),
+            (GameUI, "draw_angled_polygons_effects", "UI"),
+            (GameUI, "update_guide_text", "UI"),
+            (GameUI, "display_introduction", "UI"),
+            (GameUI, "draw_guide_text", "UI"),
+            (Game, "draw_scaled_surface", "ScalingAndBlit"),
+            )
+
+def create_profiled_method(method, section):
+
+    # Returns a method that times the original method as part of a section
+    def profiled_method(*args, **kwargs):
+        start_profiler_section(section = section)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            end_profiler_section()
+
+    return profiled_method
+
+def enable_profiler(keep_all_frames = False):
+
+    # Enables the profiler by wrapping all of the profiled methods with timing code
+    # Note: If keep_all_frames is True, the times of every frame are kept in "FramesList" (otherwise only the most recent frames are kept in the ring buffer)
+
+    # If the profiler is already enabled
+    if profiler_dict["Enabled"] == True:
+        return
+
+    # Check that all of the profiled methods exist before any are replaced (e.g. if a method has been renamed)
+    profiled_methods = find_profiled_methods()
+    missing_methods = [f"{owner.__name__}.{method_name}" for owner, method_name, section in profiled_methods if hasattr(owner, method_name) == False]
+    if len(missing_methods) > 0:
+        raise AttributeError(f"The profiled methods {missing_methods} do not exist")
+
+    for owner, method_name, section in profiled_methods:
+        # Save the original method and replace it with the profiled method
+        original_method = getattr(owner, method_name)
+        profiler_dict["OriginalMethods"].append((owner, method_name, original_method))
+        setattr(owner, method_name, create_profiled_method(method = original_method, section = section))
+
+    profiler_dict["Enabled"] = True
+    profiler_dict["KeepAllFrames"] = keep_all_frames
+    profiler_dict["FramesList"] = []
+    profiler_dict["RingBufferIndex"] = 0
+    profiler_dict["RingBufferCount"] = 0
+
+def disable_profiler():
+
+    # Disables the profiler by restoring all of the original methods
+
+    for owner, method_name, original_method in profiler_dict["OriginalMethods"]:
+        setattr(owner, method_name, original_method)
+
+    profiler_dict["OriginalMethods"] = []
+    profiler_dict["Enabled"] = False
+
+def start_profiler_section(section):
+
+    # Starts timing a section (pausing the section that was running before it)
+    current_time = perf_counter()
+
+    # If another section is running, add the time spent in that section so far
+    if len(profiler_dict["SectionsStack"]) > 0:
+        profiler_dict["CurrentFrameTimes"][profiler_dict["SectionsStack"][-1]] += current_time - profiler_dict["SectionStartTime"]
+
+    profiler_dict["SectionsStack"].append(section)
+    profiler_dict["SectionStartTime"] = current_time
+
+def end_profiler_section():
+
+    # Stops timing the current section (resuming the section that was running before it)
+    current_time = perf_counter()
+
+    # Add the time spent in the section and remove it from the stack
+    profiler_dict["CurrentFrameTimes"][profiler_dict["SectionsStack"].pop()] += current_time - profiler_dict["SectionStartTime"]
+    profiler_dict["SectionStartTime"] = current_time
+
+def begin_profiler_frame():
+
+    # Starts timing a frame
+    profiler_dict["FrameStartTime"] = perf_counter()
+    profiler_dict["CurrentFrameTimes"] = {section: 0 for section in profiler_sections}
+
+def end_profiler_frame():
+
+    # Stops timing the current frame, saving the section times of the frame and returning them
+
+    # The total time of the frame
+    frame_times = profiler_dict["CurrentFrameTimes"]
+    frame_times["Frame"] = perf_counter() - profiler_dict["FrameStartTime"]
+
+    # Any time not spent in a section is counted as "Other"
+    frame_times["Other"] = max(frame_times["Frame"] - sum(frame_times[section] for section in profiler_sections if section != "Other"), 0)
+
+    # Write the frame into the ring buffer (overwriting the oldest frame once the ring buffer is full)
+    profiler_dict["RingBuffer"][profiler_dict["RingBufferIndex"]] = [frame_times[column] for column in ring_buffer_columns]
+    profiler_dict["RingBufferIndex"] = (profiler_dict["RingBufferIndex"] + 1) % PROFILER_RING_BUFFER_LENGTH
+    profiler_dict["RingBufferCount"] = min(profiler_dict["RingBufferCount"] + 1, PROFILER_RING_BUFFER_LENGTH)
+
+    if profiler_dict["KeepAllFrames"] == True:
+        profiler_dict["FramesList"].append(frame_times)
+
+    return frame_times
+
+def find_recent_frames():
+
+    # Returns the rows of the ring buffer that have been filled, ordered from the oldest frame to the newest frame
+    if profiler_dict["RingBufferCount"] < PROFILER_RING_BUFFER_LENGTH:
+        return profiler_dict["RingBuffer"][:profiler_dict["RingBufferCount"]]
+
+    # Once the ring buffer is full, the oldest frame is the one that will be overwritten next
+    index = profiler_dict["RingBufferIndex"]
+    return np_concatenate((profiler_dict["RingBuffer"][index:], profiler_dict["RingBuffer"][:index]))
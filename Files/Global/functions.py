@@ -1,8 +1,13 @@
-from math import sin, radians
+from Global.settings import TINTED_IMAGES_CACHE_MEMORY_LIMIT, TINTED_IMAGES_COLOUR_QUANTIZATION_STEP, PROJECTILE_ROTATION_ANGLE_STEP
+from Global.collision_shapes import find_collision_shape
+
+from math import sin, radians, degrees
+from collections import OrderedDict
 
 from pygame.transform import smoothscale
-from pygame import Surface as pygame_Surface
+from pygame.transform import rotozoom as pygame_transform_rotozoom
 from pygame import BLEND_RGB_ADD as pygame_BLEND_RGB_ADD
+from pygame.mask import from_surface as pygame_mask_from_surface
 
 def draw_text(text, text_colour, font, x, y, surface, scale_multiplier = None):
 
@@ -20,43 +25,105 @@ def draw_text(text, text_colour, font, x, y, surface, scale_multiplier = None):
         # Smoothscale and blit the image onto the surface
         surface.blit(smoothscale(text_image, (text_image.get_width() / scale_multiplier, text_image.get_height() / scale_multiplier)), (x, y))
 
+# Dictionary holding the tinted images created by change_image_colour, so that the same tinted image does not need to be created every frame
+""" Notes:
+- "Images" is ordered from the least recently used to the most recently used, so that the least recently used tinted images are removed first once the memory limit has been exceeded
+- The tinted images are shared, so they should not be drawn onto / changed
+"""
+tinted_images_cache_dict = {
+                            "Images": OrderedDict(), # Format: {(source_image, quantized_colour): tinted_image}
+                            "MemoryUsed": 0, 
+                            "MemoryLimit": TINTED_IMAGES_CACHE_MEMORY_LIMIT,
+                            "Hits": 0,
+                            "Misses": 0
+                            }
+
 def change_image_colour(current_animation_image, desired_colour = (255, 255, 255)): # Default colour is white
 
-        # Create a new surface which will be blended with the current (animation) image to make an image change colour
-        colour_layer = pygame_Surface(current_animation_image.get_size()).convert_alpha()
+        # Round the desired colour so that colours which are very similar (e.g. the sin changing colours) share the same tinted image
+        quantized_colour = tuple(min(255, round(desired_colour[i] / TINTED_IMAGES_COLOUR_QUANTIZATION_STEP) * TINTED_IMAGES_COLOUR_QUANTIZATION_STEP) for i in range(0, 3))
 
-        # Fill the colour layer with the desired colour
-        colour_layer.fill(desired_colour)
-        
-        # Set the current (animation) image to be a copy of the current (animation) image (so that the original image is not overwritten)
-        current_animation_image = current_animation_image.copy()
+        # The key for the tinted image inside the cache
+        cache_key = (current_animation_image, quantized_colour)
+
+        # If this image has already been tinted with this colour
+        if cache_key in tinted_images_cache_dict["Images"]:
+            # Increment the number of cache hits
+            tinted_images_cache_dict["Hits"] += 1
+
+            # Mark the tinted image as the most recently used
+            tinted_images_cache_dict["Images"].move_to_end(cache_key)
+
+            # Return the cached tinted image
+            return tinted_images_cache_dict["Images"][cache_key]
+
+        # Increment the number of cache misses
+        tinted_images_cache_dict["Misses"] += 1
+
+        # Create a copy of the current (animation) image (so that the original image is not overwritten)
+        tinted_image = current_animation_image.copy()
         
-        # Blit the colour layer onto the current (animation) image, with the special flag pygame_BLEND_RGB_ADD to add the RGB values
-        current_animation_image.blit(colour_layer, (0, 0), special_flags = pygame_BLEND_RGB_ADD)
+        # Add the RGB values of the desired colour onto the copy, with the special flag pygame_BLEND_RGB_ADD (The alpha values are not changed)
+        tinted_image.fill(quantized_colour, special_flags = pygame_BLEND_RGB_ADD)
+
+        # Add the tinted image to the cache
+        tinted_images_cache_dict["Images"][cache_key] = tinted_image
+        tinted_images_cache_dict["MemoryUsed"] += tinted_image.get_width() * tinted_image.get_height() * tinted_image.get_bytesize()
+
+        # Remove the least recently used tinted images until the cache is within the memory limit (always keeping the tinted image that was just created)
+        while tinted_images_cache_dict["MemoryUsed"] > tinted_images_cache_dict["MemoryLimit"] and len(tinted_images_cache_dict["Images"]) > 1:
+            removed_image = tinted_images_cache_dict["Images"].popitem(last = False)[1]
+            tinted_images_cache_dict["MemoryUsed"] -= removed_image.get_width() * removed_image.get_height() * removed_image.get_bytesize()
 
         # Return the coloured animation image (The result should be an image that has a different colour on top)
-        return current_animation_image
+        return tinted_image
 
 def change_image_colour_v2(current_animation_image, desired_colour):
 
-    # Changes the image colour completely, without flags
-
-    # Create a copy of the image (So that you don't overwrite the original)
-    changed_image = current_animation_image.copy().convert_alpha()
+    # Changes the image colour completely, without flags (i.e. creates a silhouette of the image in the desired colour)
+    """ Note: The mask is created with a threshold of 0, so that every pixel that is not fully transparent is set as the desired colour, and every fully transparent pixel stays fully transparent """
 
-      # For each row
-    for i in range(0, changed_image.get_width()):
-        # For each column
-        for j in range(0, changed_image.get_height()):
-            
-            # If the pixel is not fully transparent
-            if changed_image.get_at((i, j)).a != 0:
-                # Set the pixel as the desired colour
-                changed_image.set_at((i, j), (desired_colour[0], desired_colour[1], desired_colour[2], 255))
+    # Create a mask of all of the pixels that are not fully transparent, and create a new image from the mask (So that you don't overwrite the original)
+    changed_image = pygame_mask_from_surface(current_animation_image, 0).to_surface(setcolor = (desired_colour[0], desired_colour[1], desired_colour[2], 255), unsetcolor = (0, 0, 0, 0)).convert_alpha()
 
     # Return the changed image
     return changed_image
 
+def create_rotated_images_dict(image, scale):
+
+    # Creates the rotated images of an image at every angle step, alongside their collision shapes and masks
+    """ Notes:
+    - Used for projectiles, so that spawning a projectile only needs to look up its rotated image instead of rotating the image
+    - The rotated images are shared, so they should not be drawn onto / changed
+    """
+    
+    # Convert the image once, so that every rotated image is created from the converted image
+    converted_image = image.convert_alpha()
+
+    # Dictionary holding the rotated images
+    """ Format:
+    rotated_images_dict[quantized_angle_in_degrees] = (rotated_image, collision_shape, mask)
+    """
+    rotated_images_dict = {}
+
+    # For each angle step
+    for quantized_angle in range(0, 360, PROJECTILE_ROTATION_ANGLE_STEP):
+        # Rotate (and scale) the image
+        rotated_image = pygame_transform_rotozoom(surface = converted_image, angle = quantized_angle, scale = scale)
+        # Save the rotated image with its collision shape and mask
+        rotated_images_dict[quantized_angle] = (rotated_image,) + find_collision_shape(image = rotated_image)
+
+    return rotated_images_dict
+
+def find_rotated_image(rotated_images_dict, angle):
+
+    # Returns the rotated image, collision shape and mask for an angle (in radians), from the rotated images created by create_rotated_images_dict
+
+    # Round the angle (in degrees) to the nearest angle step, keeping it between 0 and 360 degrees
+    quantized_angle = (round(degrees(angle) / PROJECTILE_ROTATION_ANGLE_STEP) * PROJECTILE_ROTATION_ANGLE_STEP) % 360
+
+    return rotated_images_dict[quantized_angle]
+
 def sin_change_object_colour(current_sin_angle, angle_time_gradient, colour_to_change, original_colour, delta_time, plus_or_minus_list, min_max_colours):
 
         """ Explanations of parameters:
@@ -0,0 +1,169 @@
+from json import dumps as json_dumps
+from json import loads as json_loads
+from gzip import open as gzip_open
+from random import seed as random_seed
+from atexit import register as atexit_register
+
+from pygame.key import get_pressed as pygame_key_get_pressed
+from pygame.mouse import get_pressed as pygame_mouse_get_pressed
+from pygame.mouse import get_pos as pygame_mouse_get_pos
+from pygame.event import get as pygame_event_get
+from pygame.event import Event as pygame_event_Event
+from pygame import QUIT as pygame_QUIT
+from pygame import KEYDOWN as pygame_KEYDOWN
+from pygame import K_a as pygame_K_a
+from pygame import K_d as pygame_K_d
+from pygame import K_w as pygame_K_w
+from pygame import K_s as pygame_K_s
+from pygame import K_r as pygame_K_r
+from pygame import K_f as pygame_K_f
+from pygame import K_SPACE as pygame_K_SPACE
+
+""" Input recorder:
+- All input (keys held, mouse buttons held, mouse position and events) is read through this module instead of directly from pygame
+- "Live": The input is read from pygame
+- "Record": The input is read from pygame and saved for every frame, so that the session can be written to a file (a gzipped JSON file)
+- "Replay": The input is read from a recorded session, frame-for-frame (including the delta time of each frame)
+- Together with seed_random_number_generators, a recorded session can be replayed exactly (e.g. to compare frame times before and after a change)
+"""
+
+# The keys that are checked with key_get_pressed (Only these keys are saved in recordings)
+recorded_keys = (pygame_K_a, pygame_K_d, pygame_K_w, pygame_K_s, pygame_K_r, pygame_K_f, pygame_K_SPACE)
+
+# The event types that are saved in recordings
+recorded_event_types = (pygame_QUIT, pygame_KEYDOWN)
+
+# Dictionary holding the state of the input recorder
+input_recorder_dict = {
+                        "Mode": "Live",
+                        "Seed": None,
+                        "FilePath": None,
+
+                        # Format: [delta_time, pressed_keys, mouse_position, mouse_buttons_pressed, events]
+                        "Frames": [],
+                        "FrameIndex": 0,
+
+                        # The input of the current frame (Only used when recording or replaying)
+                        "CurrentFrame": None,
+
+                        # Whether the events of the current frame have already been returned (so that events are only handled once per frame, the same as pygame.event.get)
+                        "EventsReturned": False,
+                        }
+
+class PressedKeys:
+
+    # Holds the keys pressed during a recorded frame, and can be indexed with a key in the same way as pygame.key.get_pressed()
+
+    def __init__(self, pressed_keys):
+        self.pressed_keys = pressed_keys
+
+    def __getitem__(self, key):
+        return key in self.pressed_keys
+
+def seed_random_number_generators(seed):
+
+    # Seeds the random number generator used by all of the game's random calls (randrange, choice, uniform, etc. are all from the same shared generator)
+    input_recorder_dict["Seed"] = seed
+    random_seed(seed)
+
+def start_recording(file_path, seed):
+
+    # Starts recording the input of every frame, which is written to the file when the program exits
+    input_recorder_dict["Mode"] = "Record"
+    input_recorder_dict["FilePath"] = file_path
+    input_recorder_dict["Frames"] = []
+    seed_random_number_generators(seed = seed)
+
+    # Save the recording when the program exits (The program can be closed from multiple places e.g. the menus)
+    atexit_register(save_recording)
+
+def save_recording():
+
+    # Writes the recorded session to the file
+    with gzip_open(input_recorder_dict["FilePath"], "wt") as recording_file:
+        recording_file.write(json_dumps({"Seed": input_recorder_dict["Seed"], "Frames": input_recorder_dict["Frames"]}, separators = (",", ":")))
+
+def start_replay(file_path):
+
+    # Loads a recorded session and starts replaying it from the first frame
+    with gzip_open(file_path, "rt") as recording_file:
+        recording = json_loads(recording_file.read())
+
+    input_recorder_dict["Mode"] = "Replay"
+    input_recorder_dict["FilePath"] = file_path
+    input_recorder_dict["Frames"] = recording["Frames"]
+    input_recorder_dict["FrameIndex"] = 0
+    seed_random_number_generators(seed = recording["Seed"])
+
+def replay_finished():
+
+    # Returns whether all of the frames in the recorded session have been replayed
+    return input_recorder_dict["Mode"] == "Replay" and input_recorder_dict["FrameIndex"] >= len(input_recorder_dict["Frames"])
+
+def begin_frame(delta_time):
+
+    # Captures (or loads) the input for this frame, returning the delta time that should be used for this frame
+    # Note: Called once at the start of every frame, before the game states controller is run
+
+    # The events of this frame have not been returned yet
+    input_recorder_dict["EventsReturned"] = False
+
+    match input_recorder_dict["Mode"]:
+
+        case "Record":
+            # Save the input of this frame
+            input_recorder_dict["CurrentFrame"] = [
+                                                    delta_time,
+                                                    [key for key in recorded_keys if pygame_key_get_pressed()[key]],
+                                                    list(pygame_mouse_get_pos()),
+                                                    [int(button_pressed) for button_pressed in pygame_mouse_get_pressed()],
+                                                    [[event.type, getattr(event, "key", None)] for event in pygame_event_get() if event.type in recorded_event_types]
+                                                    ]
+            input_recorder_dict["Frames"].append(input_recorder_dict["CurrentFrame"])
+
+        case "Replay":
+            # Load the input of this frame, and use the delta time that was recorded (if there is one, e.g. scripted input may not have a delta time)
+            input_recorder_dict["CurrentFrame"] = input_recorder_dict["Frames"][input_recorder_dict["FrameIndex"]]
+            input_recorder_dict["FrameIndex"] += 1
+            if input_recorder_dict["CurrentFrame"][0] != None:
+                delta_time = input_recorder_dict["CurrentFrame"][0]
+
+    return delta_time
+
+def key_get_pressed():
+
+    # Returns the keys held down (can be indexed with a key e.g. key_get_pressed()[pygame_K_a])
+    if input_recorder_dict["Mode"] == "Live":
+        return pygame_key_get_pressed()
+    return PressedKeys(pressed_keys = input_recorder_dict["CurrentFrame"][1])
+
+def mouse_get_pos():
+
+    # Returns the position of the mouse
+    if input_recorder_dict["Mode"] == "Live":
+        return pygame_mouse_get_pos()
+    return tuple(input_recorder_dict["CurrentFrame"][2])
+
+def mouse_get_pressed():
+
+    # Returns the mouse buttons held down (left, middle, right)
+    if input_recorder_dict["Mode"] == "Live":
+        return pygame_mouse_get_pressed()
+    return tuple(bool(button_pressed) for button_pressed in input_recorder_dict["CurrentFrame"][3])
+
+def event_get():
+
+    # Returns the events for this frame
+    if input_recorder_dict["Mode"] == "Live":
+        return pygame_event_get()
+
+    # When replaying, the pygame events are still removed from the queue (so that the queue does not fill up)
+    if input_recorder_dict["Mode"] == "Replay":
+        pygame_event_get()
+
+    # If the events of this frame have already been returned (e.g. if the game states controller is run multiple times in one frame with a fixed timestep)
+    if input_recorder_dict["EventsReturned"] == True:
+        return []
+    input_recorder_dict["EventsReturned"] = True
+
+    return [pygame_event_Event(event_type) if key == None else pygame_event_Event(event_type, key = key) for event_type, key in input_recorder_dict["CurrentFrame"][4]]
@@ -0,0 +1,104 @@
+from struct import Struct as struct_Struct
+from zlib import compress as zlib_compress
+from zlib import decompress as zlib_decompress
+
+from numpy import array as numpy_array
+from numpy import frombuffer as numpy_frombuffer
+from numpy import fromfile as numpy_fromfile
+
+""" Level format:
+- The tile maps of the levels are stored in a binary file, which is created from the text file of tile maps by convert_level_tile_maps.py
+- The file starts with a header (the file signature, the format version and the number of levels), followed by a table with an entry for each level, followed by the tile grid of each level
+- Each entry in the table holds the number of rows and columns of the tile map, the number of bytes per tile (1 = uint8, 2 = uint16), whether the tile grid is compressed (zlib) and where the tile grid is inside of the file
+- Loading a level only reads its entry in the table and its tile grid, which is turned into a NumPy array without parsing each tile
+- All numbers are stored in little-endian byte order
+"""
+
+# The paths of the text file of tile maps and the binary file of tile maps
+text_tile_maps_path = "Files/Level/level_tile_maps.txt"
+binary_tile_maps_path = "Files/Level/level_tile_maps.bin"
+
+# The header of the file (the file signature, the format version and the number of levels)
+file_signature = b"PWTM"
+format_version = 1
+header_struct = struct_Struct("<4sHH")
+
+# An entry in the table for each level (the number of rows, the number of columns, the number of bytes per tile, whether the tile grid is compressed, the position of the tile grid in the file and the size of the tile grid in bytes)
+level_entry_struct = struct_Struct("<HHBBII")
+
+# The NumPy data type for each number of bytes per tile (little-endian unsigned integers)
+tile_data_types_dict = {
+                        1: "<u1",
+                        2: "<u2",
+                        }
+
+def parse_text_tile_maps(file_path = text_tile_maps_path):
+
+    # Returns the tile map of each level inside of the text file, as a list of NumPy arrays
+    """ Note:
+    - Each line of the text file is a tile map, starting with a "?" separator
+    - Each tile number is followed by a "!" separator, and each row of tiles is followed by a "," separator
+    """
+    tile_maps_list = []
+
+    with open(file_path, "r") as level_tile_maps_file:
+        for tile_map in level_tile_maps_file.read().splitlines():
+
+            # Remove the "?" separator and the final "," separator, then split the tile map into rows and the rows into tile numbers
+            rows_list = tile_map.strip()[1:].rstrip(",").split(",")
+            tile_maps_list.append(numpy_array([row.rstrip("!").split("!") for row in rows_list], dtype = tile_data_types_dict[2]))
+
+    return tile_maps_list
+
+def write_binary_tile_maps(tile_maps_list, file_path = binary_tile_maps_path, compress = False):
+
+    # Writes the tile maps to the binary file (Each tile map is stored as uint8 if all of its tile numbers fit, otherwise as uint16)
+    tile_grids_list = []
+    level_entries_list = []
+
+    # The tile grids are stored after the header and the table
+    tile_grid_position = header_struct.size + (level_entry_struct.size * len(tile_maps_list))
+
+    for tile_map in tile_maps_list:
+        bytes_per_tile = 1 if tile_map.max() <= 255 else 2
+        tile_grid = tile_map.astype(tile_data_types_dict[bytes_per_tile]).tobytes()
+
+        if compress == True:
+            tile_grid = zlib_compress(tile_grid)
+
+        tile_grids_list.append(tile_grid)
+        level_entries_list.append(level_entry_struct.pack(tile_map.shape[0], tile_map.shape[1], bytes_per_tile, int(compress), tile_grid_position, len(tile_grid)))
+        tile_grid_position += len(tile_grid)
+
+    with open(file_path, "wb") as binary_tile_maps_file:
+        binary_tile_maps_file.write(header_struct.pack(file_signature, format_version, len(tile_maps_list)))
+        binary_tile_maps_file.write(b"".join(level_entries_list))
+        binary_tile_maps_file.write(b"".join(tile_grids_list))
+
+def read_binary_tile_map(level_number, file_path = binary_tile_maps_path):
+
+    # Returns the tile map of a level (starting from level 1) from the binary file, as a NumPy array of the tile numbers with a row for each row of tiles
+    with open(file_path, "rb") as binary_tile_maps_file:
+
+        signature, version, number_of_levels = header_struct.unpack(binary_tile_maps_file.read(header_struct.size))
+
+        # If this is not a binary tile maps file, or it was created with a different version of the format
+        if signature != file_signature or version != format_version:
+            raise ValueError(f"{file_path} is not a version {format_version} tile maps file, create it again with convert_level_tile_maps.py")
+
+        # If the level does not exist
+        if (1 <= level_number <= number_of_levels) == False:
+            raise ValueError(f"{file_path} does not have a level {level_number} (it has {number_of_levels} levels)")
+
+        # Read the level's entry in the table
+        binary_tile_maps_file.seek(header_struct.size + (level_entry_struct.size * (level_number - 1)))
+        rows, columns, bytes_per_tile, compressed, tile_grid_position, tile_grid_size = level_entry_struct.unpack(binary_tile_maps_file.read(level_entry_struct.size))
+
+        # Compressed tile grids are decompressed first, uncompressed tile grids are read straight into the array
+        binary_tile_maps_file.seek(tile_grid_position)
+        if compressed == 1:
+            tile_map = numpy_frombuffer(zlib_decompress(binary_tile_maps_file.read(tile_grid_size)), dtype = tile_data_types_dict[bytes_per_tile])
+        else:
+            tile_map = numpy_fromfile(binary_tile_maps_file, dtype = tile_data_types_dict[bytes_per_tile], count = rows * columns)
+
+    return tile_map.reshape((rows, columns))
@@ -0,0 +1,132 @@
+from Global.frame_profiler import profiler_sections, ring_buffer_columns, find_recent_frames
+from Global.dirty_rects import mark_dirty_rect
+
+from pygame import Surface as pygame_Surface
+from pygame import SRCALPHA as pygame_SRCALPHA
+from pygame import Rect as pygame_Rect
+from pygame.font import Font as pygame_font_Font
+from pygame.draw import rect as pygame_draw_rect
+from pygame.draw import line as pygame_draw_line
+from pygame.draw import lines as pygame_draw_lines
+
+class ProfilerOverlay:
+
+    # Draws the times of the most recent frames (from the frame profiler's ring buffer) as a stacked bar of the average time of each section, and a graph of the frame times
+
+    def __init__(self):
+
+        # The colour of each section
+        self.section_colours_dict = {
+                                    "Collisions": (230, 80, 80),
+                                    "AI": (240, 170, 60),
+                                    "Player": (90, 200, 90),
+                                    "UI": (80, 150, 240),
+                                    "ScalingAndBlit": (190, 100, 220),
+                                    "Other": (150, 150, 150)
+                                    }
+
+        # The font used for the text
+        self.font = pygame_font_Font("graphics/Fonts/effect_text_font.ttf", 14)
+
+        # The panel that everything is drawn onto (Semi-transparent so that the game can still be seen behind it)
+        self.panel_surface = pygame_Surface((420, 300), pygame_SRCALPHA)
+        self.panel_position = (10, 10)
+
+        # The frame time (in milliseconds) that the full width of the stacked bar and the height of the graph represent
+        self.frame_time_budget = 1000 / 60
+        self.graph_maximum_frame_time = 2 * self.frame_time_budget
+
+        # The rects of the stacked bar and the frame-time graph (relative to the panel)
+        self.stacked_bar_rect = pygame_Rect(10, 40, 400, 20)
+        self.graph_rect = pygame_Rect(10, 190, 400, 100)
+
+        # The text is only rendered again every few frames (so that the text is readable and so that the overlay is not expensive to draw)
+        self.text_refresh_frames = 30
+        self.frames_until_text_refresh = 0
+        self.text_surfaces_list = []
+
+    def refresh_text(self, average_times, maximum_times):
+
+        # Renders the text of the overlay (the frame rate, and the average and maximum time of each section)
+
+        # The average and maximum times of the frame
+        frame_column = ring_buffer_columns.index("Frame")
+        self.text_surfaces_list = [
+                                (self.font.render(f"Frame {average_times[frame_column]:.2f} ms avg, {maximum_times[frame_column]:.2f} ms max ({1000 / max(average_times[frame_column], 0.001):.0f} fps)", False, "white"), (10, 10)),
+                                ]
+
+        # The average and maximum times of each section (below the stacked bar, with the names and the times in separate columns)
+        for i, section in enumerate(profiler_sections):
+            section_column = ring_buffer_columns.index(section)
+            self.text_surfaces_list.append((self.font.render(section, False, self.section_colours_dict[section]), (10, 70 + (i * 18))))
+            self.text_surfaces_list.append((self.font.render(f"{average_times[section_column]:.2f} ms avg", False, self.section_colours_dict[section]), (150, 70 + (i * 18))))
+            self.text_surfaces_list.append((self.font.render(f"{maximum_times[section_column]:.2f} ms max", False, self.section_colours_dict[section]), (280, 70 + (i * 18))))
+
+    def draw(self, surface):
+
+        # Draws the overlay onto the surface
+
+        # The times of the most recent frames (in milliseconds)
+        recent_frames = find_recent_frames() * 1000
+
+        # Clear the panel
+        self.panel_surface.fill((0, 0, 0, 180))
+
+        # The region of the screen that the panel is drawn in has changed
+        mark_dirty_rect(rect = self.panel_surface.get_rect(topleft = self.panel_position))
+
+        # If no frames have been timed yet
+        if len(recent_frames) == 0:
+            surface.blit(self.panel_surface, self.panel_position)
+            return
+
+        average_times = recent_frames.mean(axis = 0)
+        maximum_times = recent_frames.max(axis = 0)
+
+        # Render the text again if enough frames have passed since the text was last rendered
+        self.frames_until_text_refresh -= 1
+        if self.frames_until_text_refresh <= 0:
+            self.refresh_text(average_times = average_times, maximum_times = maximum_times)
+            self.frames_until_text_refresh = self.text_refresh_frames
+
+        # ------------------------------------------------------------------------------
+        # Stacked bar
+
+        # Draw the average time of each section next to each other (the full width of the bar is the frame time budget)
+        x = self.stacked_bar_rect.x
+        for section in profiler_sections:
+            section_width = round((average_times[ring_buffer_columns.index(section)] / self.frame_time_budget) * self.stacked_bar_rect.width)
+            pygame_draw_rect(surface = self.panel_surface, color = self.section_colours_dict[section], rect = pygame_Rect(x, self.stacked_bar_rect.y, section_width, self.stacked_bar_rect.height), width = 0)
+            x += section_width
+
+        # Outline of the frame time budget
+        pygame_draw_rect(surface = self.panel_surface, color = "white", rect = self.stacked_bar_rect, width = 1)
+
+        # ------------------------------------------------------------------------------
+        # Frame-time graph
+
+        # Draw the frame time budget as a horizontal line
+        budget_y = self.graph_rect.bottom - round((self.frame_time_budget / self.graph_maximum_frame_time) * self.graph_rect.height)
+        pygame_draw_line(surface = self.panel_surface, color = (90, 90, 90), start_pos = (self.graph_rect.left, budget_y), end_pos = (self.graph_rect.right, budget_y), width = 1)
+
+        # Draw the frame times from the oldest frame (on the left) to the newest frame (on the right), limiting the frame times to the top of the graph
+        if len(recent_frames) > 1:
+            frame_column = ring_buffer_columns.index("Frame")
+            x_step = self.graph_rect.width / (len(recent_frames) - 1)
+            graph_points = [
+                            (self.graph_rect.left + (i * x_step), self.graph_rect.bottom - (min(frame_time / self.graph_maximum_frame_time, 1) * self.graph_rect.height))
+                            for i, frame_time in enumerate(recent_frames[:, frame_column])
+                            ]
+            pygame_draw_lines(surface = self.panel_surface, color = "white", closed = False, points = graph_points, width = 1)
+
+        # Outline of the graph
+        pygame_draw_rect(surface = self.panel_surface, color = (90, 90, 90), rect = self.graph_rect, width = 1)
+
+        # ------------------------------------------------------------------------------
+        # Text
+
+        for text_surface, text_position in self.text_surfaces_list:
+            self.panel_surface.blit(text_surface, text_position)
+
+        # Draw the panel onto the surface
+        surface.blit(self.panel_surface, self.panel_position)
@@ -9,4 +9,50 @@ TILE_SIZE = 16
 BAR_ALPHA_LEVEL = 200
 
 # The death animation duration for all bosses and the player (in milliseconds)
-FULL_DEATH_ANIMATION_DURATION = 800
\ No newline at end of file
+FULL_DEATH_ANIMATION_DURATION = 800
+
+# The maximum amount of memory (in bytes) that the cache of tinted images (created by change_image_colour) can use
+TINTED_IMAGES_CACHE_MEMORY_LIMIT = 8 * 1024 * 1024
+
+# The step that the colours of tinted images are rounded to (Higher values mean fewer unique tinted images are cached, at the cost of colour accuracy)
+TINTED_IMAGES_COLOUR_QUANTIZATION_STEP = 4
+
+# The step (in degrees) that the angles of rotated projectile images are rounded to (Must divide 360, lower values mean more accurate rotations at the cost of more cached images)
+PROJECTILE_ROTATION_ANGLE_STEP = 2
+
+# Fixed timestep simulation (When enabled, the game is updated in fixed steps of 1 / SIMULATION_TICK_RATE seconds instead of once per frame with a variable delta time)
+USE_FIXED_TIMESTEP = False
+SIMULATION_TICK_RATE = 120
+
+# The maximum number of fixed steps that can be performed in a single frame (Prevents the game from trying to catch up forever after a long frame e.g. when the window is being dragged)
+MAXIMUM_SIMULATION_STEPS_PER_FRAME = 5
+
+# The largest distance (in pixels, along either axis) that an object or the camera can move in a single fixed step and still be drawn between its previous and current positions (Larger movements e.g. teleports are drawn at the current position)
+INTERPOLATION_MAXIMUM_STEP_DISTANCE = 4 * TILE_SIZE
+
+# The number of recent frames that the frame profiler keeps the times of (shown by the profiler overlay)
+PROFILER_RING_BUFFER_LENGTH = 240
+
+# The number of spans that the trace exporter buffers before handing them to the thread that writes the trace file
+TRACE_EVENTS_BUFFER_LENGTH = 2048
+
+# How the scaled surface (which the level is drawn onto) is scaled up onto the screen every frame:
+# "Direct": Scaled straight into the screen (no new surface is created each frame, only available when the screen has the same pixel format as the scaled surface)
+# "Buffer": Scaled into a surface created once when the game is created, which is then drawn onto the screen
+SCALED_SURFACE_PRESENTATION_MODE = "Direct"
+
+# The proportion of the screen that the dirty rects (the regions of the screen that changed) can cover before the entire display is updated instead
+DIRTY_RECTS_FULL_UPDATE_PROPORTION = 0.4
+
+# The framerate of the menus when nothing is happening (i.e. no buttons are hovered over, no transition is running and there is no input)
+IDLE_FRAMERATE = 10
+
+# The number of threads that the asset manager uses to decode images and sounds
+ASSET_LOADING_THREADS = 4
+
+# The width of the sheets that the texture atlas packs images into (Sheets are made wider if an image is wider than this)
+TEXTURE_ATLAS_SHEET_WIDTH = 1024
+
+# The number of chunks around the camera's view and active objects (the player, the boss, building tiles and bamboo piles) that the tiles are created for, and the number of chunks away that they are removed
+TILE_CHUNKS_LOADING_MARGIN = 1
+TILE_CHUNKS_UNLOADING_MARGIN = 2
\ No newline at end of file
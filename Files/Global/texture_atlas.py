@@ -0,0 +1,118 @@
+from Global.settings import TEXTURE_ATLAS_SHEET_WIDTH
+
+from weakref import WeakKeyDictionary as weakref_WeakKeyDictionary
+
+from pygame import Surface as pygame_Surface
+from pygame import Rect as pygame_Rect
+from pygame import SRCALPHA as pygame_SRCALPHA
+from pygame import BLEND_RGBA_MAX as pygame_BLEND_RGBA_MAX
+
+""" Texture atlas:
+- Related images (e.g. all of the animation frames of a character, the images of a weapon or the images of the HUD) are packed into one shared sheet
+- Each packed image is replaced with a subsurface of the sheet, so the packed images can still be used anywhere an image is used (e.g. masks, tinting, get_width) without changing what uses them
+- The region of the sheet that each packed image is in can be looked up, so that images can be drawn straight from the sheet, and several images can be drawn with a single Surface.blits call
+- Only images with per-pixel alpha are packed (Opaque images, e.g. tiles, are left as they are because drawing them from an alpha sheet would be slower)
+"""
+
+# Dictionary holding the sheets and the regions of the packed images
+texture_atlas_dict = {
+                    # Format: {packed image: (sheet, region of the sheet)} (Weak keys so that the regions are removed with the images, e.g. when the game is restarted)
+                    "RegionsDict": weakref_WeakKeyDictionary(),
+
+                    # The number of sheets that have been created
+                    "NumberOfSheets": 0,
+                    }
+
+def find_packable_images(images, packable_images_list):
+
+    # Adds every image inside of the (nested) dictionaries, lists and tuples of images to the list (Each image is only added once)
+    if isinstance(images, dict):
+        for value in images.values():
+            find_packable_images(images = value, packable_images_list = packable_images_list)
+
+    elif isinstance(images, (list, tuple)):
+        for value in images:
+            find_packable_images(images = value, packable_images_list = packable_images_list)
+
+    # If this is an image with per-pixel alpha that has not been added already
+    elif isinstance(images, pygame_Surface) and images.get_flags() & pygame_SRCALPHA and images.get_parent() == None and all(images is not image for image in packable_images_list):
+        packable_images_list.append(images)
+
+def replace_packed_images(images, packed_images_dict):
+
+    # Returns the (nested) dictionaries, lists and tuples of images, with each packed image replaced by its subsurface of the sheet
+    if isinstance(images, dict):
+        return {key: replace_packed_images(images = value, packed_images_dict = packed_images_dict) for key, value in images.items()}
+
+    elif isinstance(images, list):
+        return [replace_packed_images(images = value, packed_images_dict = packed_images_dict) for value in images]
+
+    elif isinstance(images, tuple):
+        return tuple(replace_packed_images(images = value, packed_images_dict = packed_images_dict) for value in images)
+
+    return packed_images_dict.get(id(images), images)
+
+def pack_images(images):
+
+    # Packs the images inside of the (nested) dictionaries, lists and tuples of images into one sheet, returning the same dictionaries, lists and tuples with each packed image replaced by its subsurface of the sheet
+    """ Note: 
+    - The images are placed in rows ("shelves") from the tallest image to the shortest image, starting a new row once the current row is as wide as the sheet
+    - The images are copied into the sheet exactly (BLEND_RGBA_MAX onto a fully transparent sheet), so that the edges of the images are not blended with the empty sheet
+    """
+    packable_images_list = []
+    find_packable_images(images = images, packable_images_list = packable_images_list)
+
+    # If there are no images to pack
+    if len(packable_images_list) == 0:
+        return images
+
+    # The width of the sheet (Wider if an image is wider than the default sheet width)
+    sheet_width = max(TEXTURE_ATLAS_SHEET_WIDTH, max(image.get_width() for image in packable_images_list))
+
+    # Find the position of each image inside of the sheet
+    image_positions_list = []
+    x = 0
+    y = 0
+    row_height = 0
+    for image in sorted(packable_images_list, key = lambda image: image.get_height(), reverse = True):
+
+        # If the image does not fit in the current row, start a new row underneath it
+        if x + image.get_width() > sheet_width:
+            x = 0
+            y += row_height
+            row_height = 0
+
+        image_positions_list.append((image, (x, y)))
+        x += image.get_width()
+        row_height = max(row_height, image.get_height())
+
+    # Create the sheet (only as tall as the rows) and copy the images into it
+    sheet = pygame_Surface((sheet_width, y + row_height), pygame_SRCALPHA).convert_alpha()
+    sheet.fill((0, 0, 0, 0))
+    sheet.blits(((image, position, None, pygame_BLEND_RGBA_MAX) for image, position in image_positions_list), doreturn = False)
+    texture_atlas_dict["NumberOfSheets"] += 1
+
+    # Create the subsurface of each image and save its region of the sheet
+    packed_images_dict = {}
+    for image, position in image_positions_list:
+        region = pygame_Rect(position, image.get_size())
+        packed_image = sheet.subsurface(region)
+        texture_atlas_dict["RegionsDict"][packed_image] = (sheet, region)
+        packed_images_dict[id(image)] = packed_image
+
+    return replace_packed_images(images = images, packed_images_dict = packed_images_dict)
+
+def find_atlas_region(image):
+
+    # Returns the sheet and the region of the sheet that an image is drawn from (The image itself and None if the image has not been packed)
+    return texture_atlas_dict["RegionsDict"].get(image, (image, None))
+
+def blit_images(surface, blit_sequence):
+
+    # Draws each (image, position) in the sequence onto the surface with one Surface.blits call, drawing packed images straight from their sheet
+    blits_list = []
+    for image, position in blit_sequence:
+        sheet, region = find_atlas_region(image = image)
+        blits_list.append((sheet, position, region))
+
+    surface.blits(blits_list, doreturn = False)
@@ -0,0 +1,188 @@
+from Global.settings import TRACE_EVENTS_BUFFER_LENGTH
+
+from json import dumps as json_dumps
+from time import perf_counter
+from threading import Thread as threading_Thread
+from queue import Queue as queue_Queue
+from atexit import register as atexit_register
+
+""" Trace exporter:
+- Writes spans (the start time and duration of a method call) to a file in the Chrome trace event format, which can be opened in a trace viewer (e.g. Perfetto or chrome://tracing)
+- Spans are recorded for every frame (see begin_trace_frame / end_trace_frame), each update / draw of the level (Game.update / Game.draw), each collision handler of the objects collision detector and each boss's decide_action / run
+- When the game is updated in fixed steps, a frame can contain multiple (or no) Game.update spans, but only one Game.draw span
+- Spans called inside of other spans (e.g. a collision handler inside of a frame) are shown nested inside of them by the trace viewer
+- The spans are buffered and handed to a background thread in batches, which writes them to the file (so that the game does not wait on the file being written)
+"""
+
+# Dictionary holding the state of the trace exporter
+trace_exporter_dict = {
+                        "Enabled": False,
+                        "FilePath": None,
+
+                        # Format: [(owner, method_name, original_method)] (Used to restore the original methods when tracing is stopped)
+                        "OriginalMethods": [],
+
+                        # The time that tracing started (The timestamps of the spans are relative to this time)
+                        "StartTime": None,
+
+                        # The time that the current frame started
+                        "FrameStartTime": None,
+
+                        # The spans that have not been handed to the writing thread yet
+                        "EventsBuffer": [],
+
+                        # The queue of batches of spans to be written, and the thread that writes them
+                        "WritingQueue": None,
+                        "WritingThread": None,
+                        }
+
+def find_traced_methods():
+
+    # Returns the methods that are traced, and the category of each method (The category is shown in the trace viewer)
+    # Note: The imports are here so that the trace exporter can be imported by anything (without importing the entire level)
+    from Level.game import Game
+    from Level.Support.objects_collision_detector import ObjectCollisionDetector
+    from Level.Bosses.SikaDeerBoss import SikaDeerBoss
+    from Level.Bosses.GoldenMonkeyBoss import GoldenMonkeyBoss
+
+    return (
+            (Game, "update", "Level"),
+            (Game, "draw", "Level"),
+            (ObjectCollisionDetector, "handle_collisions", "Collisions"),
+            (ObjectCollisionDetector, "handle_bamboo_projectiles_collisions", "Collisions"),
+            (ObjectCollisionDetector, "handle_bamboo_piles_collisions", "Collisions"),
+            (ObjectCollisionDetector, "handle_stomp_attack_nodes_collisions", "Collisions"),
+            (ObjectCollisionDetector, "handle_chilli_projectiles_collisions", "Collisions"),
+            (ObjectCollisionDetector, "handle_dive_bomb_attack_circles_collisions", "Collisions"),
+            (ObjectCollisionDetector, "handle_charge_attack_collisions", "Collisions"),
+            (ObjectCollisionDetector, "handle_boss_collisions", "Collisions"),
+            (SikaDeerBoss, "decide_action", "AI"),
+            (SikaDeerBoss, "run", "AI"),
+            (GoldenMonkeyBoss, "decide_action", "AI"),
+            (GoldenMonkeyBoss, "run", "AI"),
+            )
+
+def create_traced_method(method, name, category):
+
+    # Returns a method that records a span for every call of the original method
+    def traced_method(*args, **kwargs):
+        start_time = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            record_span(name = name, category = category, start_time = start_time, end_time = perf_counter())
+
+    return traced_method
+
+def record_span(name, category, start_time, end_time):
+
+    # Adds a span to the buffer, handing the buffer to the writing thread once it is full
+    # Note: "X" is a complete event (a span with a start time and a duration), the timestamps are in microseconds
+    trace_exporter_dict["EventsBuffer"].append({
+                                                "name": name,
+                                                "cat": category,
+                                                "ph": "X",
+                                                "ts": (start_time - trace_exporter_dict["StartTime"]) * 1000000,
+                                                "dur": (end_time - start_time) * 1000000,
+                                                "pid": 0,
+                                                "tid": 0
+                                                })
+
+    if len(trace_exporter_dict["EventsBuffer"]) >= TRACE_EVENTS_BUFFER_LENGTH:
+        flush_events_buffer()
+
+def flush_events_buffer():
+
+    # Hands the buffered spans to the writing thread
+    if len(trace_exporter_dict["EventsBuffer"]) > 0:
+        trace_exporter_dict["WritingQueue"].put(trace_exporter_dict["EventsBuffer"])
+        trace_exporter_dict["EventsBuffer"] = []
+
+def write_trace_file(file_path, writing_queue):
+
+    # Writes batches of spans to the trace file until it receives None (Run on the writing thread)
+    """ Note: The file is written in the JSON array format of the Chrome trace event format, i.e. [{span}, {span}, ...]
+    - Trace viewers also accept the file without the closing bracket, so the trace can still be opened if the game crashes
+    """
+    with open(file_path, "w") as trace_file:
+        trace_file.write("[\n")
+        first_batch = True
+
+        while True:
+            # Wait for the next batch of spans
+            events = writing_queue.get()
+
+            # If tracing has stopped
+            if events == None:
+                break
+
+            # Write the spans (separated from the previous batch by a comma)
+            if first_batch == False:
+                trace_file.write(",\n")
+            trace_file.write(",\n".join(json_dumps(event, separators = (",", ":")) for event in events))
+            first_batch = False
+
+        trace_file.write("\n]\n")
+
+def start_tracing(file_path):
+
+    # Starts recording spans for the traced methods and writing them to the file
+
+    # If tracing has already started
+    if trace_exporter_dict["Enabled"] == True:
+        return
+
+    # Check that all of the traced methods exist before any are replaced (e.g. if a method has been renamed)
+    traced_methods = find_traced_methods()
+    missing_methods = [f"{owner.__name__}.{method_name}" for owner, method_name, category in traced_methods if hasattr(owner, method_name) == False]
+    if len(missing_methods) > 0:
+        raise AttributeError(f"The traced methods {missing_methods} do not exist")
+
+    trace_exporter_dict["FilePath"] = file_path
+    trace_exporter_dict["StartTime"] = perf_counter()
+    trace_exporter_dict["EventsBuffer"] = []
+
+    # Start the writing thread (A daemon thread so that it never keeps the program open)
+    trace_exporter_dict["WritingQueue"] = queue_Queue()
+    trace_exporter_dict["WritingThread"] = threading_Thread(target = write_trace_file, args = (file_path, trace_exporter_dict["WritingQueue"]), daemon = True)
+    trace_exporter_dict["WritingThread"].start()
+
+    for owner, method_name, category in traced_methods:
+        # Save the original method and replace it with the traced method
+        original_method = getattr(owner, method_name)
+        trace_exporter_dict["OriginalMethods"].append((owner, method_name, original_method))
+        setattr(owner, method_name, create_traced_method(method = original_method, name = f"{owner.__name__}.{method_name}", category = category))
+
+    trace_exporter_dict["Enabled"] = True
+
+    # Stop tracing when the program exits, so that the remaining spans are written (The program can be closed from multiple places e.g. the menus)
+    atexit_register(stop_tracing)
+
+def begin_trace_frame():
+
+    # Starts the span of a frame
+    trace_exporter_dict["FrameStartTime"] = perf_counter()
+
+def end_trace_frame():
+
+    # Records the span of the current frame
+    record_span(name = "Frame", category = "Frame", start_time = trace_exporter_dict["FrameStartTime"], end_time = perf_counter())
+
+def stop_tracing():
+
+    # Stops recording spans, restoring the original methods and waiting for all of the spans to be written
+
+    # If tracing has not started
+    if trace_exporter_dict["Enabled"] == False:
+        return
+
+    for owner, method_name, original_method in trace_exporter_dict["OriginalMethods"]:
+        setattr(owner, method_name, original_method)
+    trace_exporter_dict["OriginalMethods"] = []
+
+    # Hand the remaining spans to the writing thread, and tell it to finish writing the file
+    flush_events_buffer()
+    trace_exporter_dict["WritingQueue"].put(None)
+    trace_exporter_dict["WritingThread"].join()
+
+    trace_exporter_dict["Enabled"] = False
@@ -1,10 +1,11 @@
 from Global.generic import Generic
 from Global.settings import TILE_SIZE, FULL_DEATH_ANIMATION_DURATION
-from Global.functions import change_image_colour, change_image_colour_v2, sin_change_object_colour, update_generic_timer, simple_loop_animation, simple_play_animation_once
+from Global.functions import draw_text, change_image_colour, sin_change_object_colour, update_generic_timer, simple_loop_animation, simple_play_animation_once
+from Global.asset_manager import load_animation
+from Global.texture_atlas import blit_images
 
 from random import choice as random_choice
 from math import sin, cos, radians
-from os import listdir as os_listdir
 
 from Level.Bosses.AI import AI
 from Level.Objects.projectiles import ChilliProjectileController
@@ -16,7 +17,6 @@ from pygame import Surface as pygame_Surface
 from pygame.draw import circle as pygame_draw_circle
 from pygame.draw import ellipse as pygame_draw_ellipse
 from pygame.mask import from_surface as pygame_mask_from_surface
-from pygame.image import load as load_image
 from pygame.transform import scale as scale_image
 
 
@@ -365,6 +365,9 @@ class GoldenMonkeyBoss(Generic, AI):
                 # Set the current animation image
                 current_animation_image = self.behaviour_patterns_dict["Death"]["Images"][self.animation_index]
 
+        # Save the animation frame before any colour changes (used to find the silhouette and mask of the animation frame)
+        self.animation_frame = current_animation_image
+
         # If the boss is in its second phase
         if self.current_phase == 2 and self.current_action != "Death":
             # Change the colour of the boss to be its second phase colour
@@ -380,7 +383,7 @@ class GoldenMonkeyBoss(Generic, AI):
             """Note: This is because yellow is made up of red and green, so the colours must be reduced all the way down first to actually see the red (otherwise the only colour visible would be white
             and the default colours)
             """
-            current_animation_image = change_image_colour_v2(current_animation_image = current_animation_image, desired_colour = (0, 0, 0)) if self.current_action != "Death" else current_animation_image
+            current_animation_image = GoldenMonkeyBoss.SilhouettesDict[self.animation_frame] if self.current_action != "Death" else current_animation_image
 
             # Set the current animation image to be a flashed version of the current animation image (a white flash effect)
             current_animation_image = change_image_colour(current_animation_image = current_animation_image, desired_colour = desired_colour)
@@ -459,7 +462,7 @@ class GoldenMonkeyBoss(Generic, AI):
 
     def create_sleep_text(self):
         
-        # Creates sleep effect text when the boss is in the sleep state (effect text is always updated by the game UI)
+        # Creates sleep effect text when the boss is in the sleep state (effect text is always updated by the game UI, which only moves and fades the alpha surface)
 
         # If enough time has passed since the last sleep effect text was created and the current action is "Sleep"
         if self.sleep_effect_text_info_dict["CreationCooldownTimer"] == None and self.current_action == "Sleep":
@@ -473,6 +476,16 @@ class GoldenMonkeyBoss(Generic, AI):
             new_alpha_surface.set_colorkey("black")
             new_alpha_surface.set_alpha(self.sleep_effect_text_info_dict["DefaultAlphaLevel"])
 
+            # Draw the text onto the alpha surface once (The game UI does not draw the text of effect text again)
+            draw_text(
+                text = self.sleep_effect_text_info_dict["Text"],
+                text_colour = self.sleep_effect_text_info_dict["Colour"],
+                font = self.sleep_effect_text_info_dict["Font"],
+                x = 0,
+                y = 0,
+                surface = new_alpha_surface,
+                )
+
             # Create the effect text (Automatically added to the effect text group)
             EffectText(
                         x = text_position_x,
@@ -675,67 +688,71 @@ class GoldenMonkeyBoss(Generic, AI):
     # --------------------------
     # Additional
 
-    def update_and_draw_divebomb_circles(self, delta_time):
+    def update_divebomb_circles(self, delta_time):
 
-        # If the current dive bomb stage is "Target"
-        if self.behaviour_patterns_dict["DiveBomb"]["CurrentDiveBombStage"] == "Target":
-            
-            # Fill the dive bomb attack controller's alpha surface with black
-            self.dive_bomb_attack_controller.alpha_surface.fill("black")
-
-            # Draw the circles onto the alpha surface
-            # Note: The center 
-            pygame_draw_circle(
-                            surface = self.dive_bomb_attack_controller.alpha_surface, 
-                            color = (180, 0, 0), 
-                            center = (self.dive_bomb_attack_controller.maximum_circle_radius, self.dive_bomb_attack_controller.maximum_circle_radius), 
-                            radius = self.dive_bomb_attack_controller.maximum_circle_radius, 
-                            width = 0
-                            )
+        # Increase the radius of the smaller, growing circle and change the alpha level of the alpha surface
+        self.dive_bomb_attack_controller.change_visual_effects(
+                            proportional_time_remaining = self.behaviour_patterns_dict["DurationTimer"] / self.behaviour_patterns_dict["DiveBomb"]["Target"]["Duration"],
+                            delta_time = delta_time
+                                                                        )
 
-            pygame_draw_circle(
-                            surface = self.dive_bomb_attack_controller.alpha_surface, 
-                            color = (225, 0, 0), 
-                            center = (self.dive_bomb_attack_controller.maximum_circle_radius, self.dive_bomb_attack_controller.maximum_circle_radius), 
-                            radius = self.dive_bomb_attack_controller.growing_circle_radius, 
-                            width = 0
-                            )
-                            
-            pygame_draw_circle(
-                            surface = self.dive_bomb_attack_controller.alpha_surface, 
-                            color = (255, 0, 0), 
-                            center = (self.dive_bomb_attack_controller.maximum_circle_radius, self.dive_bomb_attack_controller.maximum_circle_radius), 
-                            radius = min(0, self.dive_bomb_attack_controller.growing_circle_radius - 20),
-                            width = 0
-                            )
+    def draw_divebomb_circles(self):
 
-            # Blit the center of the alpha surface at the landing position (Which would be the center of the player)
-            self.surface.blit(
-                            self.dive_bomb_attack_controller.alpha_surface, 
-                            (
-                            (self.dive_bomb_attack_controller.landing_position[0] - self.dive_bomb_attack_controller.maximum_circle_radius) - self.camera_position[0],
-                            (self.dive_bomb_attack_controller.landing_position[1] - self.dive_bomb_attack_controller.maximum_circle_radius)  - self.camera_position[1]
-                            )
-                            )
+        # Fill the dive bomb attack controller's alpha surface with black
+        self.dive_bomb_attack_controller.alpha_surface.fill("black")
 
-            # Increase the radius of the smaller, growing circle and change the alpha level of the alpha surface
-            self.dive_bomb_attack_controller.change_visual_effects(
-                                proportional_time_remaining = self.behaviour_patterns_dict["DurationTimer"] / self.behaviour_patterns_dict["DiveBomb"]["Target"]["Duration"],
-                                delta_time = delta_time
-                                                                            )
-
-            # Outline
-            pygame_draw_circle(
-                            surface = self.surface, 
-                            color = (0, 0, 0), 
-                            center = (self.dive_bomb_attack_controller.landing_position[0] - self.camera_position[0], self.dive_bomb_attack_controller.landing_position[1] - self.camera_position[1]), 
-                            radius = self.dive_bomb_attack_controller.maximum_circle_radius, 
-                            width = 3
-                            )
+        # Draw the circles onto the alpha surface
+        # Note: The center 
+        pygame_draw_circle(
+                        surface = self.dive_bomb_attack_controller.alpha_surface, 
+                        color = (180, 0, 0), 
+                        center = (self.dive_bomb_attack_controller.maximum_circle_radius, self.dive_bomb_attack_controller.maximum_circle_radius), 
+                        radius = self.dive_bomb_attack_controller.maximum_circle_radius, 
+                        width = 0
+                        )
+
+        pygame_draw_circle(
+                        surface = self.dive_bomb_attack_controller.alpha_surface, 
+                        color = (225, 0, 0), 
+                        center = (self.dive_bomb_attack_controller.maximum_circle_radius, self.dive_bomb_attack_controller.maximum_circle_radius), 
+                        radius = self.dive_bomb_attack_controller.growing_circle_radius, 
+                        width = 0
+                        )
+                        
+        pygame_draw_circle(
+                        surface = self.dive_bomb_attack_controller.alpha_surface, 
+                        color = (255, 0, 0), 
+                        center = (self.dive_bomb_attack_controller.maximum_circle_radius, self.dive_bomb_attack_controller.maximum_circle_radius), 
+                        radius = min(0, self.dive_bomb_attack_controller.growing_circle_radius - 20),
+                        width = 0
+                        )
+
+        # Blit the center of the alpha surface at the landing position (Which would be the center of the player)
+        self.surface.blit(
+                        self.dive_bomb_attack_controller.alpha_surface, 
+                        (
+                        (self.dive_bomb_attack_controller.landing_position[0] - self.dive_bomb_attack_controller.maximum_circle_radius) - self.camera_position[0],
+                        (self.dive_bomb_attack_controller.landing_position[1] - self.dive_bomb_attack_controller.maximum_circle_radius)  - self.camera_position[1]
+                        )
+                        )
+
+        # Outline
+        pygame_draw_circle(
+                        surface = self.surface, 
+                        color = (0, 0, 0), 
+                        center = (self.dive_bomb_attack_controller.landing_position[0] - self.camera_position[0], self.dive_bomb_attack_controller.landing_position[1] - self.camera_position[1]), 
+                        radius = self.dive_bomb_attack_controller.maximum_circle_radius, 
+                        width = 3
+                        )
+
+        # self.dive_bomb_attack_controller.draw(surface= self.surface, x = self.dive_bomb_attack_controller.rect.x - self.camera_position[0], y = self.dive_bomb_attack_controller.rect.y - self.camera_position[1])
+
+    def update_shockwave_circles(self, delta_time):
 
-            # self.dive_bomb_attack_controller.draw(surface= self.surface, x = self.dive_bomb_attack_controller.rect.x - self.camera_position[0], y = self.dive_bomb_attack_controller.rect.y - self.camera_position[1])
+        # Change the alpha level and size of the shockwave circles
+        self.dive_bomb_attack_controller.change_shockwave_circles_visual_effect(delta_time = delta_time)
     
-    def draw_shockwave_circles(self, delta_time):
+    def draw_shockwave_circles(self):
         
         # Draws the shockwave circles
     
@@ -775,11 +792,37 @@ class GoldenMonkeyBoss(Generic, AI):
                         (self.dive_bomb_attack_controller.rect.centery - (self.dive_bomb_attack_controller.shockwave_circle_alpha_surface_size[1] / 2))  - self.camera_position[1]
                         ),
                         )
-    
-        # Change the alpha level and size of the shockwave circles
-        self.dive_bomb_attack_controller.change_shockwave_circles_visual_effect(delta_time = delta_time)
 
-    def update_and_draw_second_phase_circles(self, delta_time):
+    def update_second_phase_circles(self, delta_time):
+
+        # If all three circles have not been drawn yet, and the inner circle of the last circle is less than the maximum radius
+        if self.second_phase_circles_dict["CircleCounterIndex"] < 3 and (self.second_phase_circles_dict["CurrentRadiusList"][self.second_phase_circles_dict["CircleCounterIndex"] ]) < self.second_phase_circles_dict["MaximumRadius"]:
+            # Increase the radius of the shockwave circle
+            self.second_phase_circles_dict["CurrentRadiusList"][self.second_phase_circles_dict["CircleCounterIndex"]] += self.second_phase_circles_dict["RadiusTimeGradient"] * delta_time
+
+        # If the current alpha level of the main alpha surface is greater than 0
+        if self.second_phase_circles_dict["CurrentAlphaLevel"] > 0:
+            # Decrease the alpha level of the shockwave circle alpha surface
+            self.second_phase_circles_dict["CurrentAlphaLevel"] = max(0, self.second_phase_circles_dict["CurrentAlphaLevel"] + (self.second_phase_circles_dict["AlphaLevelTimeGradient"] * delta_time))
+            self.second_phase_circles_dict["AlphaSurface"].set_alpha(self.second_phase_circles_dict["CurrentAlphaLevel"])
+
+        # If e.g. the first circle has finished growing to the maximum radius and all 3 circles have not been drawn yet
+        if self.second_phase_circles_dict["CurrentRadiusList"][self.second_phase_circles_dict["CircleCounterIndex"]] > self.second_phase_circles_dict["MaximumRadius"] \
+            and self.second_phase_circles_dict["CircleCounterIndex"] < 2:
+
+            # Reset the alpha level of the surface back to its default values for the next circles
+            self.second_phase_circles_dict["CurrentAlphaLevel"] = self.second_phase_circles_dict["StartingAlphaLevel"]
+            self.second_phase_circles_dict["AlphaSurface"].set_alpha(self.second_phase_circles_dict["CurrentAlphaLevel"])
+
+            # Increment the number of circles already drawn
+            self.second_phase_circles_dict["CircleCounterIndex"] += 1
+
+        # If 3 circles have been drawn and the alpha level of tbe alpha surface is less than or equal to 0
+        if self.second_phase_circles_dict["CircleCounterIndex"] == 2 and self.second_phase_circles_dict["CurrentAlphaLevel"] <= 0:
+            # Delete the second phase circles dictionary
+            del self.second_phase_circles_dict
+
+    def draw_second_phase_circles(self):
 
         # Fill the alpha surface with black
         self.second_phase_circles_dict["AlphaSurface"].fill("black")
@@ -813,12 +856,6 @@ class GoldenMonkeyBoss(Generic, AI):
                         radius = self.second_phase_circles_dict["CurrentRadiusList"][self.second_phase_circles_dict["CircleCounterIndex"]] * 0.2, 
                         width = 0
                         )
-        
-        # If all three circles have not been drawn yet, and the inner circle of the last circle is less than the maximum radius
-        if self.second_phase_circles_dict["CircleCounterIndex"] < 3 and (self.second_phase_circles_dict["CurrentRadiusList"][self.second_phase_circles_dict["CircleCounterIndex"] ]) < self.second_phase_circles_dict["MaximumRadius"]:
-            # Increase the radius of the shockwave circle
-            self.second_phase_circles_dict["CurrentRadiusList"][self.second_phase_circles_dict["CircleCounterIndex"]] += self.second_phase_circles_dict["RadiusTimeGradient"] * delta_time
-
 
         # ---------------------------------------------------------------------------------------------
         # Alpha surfaces    
@@ -836,28 +873,6 @@ class GoldenMonkeyBoss(Generic, AI):
                         self.second_phase_circles_dict["BlitPosition"]
                         )
 
-        # If the current alpha level of the main alpha surface is greater than 0
-        if self.second_phase_circles_dict["CurrentAlphaLevel"] > 0:
-            # Decrease the alpha level of the shockwave circle alpha surface
-            self.second_phase_circles_dict["CurrentAlphaLevel"] = max(0, self.second_phase_circles_dict["CurrentAlphaLevel"] + (self.second_phase_circles_dict["AlphaLevelTimeGradient"] * delta_time))
-            self.second_phase_circles_dict["AlphaSurface"].set_alpha(self.second_phase_circles_dict["CurrentAlphaLevel"])
-
-        # If e.g. the first circle has finished growing to the maximum radius and all 3 circles have not been drawn yet
-        if self.second_phase_circles_dict["CurrentRadiusList"][self.second_phase_circles_dict["CircleCounterIndex"]] > self.second_phase_circles_dict["MaximumRadius"] \
-            and self.second_phase_circles_dict["CircleCounterIndex"] < 2:
-
-            # Reset the alpha level of the surface back to its default values for the next circles
-            self.second_phase_circles_dict["CurrentAlphaLevel"] = self.second_phase_circles_dict["StartingAlphaLevel"]
-            self.second_phase_circles_dict["AlphaSurface"].set_alpha(self.second_phase_circles_dict["CurrentAlphaLevel"])
-
-            # Increment the number of circles already drawn
-            self.second_phase_circles_dict["CircleCounterIndex"] += 1
-
-        # If 3 circles have been drawn and the alpha level of tbe alpha surface is less than or equal to 0
-        if self.second_phase_circles_dict["CircleCounterIndex"] == 2 and self.second_phase_circles_dict["CurrentAlphaLevel"] <= 0:
-            # Delete the second phase circles dictionary
-            del self.second_phase_circles_dict
-
     # ----------------------------------------------------------------------------------
     # Timer updating
 
@@ -1086,22 +1101,8 @@ class GoldenMonkeyBoss(Generic, AI):
     
     def run(self):
 
-        # Always update / move / draw the chilli projectiles
-        self.chilli_projectile_controller.update_chilli_projectiles(
-                                                                    delta_time = self.delta_time,
-                                                                    camera_position = self.camera_position,
-                                                                    surface = self.surface
-                                                                    )
-
-        # If the boss is not alive
-        if self.current_action == "Death":
-            # Draw a shadow ellipse underneath the boss
-            pygame_draw_ellipse(
-                surface = self.surface, 
-                color = (20, 20, 20), 
-                rect = ((self.rect.centerx - self.camera_position[0]) - 20, 
-                ((self.rect.centery + 20) - self.camera_position[1]) - 20, 40, 40), 
-                width = 0)
+        # Always update / move the chilli projectiles
+        self.chilli_projectile_controller.update_chilli_projectiles(delta_time = self.delta_time)
 
         # If the boss has spawned and the camera panning has been completed
         if self.extra_information_dict["CanStartOperating"] == True:
@@ -1127,20 +1128,21 @@ class GoldenMonkeyBoss(Generic, AI):
                     self.current_action = "Death"
 
                     # Load and scale the death animation images 
-                    self.behaviour_patterns_dict["Death"]["Images"] = [scale_image(
-                        load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha(), ((load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_width() * 2, load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_height() * 2)))  
-                        for i in range(0, len(os_listdir("graphics/Misc/DeathAnimation")))]
+                    self.behaviour_patterns_dict["Death"]["Images"] = [scale_image(death_animation_image, (death_animation_image.get_width() * 2, death_animation_image.get_height() * 2)) for death_animation_image in load_animation(directory = "graphics/Misc/DeathAnimation")]
 
                     # Set up the animation speed and timer
                     self.behaviour_patterns_dict["Death"]["FullAnimationDuration"] = FULL_DEATH_ANIMATION_DURATION
                     self.behaviour_patterns_dict["Death"]["TimeBetweenAnimFrames"] = self.behaviour_patterns_dict["Death"]["FullAnimationDuration"] / len(self.behaviour_patterns_dict["Death"]["Images"])
                     self.behaviour_patterns_dict["Death"]["AnimationFrameTimer"] = self.behaviour_patterns_dict["Death"]["TimeBetweenAnimFrames"]
 
+                    # Create the mask of each death animation frame (for pixel-perfect collisions)
+                    self.behaviour_patterns_dict["Death"]["MasksDict"] = {death_animation_frame: pygame_mask_from_surface(death_animation_frame) for death_animation_frame in self.behaviour_patterns_dict["Death"]["Images"]}
+
             # Play animations
             self.play_animations()
 
-            # Create / update a mask for pixel - perfect collisions
-            self.mask = pygame_mask_from_surface(self.image)
+            # Update the mask for pixel - perfect collisions to be the mask of the current animation frame
+            self.mask = GoldenMonkeyBoss.MasksDict[self.animation_frame] if self.current_action != "Death" else self.behaviour_patterns_dict["Death"]["MasksDict"][self.animation_frame]
 
             # If the boss is alive
             if self.extra_information_dict["CurrentHealth"] > 0:
@@ -1192,8 +1194,8 @@ class GoldenMonkeyBoss(Generic, AI):
                     # If there is a dictionary called "second_phase_circles_dict"
                     # Note: This is because once the effect is complete, the dictionary is deleted
                     if hasattr(self, "second_phase_circles_dict") == True:
-                        # Update and draw the second phase circles
-                        self.update_and_draw_second_phase_circles(delta_time = self.delta_time)
+                        # Update the second phase circles
+                        self.update_second_phase_circles(delta_time = self.delta_time)
 
                 # Update the duration timers
                 self.update_duration_timers()
@@ -1214,16 +1216,44 @@ class GoldenMonkeyBoss(Generic, AI):
                     # Update the sleep effect text timer
                     self.update_sleep_effect_text_timer()
 
+    def draw_boss(self):
+
+        # Draws the boss, the chilli projectiles and the second phase circles (The boss is updated in run)
+
+        # Draw the chilli projectiles
+        self.chilli_projectile_controller.draw_chilli_projectiles(camera_position = self.camera_position, surface = self.surface)
+
+        # If the boss is not alive
+        if self.current_action == "Death":
+            # Draw a shadow ellipse underneath the boss
+            pygame_draw_ellipse(
+                surface = self.surface, 
+                color = (20, 20, 20), 
+                rect = ((self.rect.centerx - self.camera_position[0]) - 20, 
+                ((self.rect.centery + 20) - self.camera_position[1]) - 20, 40, 40), 
+                width = 0)
+
+        # If the boss is alive, chasing the player and the second phase circles effect has not been completed
+        # Note: The same conditions as when the second phase circles are updated
+        if self.extra_information_dict["CurrentHealth"] > 0 and self.current_action == "Chase" and hasattr(self, "second_phase_circles_dict") == True:
+            # Draw the second phase circles
+            self.draw_second_phase_circles()
+
         # Draw the boss 
         """ Notes: 
         - Additional positions to center the image (this is because the animation images can vary in size)
         - This is down here because the chilli projectiles should be drawn under the boss 
         """
-        self.draw(
+        blit_images(
             surface = self.surface, 
-            x = (self.rect.x - ((self.image.get_width() / 2)  - (self.rect.width / 2))) - self.camera_position[0], 
-            y = (self.rect.y - ((self.image.get_height() / 2) - (self.rect.height / 2))) - self.camera_position[1]
-                )
+            blit_sequence = ((
+                            self.image, 
+                            (
+                            (self.rect.x - ((self.image.get_width() / 2)  - (self.rect.width / 2))) - self.camera_position[0], 
+                            (self.rect.y - ((self.image.get_height() / 2) - (self.rect.height / 2))) - self.camera_position[1]
+                            )
+                            ),)
+                    )
 
         # # TEMPORARY
         # pygame_draw_rect(self.surface, "green", (self.rect.x - self.camera_position[0], self.rect.y - self.camera_position[1], self.rect.width, self.rect.height), 1)
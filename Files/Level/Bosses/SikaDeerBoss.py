@@ -1,19 +1,19 @@
 from Global.generic import Generic
 from Global.functions import change_image_colour, simple_loop_animation, simple_play_animation_once
 from Global.settings import TILE_SIZE, FULL_DEATH_ANIMATION_DURATION
+from Global.asset_manager import load_animation
+from Global.texture_atlas import blit_images
 
 from Level.Objects.projectiles import StompController
 from Level.Bosses.AI import AI
 
 from math import degrees, cos, sin
-from os import listdir as os_listdir
 from random import choice as random_choice
 
 from pygame import Rect as pygame_Rect
 from pygame.draw import circle as pygame_draw_circle
 from pygame.mask import from_surface as pygame_mask_from_surface
 
-from pygame.image import load as load_image
 from pygame.transform import scale as scale_image
 from pygame.draw import ellipse as pygame_draw_ellipse
 
@@ -275,6 +275,9 @@ class SikaDeerBoss(Generic, AI):
                 current_animation_image = current_animation_list[self.animation_index]
 
 
+        # Save the animation frame before any colour changes (used to find the mask of the animation frame)
+        self.animation_frame = current_animation_image
+
         # If the boss has been damaged (red and white version)
         if self.extra_information_dict["DamagedFlashEffectTimer"] != None:
 
@@ -501,65 +504,63 @@ class SikaDeerBoss(Generic, AI):
     # ----------------------------------------------------------------------------------
     # Gameplay
 
-    def update_and_draw_stomp_attacks(self):
+    def update_stomp_attacks(self):
         
-        # If there are any stomp attack nodes inside the stomp nodes
-        if len(StompController.nodes_group) > 0:
-
-            # For each stomp attack in the group
-            for stomp_attack_node in StompController.nodes_group:
-                
-                # ---------------------------------------------------------------------------
-                # Drawing the stomp attack node
-                
-                # ---------------------------------
-                # Assigning the colours
+        # For each stomp attack in the group
+        for stomp_attack_node in StompController.nodes_group:
 
-                # If the stomp attack node has not been reflected
-                if stomp_attack_node.reflected == False:
-                    
-                    # Set the circle colours to be the default colours
-                    circle_colours = ((111, 26, 182), (61, 23, 102), ((255, 0, 50)))
-
-                # If the stomp attack node has not been reflected
-                elif stomp_attack_node.reflected == True:
-                    
-                     # Set the circle colours to be the reflected colours
-                    circle_colours = (
-                        (min(111 + stomp_attack_node.reflected_additive_colour[1], 255), 26, 182), 
-                        (min(61 + stomp_attack_node.reflected_additive_colour[1], 255), 23, 102), 
-                        (min(255 + stomp_attack_node.reflected_additive_colour[1], 255), 0, 50)
-                        ) 
+            # If the stomp attack node has been reflected
+            if stomp_attack_node.reflected == True:
+                # Change the value of the reflected colour
+                stomp_attack_node.change_reflected_colour_value(delta_time = self.delta_time)
 
-                    # Change the value of the reflected colour
-                    stomp_attack_node.change_reflected_colour_value(delta_time = self.delta_time)
+            # Move the stomp attack node
+            stomp_attack_node.move(delta_time = self.delta_time)
 
-                # ---------------------------------
-                # Drawing the circles
+            # If the current radius of the stomp attack node is less than the maximum node radius set
+            if stomp_attack_node.radius < self.stomp_controller.maximum_node_radius:
+                # Increase the radius of the current rect
+                stomp_attack_node.increase_size(delta_time = self.delta_time)
 
-                # First circle (Lightest colour)
-                pygame_draw_circle(surface = self.surface, color = circle_colours[0], center = (stomp_attack_node.rect.centerx - self.camera_position[0], stomp_attack_node.rect.centery - self.camera_position[1]), radius = stomp_attack_node.radius, width = 0)
+    def draw_stomp_attacks(self):
+        
+        # For each stomp attack in the group
+        for stomp_attack_node in StompController.nodes_group:
+            
+            # ---------------------------------
+            # Assigning the colours
 
-                # Outline (Darkest colour)
-                pygame_draw_circle(surface = self.surface, color = 	circle_colours[1], center = (stomp_attack_node.rect.centerx - self.camera_position[0], stomp_attack_node.rect.centery - self.camera_position[1]), radius = stomp_attack_node.radius, width = int(stomp_attack_node.radius / 3))
+            # If the stomp attack node has not been reflected
+            if stomp_attack_node.reflected == False:
+                
+                # Set the circle colours to be the default colours
+                circle_colours = ((111, 26, 182), (61, 23, 102), ((255, 0, 50)))
 
-                # Second circle (Middle colour)
-                pygame_draw_circle(surface = self.surface, color = circle_colours[2], center = (stomp_attack_node.rect.centerx - self.camera_position[0], stomp_attack_node.rect.centery - self.camera_position[1]), radius = stomp_attack_node.radius * (0.45), width = 0)
+            # If the stomp attack node has not been reflected
+            elif stomp_attack_node.reflected == True:
                 
+                # Set the circle colours to be the reflected colours
+                circle_colours = (
+                    (min(111 + stomp_attack_node.reflected_additive_colour[1], 255), 26, 182), 
+                    (min(61 + stomp_attack_node.reflected_additive_colour[1], 255), 23, 102), 
+                    (min(255 + stomp_attack_node.reflected_additive_colour[1], 255), 0, 50)
+                    ) 
 
-                # # The center of the rectangle is at the position calculated when the node was created
-                # pygame_draw_rect(surface = self.surface, color = "red", rect = (stomp_attack_node.rect.x - self.camera_position[0], stomp_attack_node.rect.y - self.camera_position[1], stomp_attack_node.rect.width, stomp_attack_node.rect.height), width = 1)
+            # ---------------------------------
+            # Drawing the circles
 
-                # ---------------------------------------------------------------------------
-                # Other
+            # First circle (Lightest colour)
+            pygame_draw_circle(surface = self.surface, color = circle_colours[0], center = (stomp_attack_node.rect.centerx - self.camera_position[0], stomp_attack_node.rect.centery - self.camera_position[1]), radius = stomp_attack_node.radius, width = 0)
 
-                # Move the stomp attack node
-                stomp_attack_node.move(delta_time = self.delta_time)
+            # Outline (Darkest colour)
+            pygame_draw_circle(surface = self.surface, color = 	circle_colours[1], center = (stomp_attack_node.rect.centerx - self.camera_position[0], stomp_attack_node.rect.centery - self.camera_position[1]), radius = stomp_attack_node.radius, width = int(stomp_attack_node.radius / 3))
 
-                # If the current radius of the stomp attack node is less than the maximum node radius set
-                if stomp_attack_node.radius < self.stomp_controller.maximum_node_radius:
-                    # Increase the radius of the current rect
-                    stomp_attack_node.increase_size(delta_time = self.delta_time)
+            # Second circle (Middle colour)
+            pygame_draw_circle(surface = self.surface, color = circle_colours[2], center = (stomp_attack_node.rect.centerx - self.camera_position[0], stomp_attack_node.rect.centery - self.camera_position[1]), radius = stomp_attack_node.radius * (0.45), width = 0)
+            
+
+            # # The center of the rectangle is at the position calculated when the node was created
+            # pygame_draw_rect(surface = self.surface, color = "red", rect = (stomp_attack_node.rect.x - self.camera_position[0], stomp_attack_node.rect.y - self.camera_position[1], stomp_attack_node.rect.width, stomp_attack_node.rect.height), width = 1)
 
     def stomp_attack(self):
 
@@ -632,30 +633,8 @@ class SikaDeerBoss(Generic, AI):
 
     def run(self):
         
-        # Update and draw the stomp attacks (always do this so that even when the boss is dead, these are still updated)
-        self.update_and_draw_stomp_attacks()
-
-        # If the boss is not alive
-        if self.current_action == "Death":
-            # Draw a shadow ellipse underneath the boss
-            pygame_draw_ellipse(
-                surface = self.surface, 
-                color = (20, 20, 20), 
-                rect = ((self.rect.centerx - self.camera_position[0]) - 20, 
-                ((self.rect.centery + 20) - self.camera_position[1]) - 20, 40, 40), 
-                width = 0)
-
-        # Draw the boss 
-        # Note: Additional positions to center the image (this is because the animation images can vary in size)
-        self.draw(
-            surface = self.surface, 
-            x = (self.rect.x - ((self.image.get_width() / 2)  - (self.rect.width / 2))) - self.camera_position[0], 
-            y = (self.rect.y - ((self.image.get_height() / 2) - (self.rect.height / 2))) - self.camera_position[1]
-                )
-
-        # pygame_draw_rect(self.surface, "green", pygame_Rect(self.rect.x - self.camera_position[0], self.rect.y - self.camera_position[1], self.rect.width, self.rect.height), 1)
-        # pygame_draw_line(self.surface, "white", (0 - self.camera_position[0], self.rect.centery - self.camera_position[1]), (self.surface.get_width() - self.camera_position[0], self.rect.centery - self.camera_position[1]))
-        # pygame_draw_line(self.surface, "white", (self.rect.centerx - self.camera_position[0], 0 - self.camera_position[1]), (self.rect.centerx - self.camera_position[0], self.surface.get_height() - self.camera_position[1]))
+        # Update the stomp attacks (always do this so that even when the boss is dead, these are still updated)
+        self.update_stomp_attacks()
 
         # If the boss has spawned and the camera panning has been completed
         if self.extra_information_dict["CanStartOperating"] == True:
@@ -678,20 +657,21 @@ class SikaDeerBoss(Generic, AI):
                     self.current_action = "Death"
 
                     # Load and scale the death animation images 
-                    self.behaviour_patterns_dict["Death"]["Images"] = [scale_image(
-                        load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha(), ((load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_width() * 2, load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_height() * 2)))  
-                        for i in range(0, len(os_listdir("graphics/Misc/DeathAnimation")))]
+                    self.behaviour_patterns_dict["Death"]["Images"] = [scale_image(death_animation_image, (death_animation_image.get_width() * 2, death_animation_image.get_height() * 2)) for death_animation_image in load_animation(directory = "graphics/Misc/DeathAnimation")]
 
                     # Set up the animation speed and timer
                     self.behaviour_patterns_dict["Death"]["FullAnimationDuration"] = FULL_DEATH_ANIMATION_DURATION
                     self.behaviour_patterns_dict["Death"]["TimeBetweenAnimFrames"] = self.behaviour_patterns_dict["Death"]["FullAnimationDuration"] / len(self.behaviour_patterns_dict["Death"]["Images"])
                     self.behaviour_patterns_dict["Death"]["AnimationFrameTimer"] = self.behaviour_patterns_dict["Death"]["TimeBetweenAnimFrames"]
 
+                    # Create the mask of each death animation frame (for pixel-perfect collisions)
+                    self.behaviour_patterns_dict["Death"]["MasksDict"] = {death_animation_frame: pygame_mask_from_surface(death_animation_frame) for death_animation_frame in self.behaviour_patterns_dict["Death"]["Images"]}
+
             # Play animations
             self.play_animations()
 
-            # Create / update a mask for pixel - perfect collisions
-            self.mask = pygame_mask_from_surface(self.image)
+            # Update the mask for pixel - perfect collisions to be the mask of the current animation frame
+            self.mask = SikaDeerBoss.MasksDict[self.animation_frame] if self.current_action != "Death" else self.behaviour_patterns_dict["Death"]["MasksDict"][self.animation_frame]
 
             # Only if the boss is alive, should the timers be updated
             if self.extra_information_dict["CurrentHealth"] > 0:
@@ -711,4 +691,38 @@ class SikaDeerBoss(Generic, AI):
 
                 # # TEMPORARY
                 # for tile in self.neighbouring_tiles_dict.keys():
-                #     pygame_draw_rect(self.surface, "white", (tile.rect.x - self.camera_position[0], tile.rect.y - self.camera_position[1], tile.rect.width, tile.rect.height))
\ No newline at end of file
+                #     pygame_draw_rect(self.surface, "white", (tile.rect.x - self.camera_position[0], tile.rect.y - self.camera_position[1], tile.rect.width, tile.rect.height))
+
+    def draw_boss(self):
+
+        # Draws the boss and the stomp attacks (The boss is updated in run)
+
+        # Draw the stomp attacks
+        self.draw_stomp_attacks()
+
+        # If the boss is not alive
+        if self.current_action == "Death":
+            # Draw a shadow ellipse underneath the boss
+            pygame_draw_ellipse(
+                surface = self.surface, 
+                color = (20, 20, 20), 
+                rect = ((self.rect.centerx - self.camera_position[0]) - 20, 
+                ((self.rect.centery + 20) - self.camera_position[1]) - 20, 40, 40), 
+                width = 0)
+
+        # Draw the boss 
+        # Note: Additional positions to center the image (this is because the animation images can vary in size)
+        blit_images(
+            surface = self.surface, 
+            blit_sequence = ((
+                            self.image, 
+                            (
+                            (self.rect.x - ((self.image.get_width() / 2)  - (self.rect.width / 2))) - self.camera_position[0], 
+                            (self.rect.y - ((self.image.get_height() / 2) - (self.rect.height / 2))) - self.camera_position[1]
+                            )
+                            ),)
+                    )
+
+        # pygame_draw_rect(self.surface, "green", pygame_Rect(self.rect.x - self.camera_position[0], self.rect.y - self.camera_position[1], self.rect.width, self.rect.height), 1)
+        # pygame_draw_line(self.surface, "white", (0 - self.camera_position[0], self.rect.centery - self.camera_position[1]), (self.surface.get_width() - self.camera_position[0], self.rect.centery - self.camera_position[1]))
+        # pygame_draw_line(self.surface, "white", (self.rect.centerx - self.camera_position[0], 0 - self.camera_position[1]), (self.rect.centerx - self.camera_position[0], self.surface.get_height() - self.camera_position[1]))
\ No newline at end of file
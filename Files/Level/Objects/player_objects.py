@@ -7,5 +7,5 @@ class BuildingTile(WorldTile):
         # Inherit from the world tile class, which has basic attributes and methods. (Inherits from Generic and pygame.sprite.Sprite)
         WorldTile.__init__(self, x = x, y = y, image = image)
         
-        # Tiles can get hit a maximum of 2 times before disappearing
+        # Tiles can get hit a maximum of 2 times before disappearing (The lives that the tile has left are held by the tile registry once it has been placed)
         self.lives = 2
\ No newline at end of file
@@ -1,14 +1,14 @@
 from Global.generic import Generic
 from Global.settings import TILE_SIZE
+from Global.collision_shapes import find_collision_shape
+from Global.asset_manager import load_image
+from Global.functions import find_rotated_image
 
 from math import sin, cos, degrees, radians, pi
 from random import randrange as random_randrange
 
-from pygame.image import load as pygame_image_load
-from pygame.transform import rotozoom as pygame_transform_rotozoom
 from pygame.sprite import Sprite as pygame_sprite_Sprite
 from pygame import Rect as pygame_Rect
-from pygame.image import load as load_image
 from pygame.transform import scale as scale_image
 from pygame.transform import scale as pygame_transform_scale
 from pygame.mask import from_surface as pygame_mask_from_surface
@@ -67,7 +67,7 @@ class ChilliProjectileController:
                                     damage_amount = ChilliProjectileController.base_damage,
                                     )
 
-    def update_chilli_projectiles(self, delta_time, camera_position, surface):
+    def update_chilli_projectiles(self, delta_time):
         
         # For each chilli projectile
         for chilli_projectile in ChilliProjectileController.projectiles_dict.keys():
@@ -78,6 +78,11 @@ class ChilliProjectileController:
             # Move the projectile
             chilli_projectile.move_projectile()
 
+    def draw_chilli_projectiles(self, camera_position, surface):
+
+        # For each chilli projectile
+        for chilli_projectile in ChilliProjectileController.projectiles_dict.keys():
+
             # Draw the projectile
             chilli_projectile.draw(
                                 surface = surface,
@@ -176,7 +181,7 @@ class StompController:
 
 class DiveBombAttackController(Generic):
 
-    divebomb_circle_image = pygame_image_load("graphics/Projectiles/DiveBombCircle.png")
+    divebomb_circle_image = load_image(path = "graphics/Projectiles/DiveBombCircle.png", conversion = None)
 
     def __init__(self, x, y, damage_amount, knockback_multiplier):
 
@@ -255,8 +260,11 @@ class DiveBombAttackController(Generic):
         # How impactful the knockback is
         self.knockback_multiplier = knockback_multiplier
         
-        # Create / update a mask for pixel - perfect collisions
-        self.mask = pygame_mask_from_surface(self.image)
+        # Find the collision shape and mask of the divebomb circle (The circle will use a circle collision test instead of a pixel-perfect collision)
+        self.collision_shape, self.mask = find_collision_shape(image = self.image)
+
+        # The radius of the divebomb circle (for circle collisions)
+        self.radius = self.image.get_width() // 2
 
     def reset_divebomb_attributes(self):
 
@@ -325,8 +333,9 @@ class DefaultProjectile(Generic):
     - Projectile damage amount
     - The dictionary / group that the projectile should be added to
     - Projectile image
+    - Projectile collision shape and mask
     """
-    def __init__(self, x, y, angle, damage_amount, projectile_dict, projectile_image, time_to_travel_distance_at_final_velocity, desired_distance_travelled):
+    def __init__(self, x, y, angle, damage_amount, projectile_dict, projectile_image, projectile_collision_shape, projectile_mask, time_to_travel_distance_at_final_velocity, desired_distance_travelled):
 
         # --------------------------------------------------------------------------------
         # Movement
@@ -348,6 +357,10 @@ class DefaultProjectile(Generic):
         # Inherit from the Generic class, which has basic attributes and methods. (Inherits from Generic and pygame.sprite.Sprite)
         Generic.__init__(self, x = x, y = y, image = projectile_image)
 
+        # The collision shape and mask of the projectile (These are created with the rotated projectile image, so that the mask is not created whenever the projectile is checked for pixel-perfect collisions)
+        self.collision_shape = projectile_collision_shape
+        self.mask = projectile_mask
+
         # -------------------------------------------------------------------------------
         # Positioning
 
@@ -395,10 +408,10 @@ class DefaultProjectile(Generic):
 class BambooProjectile(DefaultProjectile):
     
     # Projectile image of all bamboo projectiles that come from the Bamboo AR and will spawn out of the bamboo launcher projectile
-    projectile_image = pygame_image_load("graphics/Projectiles/BambooProjectile.png")
+    projectile_image = load_image(path = "graphics/Projectiles/BambooProjectile.png", conversion = None)
     
     # Projectile image of the initial projectile shot from the bamboo launcher
-    launcher_projectile_image = pygame_image_load("graphics/Projectiles/BambooLauncherProjectile.png")
+    launcher_projectile_image = load_image(path = "graphics/Projectiles/BambooLauncherProjectile.png", conversion = None)
 
     # Time to cover the distance travelled
     time_to_travel_distance_at_final_velocity = 0.25
@@ -409,6 +422,9 @@ class BambooProjectile(DefaultProjectile):
     # Projectile image scale
     projectile_image_scale = 1
 
+    # Dictionary holding the rotated images of the bamboo projectiles, created when the game is created (Format: {"Default": rotated_images_dict, "Launcher": rotated_images_dict})
+    RotatedImagesDict = {}
+
     def __init__(self, x, y, angle, damage_amount, projectile_dict, is_frenzy_mode_projectile, is_bamboo_launcher_projectile):
 
         # --------------------------------------------------------------------------------
@@ -433,13 +449,13 @@ class BambooProjectile(DefaultProjectile):
         """
         # If this was not shot from the bamboo launcher
         if is_bamboo_launcher_projectile == False:
-            self.original_image = pygame_transform_rotozoom(surface = BambooProjectile.projectile_image.convert_alpha(), angle = degrees(angle), scale = 1)
+            self.original_image, collision_shape, mask = find_rotated_image(rotated_images_dict = BambooProjectile.RotatedImagesDict["Default"], angle = angle)
             # The amount of lives it has against other projectiles
             self.lives = 2
 
         # If this was shot from the bamboo launcehr
         elif is_bamboo_launcher_projectile == True:
-            self.original_image = pygame_transform_rotozoom(surface = BambooProjectile.launcher_projectile_image.convert_alpha(), angle = degrees(angle), scale = 1)
+            self.original_image, collision_shape, mask = find_rotated_image(rotated_images_dict = BambooProjectile.RotatedImagesDict["Launcher"], angle = angle)
             # The amount of lives it has against other projectiles
             self.lives = 4
 
@@ -453,7 +469,9 @@ class BambooProjectile(DefaultProjectile):
                                     projectile_dict = projectile_dict,
                                     time_to_travel_distance_at_final_velocity = time_to_travel_distance_at_final_velocity,
                                     desired_distance_travelled = BambooProjectile.desired_distance_travelled,
-                                    projectile_image = self.original_image
+                                    projectile_image = self.original_image,
+                                    projectile_collision_shape = collision_shape,
+                                    projectile_mask = mask
                                     )
 
         # --------------------------------------------------------------------------------
@@ -468,7 +486,7 @@ class BambooProjectile(DefaultProjectile):
 class ChilliProjectile(DefaultProjectile):
 
     # Image for all chillis
-    chilli_image = pygame_image_load("graphics/Projectiles/ChilliProjectile.png")
+    chilli_image = load_image(path = "graphics/Projectiles/ChilliProjectile.png", conversion = None)
 
     # Default time to cover the distance travelled
     time_to_travel_distance_at_final_velocity = 0.22
@@ -479,10 +497,13 @@ class ChilliProjectile(DefaultProjectile):
     # Projectile image scale
     projectile_image_scale = 1.25
 
+    # Dictionary holding the rotated images of the chilli projectiles, created when the game is created
+    RotatedImagesDict = {}
+
     def __init__(self, x, y, angle, damage_amount):
 
         # The original image of the chilli projectile
-        self.original_image = pygame_transform_rotozoom(surface = ChilliProjectile.chilli_image.convert_alpha(), angle = degrees(angle), scale = ChilliProjectile.projectile_image_scale)
+        self.original_image, collision_shape, mask = find_rotated_image(rotated_images_dict = ChilliProjectile.RotatedImagesDict, angle = angle)
 
         # Inherit from the DefaultProjectile class
         DefaultProjectile.__init__(
@@ -494,13 +515,18 @@ class ChilliProjectile(DefaultProjectile):
                                     projectile_dict = ChilliProjectileController.projectiles_dict,
                                     time_to_travel_distance_at_final_velocity = ChilliProjectile.time_to_travel_distance_at_final_velocity,
                                     desired_distance_travelled = ChilliProjectile.desired_distance_travelled,
-                                    projectile_image = self.original_image
+                                    projectile_image = self.original_image,
+                                    projectile_collision_shape = collision_shape,
+                                    projectile_mask = mask
                                     )
 
 class StompNode(pygame_sprite_Sprite):
 
     # This image is only used for masks
-    base_image = load_image("graphics/BossAttacks/StompAttack.png")
+    base_image = load_image(path = "graphics/BossAttacks/StompAttack.png", conversion = None)
+
+    # The collision shape of all stomp nodes (If the base image is a circle, an analytic circle collision test is used with the radius of the stomp node)
+    collision_shape = find_collision_shape(image = base_image)[0]
 
     def __init__(self, x, y, radius, maximum_radius, angle):
 
@@ -549,8 +575,9 @@ class StompNode(pygame_sprite_Sprite):
         # ------------------------------------------------------------------------------
         # Other
 
-        # Image used for mask collision
+        # Image and mask used for mask collision (Only used if the collision shape of the stomp nodes is not a circle)
         self.image = scale_image(StompNode.base_image.convert_alpha(), (radius * 2, radius * 2))
+        self.mask = pygame_mask_from_surface(self.image)
 
         # The radius of the stomp node
         self.radius = radius
@@ -612,6 +639,9 @@ class StompNode(pygame_sprite_Sprite):
         # Rescale to be the diameter of the image
         self.image = scale_image(StompNode.base_image, (self.radius * 2, self.radius * 2))
 
+        # Update the mask for pixel-perfect collision
+        self.mask = pygame_mask_from_surface(self.image)
+
     def change_reflected_colour_value(self, delta_time):
         
         # Changes the colour value of the reflected additive colour over time
@@ -1,21 +1,34 @@
 from Global.generic import Generic
 from Global.settings import TILE_SIZE
+from Global.collision_shapes import find_collision_shape
+from Global.asset_manager import load_image
 
-from pygame.image import load as pygame_image_load
 
 # -------------------------------------------------------------------------------
 
 class WorldTile(Generic):
+
+    # Dictionary holding the collision shape and mask of each tile image, so that each tile image is only analysed once
+    # Note: Format: {image: (collision_shape, mask)}
+    collision_shapes_dict = {}
+
     def __init__(self, x, y, image):
 
         # Inherit from the Generic class, which has basic attributes and methods.
         Generic.__init__(self, x = x, y = y, image = image)
 
+        # If this tile image has not been analysed yet, find its collision shape (Fully opaque tiles will be "Rect", so no pixel-perfect collisions are required)
+        if image not in WorldTile.collision_shapes_dict:
+            WorldTile.collision_shapes_dict[image] = find_collision_shape(image = image)
+
+        # Set the collision shape and mask of the tile
+        self.collision_shape, self.mask = WorldTile.collision_shapes_dict[image]
+
 
 class BambooPile(Generic):
 
     # Bamboo pile image
-    pile_image = pygame_image_load("graphics/Misc/BambooPile.png")
+    pile_image = load_image(path = "graphics/Misc/BambooPile.png", conversion = None)
     
     # Dictionary containing information relating to bamboo piles
     bamboo_pile_info_dict = {
@@ -2,11 +2,15 @@ from Global.generic import Generic
 from Global.functions import change_image_colour
 from Global.functions import sin_change_object_colour
 from Global.settings import TILE_SIZE, screen_height, screen_width, FULL_DEATH_ANIMATION_DURATION
+from Global.input_recorder import key_get_pressed as input_key_get_pressed
+from Global.input_recorder import mouse_get_pressed as input_mouse_get_pressed
+from Global.input_recorder import mouse_get_pos as input_mouse_get_pos
+from Global.asset_manager import load_image, load_animation, flip_animation
+from Global.texture_atlas import pack_images, blit_images
 
 from Level.Objects.player_objects import BuildingTile
 from Level.Objects.projectiles import BambooProjectile
 
-from os import listdir as os_list_dir
 from random import choice as random_choice
 from math import degrees, sin, cos, atan2, pi, dist, radians
 
@@ -16,14 +20,10 @@ from pygame import K_s as pygame_K_s
 from pygame import K_d as pygame_K_d
 from pygame import K_r as pygame_K_r
 from pygame import K_SPACE as pygame_K_SPACE
-from pygame.key import get_pressed as pygame_key_get_pressed
 
-from pygame.image import load as pygame_image_load
 from pygame.transform import flip as pygame_transform_flip
 from pygame.sprite import Sprite as pygame_sprite_Sprite
 from pygame import Rect as pygame_Rect
-from pygame.mouse import get_pressed as pygame_mouse_get_pressed
-from pygame.mouse import get_pos as pygame_mouse_get_pos
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import circle as pygame_draw_circle
 from pygame.mask import from_surface as pygame_mask_from_surface
@@ -172,18 +172,25 @@ class Player(Generic):
                                          }
 
 
+        # The images of the weapons, format: {weapon: {file name: image}}
+        # Note: Each file is only loaded once, the images used for the other directions (and the icon images) are flipped from / the same as the loaded images
+        weapon_images_dict = {
+                            weapon: {file_name: load_image(path = f"graphics/Weapons/{weapon}/{file_name}.png") for file_name in ("Right", "Up", "UpRight", "DownRight")}
+                            for weapon in ("BambooAR", "BambooLauncher")
+                            }
+
         # A dictionary containing the tools and information relating to those tools
         self.tools  =  {
                         "BuildingTool": {
                                         "Images": { 
-                                            "IconImage": pygame_image_load("graphics/Weapons/BuildingTool/IconImage.png").convert_alpha(),
-                                            "Up": pygame_image_load("graphics/Weapons/BuildingTool/Default.png").convert_alpha(),
-                                            "TileImage": pygame_image_load("graphics/Weapons/BuildingTool/BuildingTile.png").convert()
+                                            "IconImage": load_image(path = "graphics/Weapons/BuildingTool/IconImage.png"),
+                                            "Up": load_image(path = "graphics/Weapons/BuildingTool/Default.png"),
+                                            "TileImage": load_image(path = "graphics/Weapons/BuildingTool/BuildingTile.png", conversion = "Opaque")
                                                   },
                                         "MaximumBuildingTileHP": 100,
                                         "MaximumPlacingAndRemovingDistance": 7 * TILE_SIZE , #25 * TILE_SIZE, #7 * TILE_SIZE,
                                         "MinimumPlacingDistance": 1.5 * TILE_SIZE,
-                                        "ExistingBuildingTilesList": [],
+                                        "ExistingBuildingTilesDict": {}, # (Replaced with the building tiles dict of the tile registry when the tile map is created)
                                         "MaximumNumberOfTilesAtOneTime": 5,
 
                                         # Timers
@@ -197,15 +204,15 @@ class Player(Generic):
 
                         "BambooAssaultRifle": { 
                             "Images" : {
-                                "IconImage": pygame_image_load("graphics/Weapons/BambooAR/UpRight.png").convert_alpha(),
-                                "Left": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooAR/Right.png").convert_alpha(), flip_x = True, flip_y = False),
-                                "Right": pygame_image_load("graphics/Weapons/BambooAR/Right.png").convert_alpha(),
-                                "Up": pygame_image_load("graphics/Weapons/BambooAR/Up.png").convert_alpha(),
-                                "Up Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooAR/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),"UpLeft": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooAR/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                "Up Right": pygame_image_load("graphics/Weapons/BambooAR/UpRight.png").convert_alpha(),
-                                "Down": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooAR/Up.png").convert_alpha(), flip_x = False, flip_y = True),
-                                "Down Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooAR/DownRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                "Down Right": pygame_image_load("graphics/Weapons/BambooAR/DownRight.png").convert_alpha()
+                                "IconImage": weapon_images_dict["BambooAR"]["UpRight"],
+                                "Left": pygame_transform_flip(surface = weapon_images_dict["BambooAR"]["Right"], flip_x = True, flip_y = False),
+                                "Right": weapon_images_dict["BambooAR"]["Right"],
+                                "Up": weapon_images_dict["BambooAR"]["Up"],
+                                "Up Left": pygame_transform_flip(surface = weapon_images_dict["BambooAR"]["UpRight"], flip_x = True, flip_y = False),"UpLeft": pygame_transform_flip(surface = weapon_images_dict["BambooAR"]["UpRight"], flip_x = True, flip_y = False),
+                                "Up Right": weapon_images_dict["BambooAR"]["UpRight"],
+                                "Down": pygame_transform_flip(surface = weapon_images_dict["BambooAR"]["Up"], flip_x = False, flip_y = True),
+                                "Down Left": pygame_transform_flip(surface = weapon_images_dict["BambooAR"]["DownRight"], flip_x = True, flip_y = False),
+                                "Down Right": weapon_images_dict["BambooAR"]["DownRight"]
                                         },
                             "ShootingCooldown": 125,
                             "ShootingCooldownTimer": None, # 150 so that the player starts off being unable to shoot (after pressing the play button)
@@ -216,15 +223,15 @@ class Player(Generic):
                     
                         "BambooLauncher": {
                                             "Images": {
-                                                "IconImage": pygame_image_load("graphics/Weapons/BambooLauncher/DownRight.png").convert_alpha(),
-                                                "Left": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooLauncher/Right.png").convert_alpha(), flip_x = True, flip_y = False),
-                                                "Right": pygame_image_load("graphics/Weapons/BambooLauncher/Right.png").convert_alpha(),
-                                                "Up": pygame_image_load("graphics/Weapons/BambooLauncher/Up.png").convert_alpha(),
-                                                "Up Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooLauncher/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),"UpLeft": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooLauncher/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                                "Up Right": pygame_image_load("graphics/Weapons/BambooLauncher/UpRight.png").convert_alpha(),
-                                                "Down": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooLauncher/Up.png").convert_alpha(), flip_x = False, flip_y = True),
-                                                "Down Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooLauncher/DownRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                                "Down Right": pygame_image_load("graphics/Weapons/BambooLauncher/DownRight.png").convert_alpha()
+                                                "IconImage": weapon_images_dict["BambooLauncher"]["DownRight"],
+                                                "Left": pygame_transform_flip(surface = weapon_images_dict["BambooLauncher"]["Right"], flip_x = True, flip_y = False),
+                                                "Right": weapon_images_dict["BambooLauncher"]["Right"],
+                                                "Up": weapon_images_dict["BambooLauncher"]["Up"],
+                                                "Up Left": pygame_transform_flip(surface = weapon_images_dict["BambooLauncher"]["UpRight"], flip_x = True, flip_y = False),"UpLeft": pygame_transform_flip(surface = weapon_images_dict["BambooLauncher"]["UpRight"], flip_x = True, flip_y = False),
+                                                "Up Right": weapon_images_dict["BambooLauncher"]["UpRight"],
+                                                "Down": pygame_transform_flip(surface = weapon_images_dict["BambooLauncher"]["Up"], flip_x = False, flip_y = True),
+                                                "Down Left": pygame_transform_flip(surface = weapon_images_dict["BambooLauncher"]["DownRight"], flip_x = True, flip_y = False),
+                                                "Down Right": weapon_images_dict["BambooLauncher"]["DownRight"]
                                                       },
                                             "ShootingCooldown": 700, 
                                             "ShootingCooldownTimer": None,
@@ -236,6 +243,10 @@ class Player(Generic):
 
                         }
 
+        # Pack the images of each tool into their own texture atlas sheet
+        for tool in self.tools.values():
+            tool["Images"] = pack_images(images = tool["Images"])
+
     # ---------------------------------------------------------------------------------
     # Animations
 
@@ -297,40 +308,60 @@ class Player(Generic):
         self.player_direction = ["Down"]
         self.current_look_direction = "Down"
 
+        # The animations that are also used (flipped) for the opposite direction
+        # Note: Each directory is only loaded once, the frames for the opposite direction are flipped from the loaded frames
+        idle_right_animation = load_animation(directory = "graphics/Player/Normal/Idle/Right")
+        idle_up_right_animation = load_animation(directory = "graphics/Player/Normal/Idle/UpRight")
+        idle_down_right_animation = load_animation(directory = "graphics/Player/Normal/Idle/DownRight")
+        run_body_right_animation = load_animation(directory = "graphics/Player/Normal/Run/Body/Right")
+        run_head_right_animation = load_animation(directory = "graphics/Player/Normal/Run/Head/Right")
+        run_head_up_right_animation = load_animation(directory = "graphics/Player/Normal/Run/Head/UpRight")
+        run_head_down_right_animation = load_animation(directory = "graphics/Player/Normal/Run/Head/DownRight")
+
         # A dictionary that will hold all of the animations
         self.animations_dict = {"Normal": {
         "Idle": {
-            "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Idle/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Right")))),
-            "Right": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/Right/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Right")))),
-            "Up": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/Up/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Up")))),
-            "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Idle/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Idle/UpRight")))),
-            "Up Right": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/UpRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/UpRight")))),
-            "Down": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/Down/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Down")))),
-            "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Idle/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Idle/DownRight")))),
-            "Down Right": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/DownRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Downright")))),
+            "Left": flip_animation(animation = idle_right_animation, flip_x = True),
+            "Right": idle_right_animation,
+            "Up": load_animation(directory = "graphics/Player/Normal/Idle/Up"),
+            "Up Left": flip_animation(animation = idle_up_right_animation, flip_x = True),
+            "Up Right": idle_up_right_animation,
+            "Down": load_animation(directory = "graphics/Player/Normal/Idle/Down"),
+            "Down Left": flip_animation(animation = idle_down_right_animation, flip_x = True),
+            "Down Right": idle_down_right_animation,
                 },
     
         "Run": {
-            "Left": tuple(pygame_transform_flip(surface = pygame_image_load( f"graphics/Player/Normal/Run/Body/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Right")))),
-            "Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Body/Right/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Right")))),
-            "Up": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Body/Up/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Up")))),
-            "Down": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Body/Down/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Down")))),
+            "Left": flip_animation(animation = run_body_right_animation, flip_x = True),
+            "Right": run_body_right_animation,
+            "Up": load_animation(directory = "graphics/Player/Normal/Run/Body/Up"),
+            "Down": load_animation(directory = "graphics/Player/Normal/Run/Body/Down"),
                }
                                          }
                                }
 
         self.head_dict = {"Normal": {
-            "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Run/Head/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Right")))),
-            "Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/Right/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Right")))),   
-            "Up": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/Up/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Up")))),
-            "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Run/Head/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/UpRight")))),
-            "Up Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/UpRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/UpRight")))),
-            "Down": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/Down/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Down")))),
-            "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Run/Head/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/DownRight")))),
-            "Down Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/DownRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/DownRight")))),   
+            "Left": flip_animation(animation = run_head_right_animation, flip_x = True),
+            "Right": run_head_right_animation,   
+            "Up": load_animation(directory = "graphics/Player/Normal/Run/Head/Up"),
+            "Up Left": flip_animation(animation = run_head_up_right_animation, flip_x = True),
+            "Up Right": run_head_up_right_animation,
+            "Down": load_animation(directory = "graphics/Player/Normal/Run/Head/Down"),
+            "Down Left": flip_animation(animation = run_head_down_right_animation, flip_x = True),
+            "Down Right": run_head_down_right_animation,   
                                     }
                         }
 
+        # Pack all of the player's animation frames into one texture atlas sheet
+        self.animations_dict, self.head_dict = pack_images(images = (self.animations_dict, self.head_dict))
+
+        # A dictionary that will hold the mask of each animation frame (for pixel-perfect collisions), so that the masks do not need to be created every frame
+        # Note: The key is the animation frame and the value is its mask
+        self.masks_dict = {
+                        animation_frame: pygame_mask_from_surface(animation_frame) 
+                        for animation_state in self.animations_dict["Normal"].values() for animation_frames in animation_state.values() for animation_frame in animation_frames
+                          }
+
         # Create attributes used for the animations
         self.animation_index = 0 # Tracks which animation frame to show
         self.animation_frame_counter = 0 # Used to track how much time has passed since the last frame update
@@ -348,7 +379,7 @@ class Player(Generic):
         if self.player_gameplay_info_dict["CanStartOperating"] == True:
 
             # If the player is moving left, right, up or down
-            if pygame_key_get_pressed()[pygame_K_a] or pygame_key_get_pressed()[pygame_K_d] or pygame_key_get_pressed()[pygame_K_w] or pygame_key_get_pressed()[pygame_K_s]:
+            if input_key_get_pressed()[pygame_K_a] or input_key_get_pressed()[pygame_K_d] or input_key_get_pressed()[pygame_K_w] or input_key_get_pressed()[pygame_K_s]:
 
                 """ 
                 Play the idle animation:
@@ -404,7 +435,7 @@ class Player(Generic):
                         self.animation_index = 0
 
             # If the player has stopped running left or right
-            elif pygame_key_get_pressed()[pygame_K_a] == False and pygame_key_get_pressed()[pygame_K_d] == False and pygame_key_get_pressed()[pygame_K_w] == False and pygame_key_get_pressed()[pygame_K_s] == False:
+            elif input_key_get_pressed()[pygame_K_a] == False and input_key_get_pressed()[pygame_K_d] == False and input_key_get_pressed()[pygame_K_w] == False and input_key_get_pressed()[pygame_K_s] == False:
 
                 # If the current animation state has not been set to "Idle" yet
                 if self.current_animation_state != "Idle":
@@ -563,6 +594,9 @@ class Player(Generic):
             # ---------------------------------------------------------------------------------
             # Set the image to be this animation frame
 
+            # Save the animation frame before any colour changes (used to find the mask of the animation frame)
+            self.animation_frame = current_animation_image
+
             # If the player has been damaged
             if self.player_gameplay_info_dict["DamagedFlashEffectTimer"] != None:
                 # Set the current animation image to be a flashed version of the current animation image (a white flash effect)
@@ -643,8 +677,40 @@ class Player(Generic):
 
                         # Reset the animation frame counter
                         self.animation_frame_counter = 0
+
         # ---------------------------------------------------------------------------------
-        # Draw the player onto the main screen
+        # If the current animation state is "Idle"
+        if self.current_animation_state == "Idle":
+
+            # If the player is pressing the left mouse button
+            if input_mouse_get_pressed()[0] == True or self.player_gameplay_info_dict["CanStartOperating"] == False:
+                """ There is an error where the animation index is not reset when switching to this "shooting idle" animation. 
+                Therefore, if the animation index + 1 is greater than the number of frames in the current animation list, the animation index should be reset.
+
+                - The second check is so that the player can move their character around whilst the camera is panning.
+                """
+                if (self.animation_index + 1) > len(self.animations_dict[self.current_player_element]["Idle"][self.current_look_direction]):
+                    # Reset the animation index
+                    self.animation_index = 0
+
+                # ------------------------------------------------------------------------------------------------------------
+                # Updating the player direction so that the player will point to that direction once the player stops shooting
+
+                # Count the number of capital letters inside the string
+                capital_letter_count = sum(map(str.isupper, self.current_look_direction))
+
+                # If there is only 1 capital letter, then current direction is one direction e.g. Right
+                if capital_letter_count == 1:
+                    self.player_direction = [self.current_look_direction]
+
+                # If there are 2 capital letters, then the current direction is two directions e.g Up Left
+                elif capital_letter_count == 2:
+                    # Set the player direction into a list consisting of the two directions the player is facing. E.g. ["Up", "Left"]
+                    self.player_direction = self.current_look_direction.split()
+
+    def draw_player(self):
+
+        # Draws the player onto the main screen (The animation frame is updated in play_animations)
 
         """
         - The camera position must be subtracted so that the image is drawn within the limits of the screen.
@@ -683,8 +749,6 @@ class Player(Generic):
             # Temporary variable for the position that the torso should be drawn at
             torso_position = ((self.rect.centerx - self.camera_position[0]) - int(self.image.get_width() / 2), (self.rect.midbottom[1] - self.image.get_height() - self.camera_position[1]))
 
-            # Draw the torso at the bottom of the player rect
-            self.draw(surface = self.surface, x = torso_position[0], y = torso_position[1])
 
             # Adjusting the head image depending on the direction the player is looking towards
             # Note: This is because for some directions, the head may be placed too high or too low
@@ -699,38 +763,17 @@ class Player(Generic):
                 case _ if self.current_look_direction == "Left" or self.current_look_direction == "Right":
                     head_adjustment_y = 0
             
-            # Draw the head on top the torso
-            self.surface.blit(head_image, ((self.rect.centerx - self.camera_position[0]) - int(head_image.get_width()/ 2), head_adjustment_y + torso_position[1] - head_image.get_height()))
+            # Draw the torso at the bottom of the player rect and the head on top the torso (with one call)
+            blit_images(
+                        surface = self.surface, 
+                        blit_sequence = (
+                                        (self.image, torso_position),
+                                        (head_image, ((self.rect.centerx - self.camera_position[0]) - int(head_image.get_width()/ 2), head_adjustment_y + torso_position[1] - head_image.get_height()))
+                                        )
+                        )
 
-        # If the current animation state is "Idle" and the player is pressing the left mouse button
+        # If the current animation state is "Idle"
         elif self.current_animation_state == "Idle":
-
-            # If the player is pressing the left mouse button
-            if pygame_mouse_get_pressed()[0] == True or self.player_gameplay_info_dict["CanStartOperating"] == False:
-                """ There is an error where the animation index is not reset when switching to this "shooting idle" animation. 
-                Therefore, if the animation index + 1 is greater than the number of frames in the current animation list, the animation index should be reset.
-
-                - The second check is so that the player can move their character around whilst the camera is panning.
-                """
-                if (self.animation_index + 1) > len(self.animations_dict[self.current_player_element]["Idle"][self.current_look_direction]):
-                    # Reset the animation index
-                    self.animation_index = 0
-
-                # ------------------------------------------------------------------------------------------------------------
-                # Updating the player direction so that the player will point to that direction once the player stops shooting
-
-                # Count the number of capital letters inside the string
-                capital_letter_count = sum(map(str.isupper, self.current_look_direction))
-
-                # If there is only 1 capital letter, then current direction is one direction e.g. Right
-                if capital_letter_count == 1:
-                    self.player_direction = [self.current_look_direction]
-
-                # If there are 2 capital letters, then the current direction is two directions e.g Up Left
-                elif capital_letter_count == 2:
-                    # Set the player direction into a list consisting of the two directions the player is facing. E.g. ["Up", "Left"]
-                    self.player_direction = self.current_look_direction.split()
-
             # Draw the idle animation
             self.draw(surface = self.surface, x = (self.rect.centerx - self.camera_position[0]) - int(self.image.get_width() / 2), y = (self.rect.centery - self.camera_position[1]) - int(self.image.get_height() / 2))
 
@@ -739,6 +782,15 @@ class Player(Generic):
             # Draw the death animation
             self.draw(surface = self.surface, x = (self.rect.centerx - self.camera_position[0]) - int(self.image.get_width() / 2), y = (self.rect.centery - self.camera_position[1]) - int(self.image.get_height() / 2))
 
+        # If the player is alive and allowed to start performing actions (i.e. not during the camera panning when a boss is spawned)
+        if self.player_gameplay_info_dict["CurrentHealth"] > 0 and self.player_gameplay_info_dict["CanStartOperating"] == True:
+
+            # Draw the player tool
+            self.draw_player_tool()
+
+            # Draw the building highlights and guide circles
+            self.draw_building_guides()
+
     def update_damage_flash_effect_timer(self):
         
         # Updates the damage flash effect timer
@@ -817,25 +869,25 @@ class Player(Generic):
         if self.player_gameplay_info_dict["CanStartOperating"] == True:
 
             # Left
-            if pygame_key_get_pressed()[pygame_K_a] == False:
+            if input_key_get_pressed()[pygame_K_a] == False:
                 self.direction_variables_dict["Left"] = False
-            elif pygame_key_get_pressed()[pygame_K_a] == True:
+            elif input_key_get_pressed()[pygame_K_a] == True:
                 self.direction_variables_dict["Left"] = True
             
             # Right
-            if pygame_key_get_pressed()[pygame_K_d] == False:
+            if input_key_get_pressed()[pygame_K_d] == False:
                 self.direction_variables_dict["Right"] = False
-            elif pygame_key_get_pressed()[pygame_K_d] == True:
+            elif input_key_get_pressed()[pygame_K_d] == True:
                 self.direction_variables_dict["Right"] = True
             # Up
-            if pygame_key_get_pressed()[pygame_K_w] == False:
+            if input_key_get_pressed()[pygame_K_w] == False:
                 self.direction_variables_dict["Up"] = False
-            elif pygame_key_get_pressed()[pygame_K_w] == True:
+            elif input_key_get_pressed()[pygame_K_w] == True:
                 self.direction_variables_dict["Up"] = True
             # Down
-            if pygame_key_get_pressed()[pygame_K_s] == False:
+            if input_key_get_pressed()[pygame_K_s] == False:
                 self.direction_variables_dict["Down"] = False
-            elif pygame_key_get_pressed()[pygame_K_s] == True:
+            elif input_key_get_pressed()[pygame_K_s] == True:
                 self.direction_variables_dict["Down"] = True
 
             # Create a list that stores the direction(s) that the player is moving towards
@@ -868,7 +920,7 @@ class Player(Generic):
             next_position_y = self.rect.y
 
             # If the "a" key is pressed
-            if pygame_key_get_pressed()[pygame_K_a] and pygame_key_get_pressed()[pygame_K_d] == False:
+            if input_key_get_pressed()[pygame_K_a] and input_key_get_pressed()[pygame_K_d] == False:
 
                 # If the player is decelerating currently
                 if self.decelerating == True:
@@ -939,7 +991,7 @@ class Player(Generic):
                             self.rect.x = round(next_position_x)
 
             # If the "d" key is pressed
-            elif pygame_key_get_pressed()[pygame_K_d] and pygame_key_get_pressed()[pygame_K_a] == False:
+            elif input_key_get_pressed()[pygame_K_d] and input_key_get_pressed()[pygame_K_a] == False:
 
                 # If the player is decelerating currently
                 if self.decelerating == True:
@@ -1010,7 +1062,7 @@ class Player(Generic):
                             self.rect.x = round(next_position_x)
 
             # If the "w" key is pressed
-            if pygame_key_get_pressed()[pygame_K_w] and pygame_key_get_pressed()[pygame_K_s] == False:
+            if input_key_get_pressed()[pygame_K_w] and input_key_get_pressed()[pygame_K_s] == False:
 
                 # If the player is decelerating currently
                 if self.decelerating == True:
@@ -1080,7 +1132,7 @@ class Player(Generic):
                             self.rect.y = round(next_position_y)
 
             # If the "s" key is pressed
-            elif pygame_key_get_pressed()[pygame_K_s] and pygame_key_get_pressed()[pygame_K_w] == False:
+            elif input_key_get_pressed()[pygame_K_s] and input_key_get_pressed()[pygame_K_w] == False:
 
                 # If the player is decelerating currently
                 if self.decelerating == True:
@@ -1151,7 +1203,7 @@ class Player(Generic):
             # Deceleration
 
             # If the player has let go of all movement input keys or if the deceleration has already started
-            if (pygame_key_get_pressed()[pygame_K_a] == False and pygame_key_get_pressed()[pygame_K_d] == False and pygame_key_get_pressed()[pygame_K_w] == False and pygame_key_get_pressed()[pygame_K_s] == False and self.movement_suvat_u > 0) or self.decelerating == True:
+            if (input_key_get_pressed()[pygame_K_a] == False and input_key_get_pressed()[pygame_K_d] == False and input_key_get_pressed()[pygame_K_w] == False and input_key_get_pressed()[pygame_K_s] == False and self.movement_suvat_u > 0) or self.decelerating == True:
 
                 # (For floating point accuracy)
                 # Note: This is declared here because self.rect.x or self.rect.y may have changed 
@@ -1412,7 +1464,7 @@ class Player(Generic):
         """
         - The scale multiplier refers to how much the surface that everything will be drawn onto has been scaled by 
         """
-        mouse_position = pygame_mouse_get_pos()  
+        mouse_position = input_mouse_get_pos()  
         scale_multiplier = (screen_width / self.surface.get_width(), screen_height / self.surface.get_height())
         self.mouse_position = ((mouse_position[0] / scale_multiplier[0]) + self.camera_position[0] , (mouse_position[1] / scale_multiplier[1]) + self.camera_position[1])
         self.mouse_rect = pygame_Rect(self.mouse_position[0], self.mouse_position[1], 1, 1)
@@ -1444,7 +1496,7 @@ class Player(Generic):
         # Draws the weapon onto main surface
         
         # If the player is pressing the left mouse button
-        if pygame_mouse_get_pressed()[0]:
+        if input_mouse_get_pressed()[0]:
             
             # ---------------------------------------------------------------------------------------------------
             # Assigning tool image
@@ -1501,7 +1553,7 @@ class Player(Generic):
             # Draw the weapon at the position
 
             # pygame_draw_circle(self.scaled_surface, "white", (self.rect.centerx - self.camera_position[0], self.rect.centery - self.camera_position[1]), hypot_distance, 1)
-            self.surface.blit(tool_image, (self.weapon_position[0] - self.camera_position[0], self.weapon_position[1] - self.camera_position[1]))
+            blit_images(surface = self.surface, blit_sequence = ((tool_image, (self.weapon_position[0] - self.camera_position[0], self.weapon_position[1] - self.camera_position[1])),))
 
     def activate_frenzy_mode(self):
         
@@ -1511,7 +1563,7 @@ class Player(Generic):
         if (self.player_gameplay_info_dict["CurrentFrenzyModeValue"] == self.player_gameplay_info_dict["MaximumFrenzyModeValue"]):
             
             # If the player presses the "space" key
-            if pygame_key_get_pressed()[pygame_K_SPACE]:
+            if input_key_get_pressed()[pygame_K_SPACE]:
 
                 # Set the frenzy mode fire rate boost to 2
                 self.player_gameplay_info_dict["FrenzyModeFireRateBoost"] = 2
@@ -1781,7 +1833,15 @@ class Player(Generic):
             if self.tools["BuildingTool"]["RemovalCooldownTimer"] >= self.tools["BuildingTool"]["RemovalCooldown"]:
                 # Set the last tile removed timer back to None
                 self.tools["BuildingTool"]["RemovalCooldownTimer"] = None
-        
+
+    def remove_building_tile(self, building_tile):
+
+        # Replaces a building tile with the empty tile it replaced (when the player removes it or when it is destroyed)
+        self.tile_registry.remove_building_tile(building_tile = building_tile)
+
+        # If the building tile is in the neighbouring tiles dictionary (keys), remove it
+        self.neighbouring_tiles_dict.pop(building_tile, None)
+
     def handle_building(self):
         
         # If the player currently has the building tool equipped
@@ -1791,133 +1851,60 @@ class Player(Generic):
             # Update the removal cooldown timer
             self.update_removal_cooldown_timer()
 
-            # --------------------------------------
-            # Highlighting any tiles that are hovered over
-
-            # Look for collisions between the player's mouse and any placed building tile
-            # Note: Used for removing building tiles and highlighting tiles
-            collision_result_index = self.mouse_rect.collidelist(self.tools["BuildingTool"]["ExistingBuildingTilesList"])
-
-            # If the player is hovering over an existing building tile
-            if collision_result_index != -1:
-                
-                # Find any building tiles that are being hovered over
-                building_tile_to_highlight = self.tools["BuildingTool"]["ExistingBuildingTilesList"][collision_result_index]
-
-                # If the distance between this tile and the player is within the maximum removing distance
-                if dist(self.rect.center, building_tile_to_highlight.rect.center) <= self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
-                    # Set the highlight colour as orange
-                    highlight_colour = "orange"
-                
-                # If the distance between this tile and the player is not within the maximum removing distance
-                elif dist(self.rect.center, building_tile_to_highlight.rect.center) > self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
-                    # Set the highlight colour as red
-                    highlight_colour = "red"
-
-                # Highlight the building tile
-                pygame_draw_rect(
-                                surface = self.surface,
-                                color = highlight_colour,
-                                rect = pygame_Rect(
-                                                    building_tile_to_highlight.rect.x - self.camera_position[0],
-                                                    building_tile_to_highlight.rect.y  - self.camera_position[1],
-                                                    building_tile_to_highlight.rect.width,
-                                                    building_tile_to_highlight.rect.height
-                                                  ),
-                                width = 2
-                                )
+            # Find the building tile inside the cell that the player's mouse is over (None if there is no building tile in that cell)
+            # Note: Used for removing building tiles
+            hovered_building_tile = self.tile_registry.find_tile_at_position(position = self.mouse_position, tile_type = "BuildingTile")
 
             # --------------------------------------
             # Checking for input to remove building tiles
 
             # If there are existing building tiles
-            if len(self.tools["BuildingTool"]["ExistingBuildingTilesList"]) > 0:
+            if len(self.tools["BuildingTool"]["ExistingBuildingTilesDict"]) > 0:
 
                 # If the player pressed the right mouse button and there is an existing building tile
-                if pygame_mouse_get_pressed()[2]:
+                if input_mouse_get_pressed()[2]:
                     
                     # If enough time has passed since the player last removed a building tile
                     if self.tools["BuildingTool"]["RemovalCooldownTimer"] == None:
 
-                        # Return the building tile at this collision index 
-                        """ Note: If there is no collision, index -1 will be returned, which is perfect because then we should remove the last building tile placed down """
-                        building_tile_to_remove = self.tools["BuildingTool"]["ExistingBuildingTilesList"][collision_result_index]
+                        # Find the building tile that is being hovered over
+                        """ Note: If there is no collision, the last building tile placed down should be removed """
+                        if hovered_building_tile != None:
+                            building_tile_to_remove = hovered_building_tile
+                        else:
+                            building_tile_to_remove = next(reversed(self.tools["BuildingTool"]["ExistingBuildingTilesDict"]))
 
                         # If the distance between this tile and the player is within the maximum removing distance
                         if dist(self.rect.center, building_tile_to_remove.rect.center) <= self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
 
-                            # Remove the building tile from the world tiles group
-                            self.sprite_groups["WorldTiles"].remove(building_tile_to_remove)
-
-                            # "Create" an empty tile where the building tile was
-                            self.empty_tiles_dict[self.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
-                            
-                            # Remove the building tile from the replaced empty tiles dict
-                            self.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
-
-                            # Remove the building tile from the world tiles list
-                            self.world_tiles_dict.pop(building_tile_to_remove)
-
-                            # Remove the building tile at the collision result index from the existing building tiles list
-                            self.tools["BuildingTool"]["ExistingBuildingTilesList"].pop(collision_result_index)
+                            # Replace the building tile with the empty tile it replaced
+                            self.remove_building_tile(building_tile = building_tile_to_remove)
 
                             # Start the last tile removed timer, so that the player has to wait "self.tools["BuildingTool"]["RemovalCooldown"]" before removing another tile
                             self.tools["BuildingTool"]["RemovalCooldownTimer"] = 0
-
-                            # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                            if building_tile_to_remove in self.neighbouring_tiles_dict.keys():
-                                # Remove the building tile
-                                self.neighbouring_tiles_dict.pop(building_tile_to_remove)
             
                 # If the player pressed the "r" key and there are existing building tiles placed down
-                if pygame_key_get_pressed()[pygame_K_r]:
+                if input_key_get_pressed()[pygame_K_r]:
                 
-                    # For each building tile inside the existing building tiles list
-                    for list_index, building_tile_to_remove in enumerate(self.tools["BuildingTool"]["ExistingBuildingTilesList"]):
+                    # For each building tile within the maximum removing distance of the player (Found from the cells around the player)
+                    for building_tile_to_remove in self.tile_registry.find_building_tiles_within_distance(position = self.rect.center, distance = self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]):
 
-                        # If the distance between this tile and the player is within the maximum removing distance
-                        if dist(self.rect.center, building_tile_to_remove.rect.center) <= self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
-
-                            # Remove the building tile from the world tiles group
-                            self.sprite_groups["WorldTiles"].remove(building_tile_to_remove)
-
-                            # Remove the building tile from the world tiles list
-                            self.world_tiles_dict.pop(building_tile_to_remove)
+                        # Replace the building tile with the empty tile it replaced
+                        self.remove_building_tile(building_tile = building_tile_to_remove)
 
-                            # "Create" an empty tile where the building tile was
-                            self.empty_tiles_dict[self.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
-
-                            # Remove the building tile from the replaced empty tiles dict
-                            self.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
-
-                            # Remove the building tile at the list index
-                            self.tools["BuildingTool"]["ExistingBuildingTilesList"].pop(list_index)
-
-                            # Start the last tile removed timer, so that the player has to wait "self.tools["BuildingTool"]["RemovalCooldown"]" before removing tiles again
-                            self.tools["BuildingTool"]["RemovalCooldownTimer"] = 0
-
-                            # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                            if building_tile_to_remove in self.neighbouring_tiles_dict.keys():
-                                # Remove the building tile
-                                self.neighbouring_tiles_dict.pop(building_tile_to_remove)
+                        # Start the last tile removed timer, so that the player has to wait "self.tools["BuildingTool"]["RemovalCooldown"]" before removing tiles again
+                        self.tools["BuildingTool"]["RemovalCooldownTimer"] = 0
 
 
             # --------------------------------------
             # Checking for placement of building tiles
 
-            # Draw a guide circles to show the minimum and maximum distances the player can place building tiles (MAY REMOVE)
-            pygame_draw_circle(self.surface, "red", (self.rect.centerx - self.camera_position[0], self.rect.centery - self.camera_position[1]), self.tools["BuildingTool"]["MinimumPlacingDistance"], 1)
-            pygame_draw_circle(self.surface, "red", (self.rect.centerx - self.camera_position[0], self.rect.centery - self.camera_position[1]), self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"], 2)
-
-            # Find collisions between the mouse rect and empty tiles inside the tile map
-            empty_tile_collision = pygame_Rect(self.mouse_position[0], self.mouse_position[1] , 1, 1).collidedict(self.empty_tiles_dict)
+            # Find the empty tile inside the cell that the player's mouse is over (None if there is no empty tile in that cell)
+            empty_tile = self.tile_registry.find_tile_at_position(position = self.mouse_position, tile_type = "EmptyTile")
 
-            # If there is a collision between the mouse rect and an empty tile 
-            if empty_tile_collision != None:
+            # If the player's mouse is over an empty tile
+            if empty_tile != None:
 
-                # The tile rect will be the key of the returned value from the collide dict
-                empty_tile = empty_tile_collision[0]
-                
                 # The center of the empty tile
                 empty_tile_center = (
                                     empty_tile.rect.x + (empty_tile.rect.width / 2),
@@ -1926,20 +1913,9 @@ class Player(Generic):
 
                 # If the distance between the center of the player and the center of the empty tile at the mouse position less than the maximum distance
                 if self.tools["BuildingTool"]["MinimumPlacingDistance"] < dist(self.rect.center, empty_tile_center) < self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
-                    # Highlight the empty tile as green
-                    pygame_draw_rect(
-                                    surface = self.surface,
-                                    color = "green", 
-                                    rect = pygame_Rect(
-                                                        empty_tile.rect.x - self.camera_position[0], 
-                                                        empty_tile.rect.y - self.camera_position[1],
-                                                        empty_tile.rect.width,
-                                                        empty_tile.rect.height),
-                                    width = 2                
-                                    )   
 
                     # If the left mouse button is pressed and there are less than 3 existing building tiles
-                    if pygame_mouse_get_pressed()[0] == True and len(self.tools["BuildingTool"]["ExistingBuildingTilesList"]) < self.tools["BuildingTool"]["MaximumNumberOfTilesAtOneTime"]:
+                    if input_mouse_get_pressed()[0] == True and len(self.tools["BuildingTool"]["ExistingBuildingTilesDict"]) < self.tools["BuildingTool"]["MaximumNumberOfTilesAtOneTime"]:
                         
                         # If the player has enough bamboo resource to place down another building tile
                         if self.player_gameplay_info_dict["AmountOfBambooResource"] - self.tools["BuildingTool"]["BambooResourceDepletionAmount"] > 0:
@@ -1958,20 +1934,9 @@ class Player(Generic):
                                 # Create a building tile
                                 building_tile = BuildingTile(x = empty_tile.rect.x, y = empty_tile.rect.y, image = self.tools["BuildingTool"]["Images"]["TileImage"])
 
-                                # Add the building tile to the building tiles sprite group
-                                self.sprite_groups["WorldTiles"].add(building_tile)
-
-                                # Add the building tile to the world tiles dictionary with the key as the building tile and the value as the type of world tile
-                                self.world_tiles_dict[building_tile] = "BuildingTile"
-
-                                # Save the empty tile in the replaced empty tiles dict so that we do not need to create a new empty tile every time a building tile is placed / removed
-                                self.sprite_groups["ReplacedEmptyTiles"][building_tile] = empty_tile
-
-                                # Remove the empty tile from the empty tiles dictionary
-                                self.empty_tiles_dict.pop(empty_tile)
-                                
-                                # Add the building tile to the existing building tiles list
-                                self.tools["BuildingTool"]["ExistingBuildingTilesList"].append(building_tile)
+                                # Replace the empty tile with the building tile inside the tile registry (which adds the building tile to the world tiles dict, the world tiles group, the tile chunks and the existing building tiles dict)
+                                # Note: The empty tile is kept so that we do not need to create a new empty tile every time a building tile is placed / removed
+                                self.tile_registry.place_building_tile(empty_tile = empty_tile, building_tile = building_tile)
 
                                 # If a boss has been spawned and the boss rect is not set to None
                                 # Note: Second check is so that when the current boss dies, the boss rect can be set to None, until the next boss is spawned
@@ -1979,23 +1944,87 @@ class Player(Generic):
                                     # Remove bamboo resource by the depletion amount set
                                     self.player_gameplay_info_dict["AmountOfBambooResource"] -= self.tools["BuildingTool"]["BambooResourceDepletionAmount"]
 
+    def draw_building_guides(self):
+
+        # Draws the highlights of the tiles that the player's mouse is over and the guide circles for building (The building tiles are placed / removed in handle_building)
+
+        # If the player currently has the building tool equipped
+        if self.player_gameplay_info_dict["CurrentToolEquipped"] == "BuildingTool":
+
+            # --------------------------------------
+            # Highlighting any tiles that are hovered over
+
+            # Find the building tile inside the cell that the player's mouse is over (None if there is no building tile in that cell)
+            hovered_building_tile = self.tile_registry.find_tile_at_position(position = self.mouse_position, tile_type = "BuildingTile")
+
+            # If the player is hovering over an existing building tile
+            if hovered_building_tile != None:
+                
+                # The building tile being hovered over
+                building_tile_to_highlight = hovered_building_tile
+
+                # If the distance between this tile and the player is within the maximum removing distance
+                if dist(self.rect.center, building_tile_to_highlight.rect.center) <= self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
+                    # Set the highlight colour as orange
+                    highlight_colour = "orange"
+                
+                # If the distance between this tile and the player is not within the maximum removing distance
+                elif dist(self.rect.center, building_tile_to_highlight.rect.center) > self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
+                    # Set the highlight colour as red
+                    highlight_colour = "red"
+
+                # Highlight the building tile
+                pygame_draw_rect(
+                                surface = self.surface,
+                                color = highlight_colour,
+                                rect = pygame_Rect(
+                                                    building_tile_to_highlight.rect.x - self.camera_position[0],
+                                                    building_tile_to_highlight.rect.y  - self.camera_position[1],
+                                                    building_tile_to_highlight.rect.width,
+                                                    building_tile_to_highlight.rect.height
+                                                  ),
+                                width = 2
+                                )
+
+            # Draw a guide circles to show the minimum and maximum distances the player can place building tiles (MAY REMOVE)
+            pygame_draw_circle(self.surface, "red", (self.rect.centerx - self.camera_position[0], self.rect.centery - self.camera_position[1]), self.tools["BuildingTool"]["MinimumPlacingDistance"], 1)
+            pygame_draw_circle(self.surface, "red", (self.rect.centerx - self.camera_position[0], self.rect.centery - self.camera_position[1]), self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"], 2)
+
+            # Find the empty tile inside the cell that the player's mouse is over (None if there is no empty tile in that cell)
+            empty_tile = self.tile_registry.find_tile_at_position(position = self.mouse_position, tile_type = "EmptyTile")
+
+            # If the player's mouse is over an empty tile
+            if empty_tile != None:
+
+                # The center of the empty tile
+                empty_tile_center = (
+                                    empty_tile.rect.x + (empty_tile.rect.width / 2),
+                                    empty_tile.rect.y + (empty_tile.rect.height / 2)
+                                    )   
+
+                # If the distance between the center of the player and the center of the empty tile at the mouse position less than the maximum distance
+                if self.tools["BuildingTool"]["MinimumPlacingDistance"] < dist(self.rect.center, empty_tile_center) < self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
+                    # Highlight the empty tile as green
+                    highlight_colour = "green"
+
                 # If the distance between the center of the player and the center of the empty tile at the mouse position:
                 # - Less than or equal to the minimum distance
                 # - Greater than or equal to the maximum distance
-                elif dist(self.rect.center, empty_tile_center) <= self.tools["BuildingTool"]["MinimumPlacingDistance"] or \
-                     dist(self.rect.center, empty_tile_center) >= self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
-
+                else:
                     # Highlight the empty tile as red
-                    pygame_draw_rect(
-                                    surface = self.surface,
-                                    color = "red", 
-                                    rect = pygame_Rect(
-                                                        empty_tile.rect.x - self.camera_position[0], 
-                                                        empty_tile.rect.y - self.camera_position[1],
-                                                        empty_tile.rect.width,
-                                                        empty_tile.rect.height),
-                                    width = 2                
-                                    )   
+                    highlight_colour = "red"
+
+                # Highlight the empty tile
+                pygame_draw_rect(
+                                surface = self.surface,
+                                color = highlight_colour, 
+                                rect = pygame_Rect(
+                                                    empty_tile.rect.x - self.camera_position[0], 
+                                                    empty_tile.rect.y - self.camera_position[1],
+                                                    empty_tile.rect.width,
+                                                    empty_tile.rect.height),
+                                width = 2                
+                                )   
     
     # ---------------------------------------
     # Shooting
@@ -2020,7 +2049,7 @@ class Player(Generic):
             self.update_shooting_cooldown_timer(current_weapon_dict = current_weapon_dict)
 
             # If the left mouse button has been pressed and the player has enough resources to shoot
-            if pygame_mouse_get_pressed()[0] == True and \
+            if input_mouse_get_pressed()[0] == True and \
                 ((self.player_gameplay_info_dict["AmountOfBambooResource"] - current_weapon_dict["BambooResourceDepletionAmount"]) >= 0 or self.player_gameplay_info_dict["FrenzyModeTimer"] != None):
 
                     # If enough time has passed since the last time the player shot
@@ -2150,10 +2179,11 @@ class Player(Generic):
                     # If the player has activated frenzy mode
                     if self.player_gameplay_info_dict["FrenzyModeTimer"] != None:
 
-                        # Note: The copy of the original image is so that we don't continuously add onto the current RGB values of the projectile's image (otherwise it will become completely white)
+                        # Note: The original image is passed in so that we don't continuously add onto the current RGB values of the projectile's image (otherwise it will become completely white)
+                        # (change_image_colour already returns a tinted copy, and passing the same original image means the cached tinted image can be reused)
 
                         # Set the bamboo projectile image to be the same colour as the player when in frenzy mode
-                        bamboo_projectile.image = change_image_colour(current_animation_image = bamboo_projectile.original_image.copy(), desired_colour = self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"])
+                        bamboo_projectile.image = change_image_colour(current_animation_image = bamboo_projectile.original_image, desired_colour = self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"])
 
                     # If the player has not activated frenzy mode
                     elif self.player_gameplay_info_dict["FrenzyModeTimer"] == None:
@@ -2213,7 +2243,7 @@ class Player(Generic):
                 # If the death animations have not been loaded before
                 if "Death" not in self.animations_dict.keys():
                     # Load the death animation images
-                    self.animations_dict["Death"] = tuple(pygame_image_load(f'graphics/Misc/DeathAnimation/{i}.png').convert_alpha() for i in range(0, len(os_list_dir('graphics/Misc/DeathAnimation'))))
+                    self.animations_dict["Death"] = load_animation(directory = "graphics/Misc/DeathAnimation")
 
                     # Set the frame cooldown (time between each frame)
                     self.animation_frame_cooldowns_dict["Death"] = FULL_DEATH_ANIMATION_DURATION / len(self.animations_dict["Death"])
@@ -2240,8 +2270,8 @@ class Player(Generic):
                 # Track player movement
                 self.handle_player_movement()
                 
-                # Create / update a mask for pixel - perfect collisions
-                self.mask = pygame_mask_from_surface(self.image)
+                # Update the mask for pixel - perfect collisions to be the mask of the current animation frame
+                self.mask = self.masks_dict[self.animation_frame]
 
                 # ----------------------------------
                 # Gameplay
@@ -2255,9 +2285,6 @@ class Player(Generic):
                 # Update the frenzy mode colour's RGB values
                 self.update_frenzy_mode_colour()
 
-                # Draw the player tool
-                self.draw_player_tool()
-
                 # Handle player building
                 self.handle_building() 
 
@@ -1,16 +1,18 @@
 from Global.settings import TILE_SIZE
+from Global.functions import change_image_colour_v2
+from Global.input_recorder import key_get_pressed as input_key_get_pressed
+from Global.asset_manager import load_animation, flip_animation, prefetch_asset, prefetch_asset_directory
+from Global.texture_atlas import pack_images
 
 from math import dist
 from random import choice as random_choice
-from os import listdir as os_listdir
 
-from pygame.key import get_pressed as pygame_key_get_pressed
 from pygame import K_f as pygame_K_f
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import circle as pygame_draw_circle
-from pygame.image import load as pygame_image_load
 from pygame.transform import flip as pygame_transform_flip
 from pygame.sprite import Group as pygame_sprite_Group
+from pygame.mask import from_surface as pygame_mask_from_surface
 
 class BossSpawner:
 
@@ -37,8 +39,8 @@ class BossSpawner:
         The final condition is that there shouldn't already be a boss
         """
 
-        if (pygame_key_get_pressed()[pygame_K_f] and hasattr(self, "bosses_dict") == False) or \
-            (pygame_key_get_pressed()[pygame_K_f] and hasattr(self, "bosses_dict") == True and self.bosses_dict["ValidSpawningPosition"] == None) or \
+        if (input_key_get_pressed()[pygame_K_f] and hasattr(self, "bosses_dict") == False) or \
+            (input_key_get_pressed()[pygame_K_f] and hasattr(self, "bosses_dict") == True and self.bosses_dict["ValidSpawningPosition"] == None) or \
             hasattr(self, "bosses_dict") == True and self.bosses_dict["ValidSpawningPosition"] != None:
 
             # If a boss has not been spawned yet
@@ -150,6 +152,8 @@ class BossSpawner:
                 self.bosses_dict["TimeToSpawnTimer"] = self.bosses_dict["TimeToSpawn"]
                 # Set the boss spawn effect timer to start
                 self.bosses_dict["SpawningEffectTimer"] = self.bosses_dict["SpawningEffectTimeBetweenEachChange"]
+                # Start decoding the boss' images while the spawning effect and the camera pan play
+                self.prefetch_boss_assets(boss = self.bosses_dict["CurrentBoss"])
 
             # If there is not "enough space" for the boss to spawn 
             elif len(self.bosses_dict["SpawningPositionTilesList"]) < (((self.bosses_dict["NumOfTilesForChecking"] * 2) + 1) ** 2) - 1:
@@ -158,76 +162,40 @@ class BossSpawner:
                 # Empty the spawning position tiles list
                 self.bosses_dict["SpawningPositionTilesList"] = []
 
-    def draw_spawning_effect_and_call_spawn_boss(self, delta_time):
+    def prefetch_boss_assets(self, boss):
 
-        # Draws the spawning effect and spawns the boss once the time to spawn timer is complete
+        # Starts decoding the images of a boss (and the death animation, which is loaded when the boss dies) on the asset manager's thread pool
+        """ Note: 
+        - The images are decoded while the spawning effect and the camera pan play, so that spawn_boss does not need to wait for them to be decoded
+        - If the images have not finished decoding by the time the boss is spawned, loading them waits for the remaining images (the same as if they were not prefetched)
+        - Only images that will be loaded are prefetched, as anything prefetched but never loaded would be decoded for nothing
+        """
 
-        # If a timer has been set to spawn the boss
-        if self.bosses_dict["TimeToSpawnTimer"] != None:
+        # Find the boss' class (The images are kept as a class attribute of the boss once it has been spawned for the first time)
+        match boss:
+            case "SikaDeer":
+                from Level.Bosses.SikaDeerBoss import SikaDeerBoss as boss_class
+            case "GoldenMonkey":
+                from Level.Bosses.GoldenMonkeyBoss import GoldenMonkeyBoss as boss_class
 
-            # For each empty tile in the spawning position tiles list
-            for empty_tile in self.bosses_dict["SpawningPositionTilesList"]:
+        # If the images for the boss have not been loaded already
+        if hasattr(boss_class, "ImagesDict") == False:
+            prefetch_asset_directory(directory = f"graphics/Bosses/{boss}")
 
-                    # If the empty tile is the required distance away from the selected spawning tile
-                    if self.bosses_dict["ValidSpawningPosition"].rect.x - (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE) <= empty_tile.rect.x <= self.bosses_dict["ValidSpawningPosition"].rect.x + (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE) and \
-                        self.bosses_dict["ValidSpawningPosition"].rect.y - (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE) <= empty_tile.rect.y <= self.bosses_dict["ValidSpawningPosition"].rect.y + (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE):
-                        
-                        # Highlight the empty tile
-                        pygame_draw_rect(
-                            surface = self.game.scaled_surface, 
-                            color = (255, 0, 50), 
-                            rect = (empty_tile.rect.x - self.camera.position[0], empty_tile.rect.y - self.camera.position[1], empty_tile.rect.width, empty_tile.rect.height), 
-                            width = 1,
-                            border_radius = 5
-                            )
-                        # Draw a circle which grows with the spawning effect counter (inner circle)
-                        pygame_draw_circle(
-                                        surface = self.game.scaled_surface, 
-                                        color = (160, 160, 160),
-                                        center = (self.bosses_dict["ValidSpawningPosition"].rect.centerx - self.camera.position[0], self.bosses_dict["ValidSpawningPosition"].rect.centery - self.camera.position[1]), 
-                                        radius = ((self.bosses_dict["SpawningEffectCounter"] - 1) * TILE_SIZE),
-                                        width = 1
-                                        )
+        # If this is the golden monkey and the game UI has not loaded the image of its energy indicator already
+        if boss == "GoldenMonkey" and self.game_ui.dimensions.get("golden_monkey_energy_indicator") == None:
+            prefetch_asset(path = "graphics/Misc/Energy.png")
 
-                        # Draw a circle which grows with the spawning effect counter (outer circle)
-                        pygame_draw_circle(
-                                        surface = self.game.scaled_surface, 
-                                        color = (180, 180, 180), 
-                                        center = (self.bosses_dict["ValidSpawningPosition"].rect.centerx - self.camera.position[0], self.bosses_dict["ValidSpawningPosition"].rect.centery - self.camera.position[1]), 
-                                        radius = (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE),
-                                        width = 1
-                                        )
+        # The death animation is loaded by each boss when it dies
+        prefetch_asset_directory(directory = "graphics/Misc/DeathAnimation")
 
-            # Draw the spawning tile
-            pygame_draw_rect(
-                            surface = self.game.scaled_surface, 
-                            color = "firebrick1", 
-                            rect = (
-                                
-                                    self.bosses_dict["ValidSpawningPosition"].rect.x - self.camera.position[0],
-                                    self.bosses_dict["ValidSpawningPosition"].rect.y - self.camera.position[1], 
-                                    self.bosses_dict["ValidSpawningPosition"].rect.width, 
-                                    self.bosses_dict["ValidSpawningPosition"].rect.height
-                                    ),
-                            width = 0, 
-                            border_radius = 5
-                            )
+    def update_spawning_effect_and_call_spawn_boss(self, delta_time):
+
+        # Updates the spawning effect and spawns the boss once the time to spawn timer is complete
+
+        # If a timer has been set to spawn the boss
+        if self.bosses_dict["TimeToSpawnTimer"] != None:
 
-            # Draw the spawning tile outline    
-            pygame_draw_rect(
-                            surface = self.game.scaled_surface, 
-                            color = "black", 
-                            rect = (
-                                
-                                    self.bosses_dict["ValidSpawningPosition"].rect.x - self.camera.position[0],
-                                    self.bosses_dict["ValidSpawningPosition"].rect.y - self.camera.position[1], 
-                                    self.bosses_dict["ValidSpawningPosition"].rect.width,
-                                    self.bosses_dict["ValidSpawningPosition"].rect.height
-                                    ),
-                            width = 2, 
-                            border_radius = 5
-                            )
-            
             # --------------------------------------------
             # Spawning effect timer 
 
@@ -289,6 +257,76 @@ class BossSpawner:
                 self.bosses_dict["ValidSpawningPosition"] = None
                 self.bosses_dict["RandomSpawningPosition"] = random_choice(list(self.game.empty_tiles_dict.keys()))
 
+    def draw_spawning_effect(self):
+
+        # Draws the spawning effect (The spawning effect counter is updated in update_spawning_effect_and_call_spawn_boss)
+
+        # If a timer has been set to spawn the boss
+        if self.bosses_dict["TimeToSpawnTimer"] != None:
+
+            # For each empty tile in the spawning position tiles list
+            for empty_tile in self.bosses_dict["SpawningPositionTilesList"]:
+
+                    # If the empty tile is the required distance away from the selected spawning tile
+                    if self.bosses_dict["ValidSpawningPosition"].rect.x - (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE) <= empty_tile.rect.x <= self.bosses_dict["ValidSpawningPosition"].rect.x + (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE) and \
+                        self.bosses_dict["ValidSpawningPosition"].rect.y - (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE) <= empty_tile.rect.y <= self.bosses_dict["ValidSpawningPosition"].rect.y + (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE):
+                        
+                        # Highlight the empty tile
+                        pygame_draw_rect(
+                            surface = self.game.scaled_surface, 
+                            color = (255, 0, 50), 
+                            rect = (empty_tile.rect.x - self.camera.position[0], empty_tile.rect.y - self.camera.position[1], empty_tile.rect.width, empty_tile.rect.height), 
+                            width = 1,
+                            border_radius = 5
+                            )
+                        # Draw a circle which grows with the spawning effect counter (inner circle)
+                        pygame_draw_circle(
+                                        surface = self.game.scaled_surface, 
+                                        color = (160, 160, 160),
+                                        center = (self.bosses_dict["ValidSpawningPosition"].rect.centerx - self.camera.position[0], self.bosses_dict["ValidSpawningPosition"].rect.centery - self.camera.position[1]), 
+                                        radius = ((self.bosses_dict["SpawningEffectCounter"] - 1) * TILE_SIZE),
+                                        width = 1
+                                        )
+
+                        # Draw a circle which grows with the spawning effect counter (outer circle)
+                        pygame_draw_circle(
+                                        surface = self.game.scaled_surface, 
+                                        color = (180, 180, 180), 
+                                        center = (self.bosses_dict["ValidSpawningPosition"].rect.centerx - self.camera.position[0], self.bosses_dict["ValidSpawningPosition"].rect.centery - self.camera.position[1]), 
+                                        radius = (self.bosses_dict["SpawningEffectCounter"] * TILE_SIZE),
+                                        width = 1
+                                        )
+
+            # Draw the spawning tile
+            pygame_draw_rect(
+                            surface = self.game.scaled_surface, 
+                            color = "firebrick1", 
+                            rect = (
+                                
+                                    self.bosses_dict["ValidSpawningPosition"].rect.x - self.camera.position[0],
+                                    self.bosses_dict["ValidSpawningPosition"].rect.y - self.camera.position[1], 
+                                    self.bosses_dict["ValidSpawningPosition"].rect.width, 
+                                    self.bosses_dict["ValidSpawningPosition"].rect.height
+                                    ),
+                            width = 0, 
+                            border_radius = 5
+                            )
+
+            # Draw the spawning tile outline    
+            pygame_draw_rect(
+                            surface = self.game.scaled_surface, 
+                            color = "black", 
+                            rect = (
+                                
+                                    self.bosses_dict["ValidSpawningPosition"].rect.x - self.camera.position[0],
+                                    self.bosses_dict["ValidSpawningPosition"].rect.y - self.camera.position[1], 
+                                    self.bosses_dict["ValidSpawningPosition"].rect.width,
+                                    self.bosses_dict["ValidSpawningPosition"].rect.height
+                                    ),
+                            width = 2, 
+                            border_radius = 5
+                            )
+
     def spawn_boss(self, boss_to_spawn):
 
         # Spawns the boss
@@ -302,41 +340,63 @@ class BossSpawner:
                 
                 # If the images for the deer boss have not been loaded already
                 if hasattr(SikaDeerBoss, "ImagesDict") == False:
+                    # The animations that are also used (flipped) for the opposite direction
+                    # Note: Each directory is only loaded once, the frames for the opposite direction are flipped from the loaded frames
+                    charge_right_animation = load_animation(directory = "graphics/Bosses/SikaDeer/Charge/Right")
+                    charge_up_right_animation = load_animation(directory = "graphics/Bosses/SikaDeer/Charge/UpRight")
+                    charge_down_right_animation = load_animation(directory = "graphics/Bosses/SikaDeer/Charge/DownRight")
+                    target_right_animation = load_animation(directory = "graphics/Bosses/SikaDeer/Target/Right")
+                    target_up_right_animation = load_animation(directory = "graphics/Bosses/SikaDeer/Target/UpRight")
+                    target_down_right_animation = load_animation(directory = "graphics/Bosses/SikaDeer/Target/DownRight")
+
                     # Create a class attribute for the SikaDeerBoss, which is an image dictionary holding all the images for each action that the boss has
                     SikaDeerBoss.ImagesDict = {
 
-                        "Chase": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Chase/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Chase")))),
-                        "Stomp": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Stomp/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Stomp")))),
+                        "Chase": load_animation(directory = "graphics/Bosses/SikaDeer/Chase"),
+                        "Stomp": load_animation(directory = "graphics/Bosses/SikaDeer/Stomp"),
 
                         "Target": { 
-                                "Up": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Up/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Up")))),
-                                "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Target/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/UpRight")))),
-                                "Up Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/UpRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/UpRight")))),
+                                "Up": load_animation(directory = "graphics/Bosses/SikaDeer/Target/Up"),
+                                "Up Left": flip_animation(animation = target_up_right_animation, flip_x = True),
+                                "Up Right": target_up_right_animation,
 
-                                "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Right")))),
-                                "Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Right/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Right")))),
+                                "Left": flip_animation(animation = target_right_animation, flip_x = True),
+                                "Right": target_right_animation,
 
-                                "Down": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Down/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Down")))),
-                                "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Target/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/DownRight")))),
-                                "Down Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/DownRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/DownRight")))),
+                                "Down": load_animation(directory = "graphics/Bosses/SikaDeer/Target/Down"),
+                                "Down Left": flip_animation(animation = target_down_right_animation, flip_x = True),
+                                "Down Right": target_down_right_animation,
                                 },
                         "Charge": {
-                                "Up": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Up/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Up")))),
-                                "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/UpRight")))),
-                                "Up Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/UpRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/UpRight")))),
+                                "Up": load_animation(directory = "graphics/Bosses/SikaDeer/Charge/Up"),
+                                "Up Left": flip_animation(animation = charge_up_right_animation, flip_x = True),
+                                "Up Right": charge_up_right_animation,
 
-                                "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Right")))),
-                                "Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Right/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Right")))),
+                                "Left": flip_animation(animation = charge_right_animation, flip_x = True),
+                                "Right": charge_right_animation,
 
-                                "Down": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Down/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Down")))),
-                                "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/DownRight")))),
-                                "Down Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/DownRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/DownRight")))),
+                                "Down": load_animation(directory = "graphics/Bosses/SikaDeer/Charge/Down"),
+                                "Down Left": flip_animation(animation = charge_down_right_animation, flip_x = True),
+                                "Down Right": charge_down_right_animation,
                                     
                                     },
-                        "Stunned": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Stunned/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Stunned")))),
+                        "Stunned": load_animation(directory = "graphics/Bosses/SikaDeer/Stunned"),
 
 
                                             }
+
+                    # Pack all of the boss' animation frames into one texture atlas sheet
+                    SikaDeerBoss.ImagesDict = pack_images(images = SikaDeerBoss.ImagesDict)
+
+                    # Create a class attribute for the SikaDeerBoss, which is a dictionary holding the mask of each animation frame (for pixel-perfect collisions)
+                    # Note: The key is the animation frame and the value is its mask, so that the mask does not need to be created every frame
+                    SikaDeerBoss.MasksDict = {}
+
+                    # For each animation (Chase, Stomp, Stunned and the Target and Charge animations for each direction)
+                    for animation_frames in (SikaDeerBoss.ImagesDict["Chase"], SikaDeerBoss.ImagesDict["Stomp"], SikaDeerBoss.ImagesDict["Stunned"]) + tuple(SikaDeerBoss.ImagesDict["Target"].values()) + tuple(SikaDeerBoss.ImagesDict["Charge"].values()):
+                        # Create the mask of each animation frame
+                        for animation_frame in animation_frames:
+                            SikaDeerBoss.MasksDict[animation_frame] = pygame_mask_from_surface(animation_frame)
                 
                 # Spawn the boss at the middle of the tile, with the bottom of the boss being at the bottom of the tile
                 sika_deer_boss = SikaDeerBoss(
@@ -370,28 +430,51 @@ class BossSpawner:
                 # If the images for the deer boss have not been loaded already
                 if hasattr(GoldenMonkeyBoss, "ImagesDict") == False:
 
+                    # The animations that are also used (flipped) for the opposite direction
+                    # Note: Each directory is only loaded once, the frames for the opposite direction are flipped from the loaded frames
+                    chase_right_animation = load_animation(directory = "graphics/Bosses/GoldenMonkey/Chase/Right")
+                    chase_up_right_animation = load_animation(directory = "graphics/Bosses/GoldenMonkey/Chase/UpRight")
+                    chase_down_right_animation = load_animation(directory = "graphics/Bosses/GoldenMonkey/Chase/DownRight")
+
                     # Create a class attribute for the GoldenMonkeyBoss, which is an image dictionary holding all the images for each action that the boss has
                     GoldenMonkeyBoss.ImagesDict = {
 
                         "Chase": {
-                                "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Right")))),
-                                "Right": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Right/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Right")))),
-                                "Up": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Up/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Up")))),
-                                "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/UpRight")))),
-                                "Up Right": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/UpRight/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/UpRight")))),
-                                "Down": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Down/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Down")))),
-                                "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/DownRight")))),
-                                "Down Right": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/DownRight/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Downright")))),
+                                "Left": flip_animation(animation = chase_right_animation, flip_x = True),
+                                "Right": chase_right_animation,
+                                "Up": load_animation(directory = "graphics/Bosses/GoldenMonkey/Chase/Up"),
+                                "Up Left": flip_animation(animation = chase_up_right_animation, flip_x = True),
+                                "Up Right": chase_up_right_animation,
+                                "Down": load_animation(directory = "graphics/Bosses/GoldenMonkey/Chase/Down"),
+                                "Down Left": flip_animation(animation = chase_down_right_animation, flip_x = True),
+                                "Down Right": chase_down_right_animation,
                                 },
 
-                        "SpiralAttack": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/SpiralAttack/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/SpiralAttack")))),
-                        "Sleep": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Sleep/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Sleep")))),
+                        "SpiralAttack": load_animation(directory = "graphics/Bosses/GoldenMonkey/SpiralAttack"),
+                        "Sleep": load_animation(directory = "graphics/Bosses/GoldenMonkey/Sleep"),
 
                         "DiveBomb": {
-                                    "Launch": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/DiveBomb/Launch/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/DiveBomb/Launch")))),
-                                    "Land": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/DiveBomb/Land/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/DiveBomb/Land"))))
+                                    "Launch": load_animation(directory = "graphics/Bosses/GoldenMonkey/DiveBomb/Launch"),
+                                    "Land": load_animation(directory = "graphics/Bosses/GoldenMonkey/DiveBomb/Land")
                                     }
                                                 }
+
+                    # Pack all of the boss' animation frames into one texture atlas sheet
+                    GoldenMonkeyBoss.ImagesDict = pack_images(images = GoldenMonkeyBoss.ImagesDict)
+
+                    # Create a class attribute for the GoldenMonkeyBoss, which is a dictionary holding the black silhouette of each animation frame (used for the damaged flash effect)
+                    # Note: The key is the animation frame and the value is its silhouette, so that the silhouette can be found without creating it every frame
+                    GoldenMonkeyBoss.SilhouettesDict = {}
+
+                    # Create a class attribute for the GoldenMonkeyBoss, which is a dictionary holding the mask of each animation frame (for pixel-perfect collisions)
+                    GoldenMonkeyBoss.MasksDict = {}
+
+                    # For each animation (Chase animations for each direction, SpiralAttack, Sleep and the DiveBomb animations for each stage)
+                    for animation_frames in tuple(GoldenMonkeyBoss.ImagesDict["Chase"].values()) + (GoldenMonkeyBoss.ImagesDict["SpiralAttack"], GoldenMonkeyBoss.ImagesDict["Sleep"]) + tuple(GoldenMonkeyBoss.ImagesDict["DiveBomb"].values()):
+                        # Create the silhouette and mask of each animation frame
+                        for animation_frame in animation_frames:
+                            GoldenMonkeyBoss.SilhouettesDict[animation_frame] = change_image_colour_v2(current_animation_image = animation_frame, desired_colour = (0, 0, 0))
+                            GoldenMonkeyBoss.MasksDict[animation_frame] = pygame_mask_from_surface(animation_frame)
                 # Find the boss map boundaries, so that for the divebomb mechanic, they aren't spawned inside of a tile
                 GoldenMonkeyBoss.boss_map_boundaries = {
                     "Top": 3 * TILE_SIZE, 
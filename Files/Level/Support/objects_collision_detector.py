@@ -1,11 +1,11 @@
 from Level.Objects.world_objects import BambooPile
+from Global.collision_shapes import collide_shapes
 
 from random import randrange as random_randrange
 from math import sin, cos
 
 from pygame.sprite import spritecollide as pygame_sprite_spritecollide
 from pygame.sprite import collide_rect as pygame_sprite_collide_rect
-from pygame.sprite import collide_mask as pygame_sprite_collide_mask
 
 class ObjectCollisionDetector:
 
@@ -35,7 +35,7 @@ class ObjectCollisionDetector:
                 if tile_collision_result != None:
 
                     # Check for a pixel-perfect collision between the bamboo projectile and the world tile that the bamboo_projectile's rect collided with
-                    if pygame_sprite_collide_mask(bamboo_projectile, tile_collision_result[0]) != None:
+                    if collide_shapes(bamboo_projectile, tile_collision_result[0]) != None:
 
                         # If this bamboo projectile was shot from the bamboo launcher
                         if bamboo_projectile.is_bamboo_launcher_projectile == True:
@@ -72,7 +72,7 @@ class ObjectCollisionDetector:
                     if bamboo_projectile.rect.colliderect(self.game.boss_group.sprite.rect) == True:
                         
                         # Check for a pixel-perfect collision between the bamboo projectile and the current boss
-                        if pygame_sprite_collide_mask(bamboo_projectile, self.game.boss_group.sprite) != None:
+                        if collide_shapes(bamboo_projectile, self.game.boss_group.sprite) != None:
 
                             # ------------------------------------------------------------------------------------------------------------------------------------------------
                             # Damage
@@ -181,7 +181,7 @@ class ObjectCollisionDetector:
                     if chilli_bamboo_collision_result != None:
 
                         # Check for a pixel-perfect collision between the bamboo projectile and the chilli projectile that the bamboo_projectile's rect collided with
-                        if pygame_sprite_collide_mask(bamboo_projectile, chilli_bamboo_collision_result[0]) != None:
+                        if collide_shapes(bamboo_projectile, chilli_bamboo_collision_result[0]) != None:
                             
                             # Take away a life from the bamboo projectile
                             bamboo_projectile.lives -= 1
@@ -247,12 +247,8 @@ class ObjectCollisionDetector:
             # Remove the bamboo pile from the bamboo piles group
             self.game.bamboo_piles_group.remove(player_and_bamboo_piles_collision_list)
 
-            # Add the empty tile back to the empty tiles dictionary so other items can spawn in the tile
-            empty_tile = self.game.replaced_empty_tiles_dict[player_and_bamboo_piles_collision_list[0]]
-            self.game.empty_tiles_dict[empty_tile] = 0
-
-            # Remove the bamboo pile from the replaced empty tiles dict
-            self.game.replaced_empty_tiles_dict.pop(player_and_bamboo_piles_collision_list[0])
+            # Replace the bamboo pile with the empty tile it replaced inside the tile registry, so other items can spawn in the tile
+            self.game.tile_registry.remove_bamboo_pile(bamboo_pile = player_and_bamboo_piles_collision_list[0])
 
             # Play the bamboo pile pick up sound effect
             self.game.play_manual_sound(sound_effect = "BambooPilePickUp")
@@ -327,16 +323,16 @@ class ObjectCollisionDetector:
                     # --------------------------------
                     # Building tiles
 
-                    # If the stomp attack node image is not the same as the diameter of the attack node 
+                    # If the stomp attack nodes use pixel-perfect collisions and the stomp attack node image is not the same as the diameter of the attack node 
                     """ Note: This is here instead of inside the stomp attack node's increase_size method to avoid resizing the image everytime the attack node's size is changed
                     - The rect has already been adjusted according to the changed radius
                     """
-                    if stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
+                    if stomp_attack_node.collision_shape == "Mask" and stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
                         # Rescale the image for pixel-perfect collision
                         stomp_attack_node.rescale_image()
                     
                     # Check for a pixel-perfect collision between the stomp attack node and the building tile
-                    if pygame_sprite_collide_mask(stomp_attack_node, collision_result[0]) != None:
+                    if collide_shapes(stomp_attack_node, collision_result[0]) != None:
 
                         # If the stomp attack node was blocked by a building tile
                         if collision_result[1] == "BuildingTile":
@@ -352,31 +348,11 @@ class ObjectCollisionDetector:
                                 stomp_attack_node.vertical_gradient *= -1.75
                                 stomp_attack_node.reflected = True
 
-                            # Take one life away from the building tile
-                            collision_result[0].lives -= 1
-
-                            # If the building tile has run out of lives
-                            if collision_result[0].lives <= 0:
-
-                                # "Create" an empty tile where the building tile was
-                                self.game.empty_tiles_dict[self.game.player.sprite_groups["ReplacedEmptyTiles"][collision_result[0]]] = 0
-                                
-                                # Remove the building tile from the player's replaced empty tiles dict
-                                self.game.player.sprite_groups["ReplacedEmptyTiles"].pop(collision_result[0])
-
-                                # Remove the building tile from the world tiles group
-                                self.game.world_tiles_group.remove(collision_result[0])
-
-                                # Remove the building tile from the world tiles dictionary
-                                self.game.world_tiles_dict.pop(collision_result[0])
-
-                                # Remove the building tile from the existing building tiles list
-                                self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(collision_result[0])
+                            # Take one life away from the building tile, and if the building tile has run out of lives
+                            if self.game.tile_registry.damage_building_tile(building_tile = collision_result[0]) <= 0:
 
-                                # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                                if collision_result[0] in self.game.player.neighbouring_tiles_dict.keys():
-                                    # Remove the building tile
-                                    self.game.player.neighbouring_tiles_dict.pop(collision_result[0])
+                                # Replace the building tile with the empty tile it replaced
+                                self.game.player.remove_building_tile(building_tile = collision_result[0])
 
                                 # Create many shattered bamboo pieces
                                 self.game_ui.create_angled_polygons_effects(
@@ -414,16 +390,16 @@ class ObjectCollisionDetector:
                 # Look for tile rect collisions between the stomp attack nodes and the player
                 if stomp_attack_node.rect.colliderect(self.game.player.rect):
                     
-                    # If the stomp attack node image is not the same as the diameter of the attack node 
+                    # If the stomp attack nodes use pixel-perfect collisions and the stomp attack node image is not the same as the diameter of the attack node 
                     """ Note: This is here instead of inside the stomp attack node's increase_size method to avoid resizing the image everytime the attack node's size is changed
                     - The rect has already been adjusted according to the changed radius
                     """
-                    if stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
+                    if stomp_attack_node.collision_shape == "Mask" and stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
                         # Rescale the image for pixel-perfect collision
                         stomp_attack_node.rescale_image()
 
                     # Check for a pixel-perfect collision between the stomp attack node and the player
-                    if pygame_sprite_collide_mask(stomp_attack_node, self.game.player) != None:
+                    if collide_shapes(stomp_attack_node, self.game.player) != None:
 
                         # Remove the stomp attack node from the group if there is a collision
                         self.game.stomp_attack_nodes_group.remove(stomp_attack_node)
@@ -468,16 +444,16 @@ class ObjectCollisionDetector:
                 # Only enter if there is a rect collision and the stomp attack node was reflected
                 if self.game.boss_group.sprite != None and stomp_attack_node.rect.colliderect(self.game.boss_group.sprite.rect) and stomp_attack_node.reflected == True:
                     
-                    # If the stomp attack node image is not the same as the diameter of the attack node 
+                    # If the stomp attack nodes use pixel-perfect collisions and the stomp attack node image is not the same as the diameter of the attack node 
                     """ Note: This is here instead of inside the stomp attack node's increase_size method to avoid resizing the image everytime the attack node's size is changed
                     - The rect has already been adjusted according to the changed radius
                     """
-                    if stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
+                    if stomp_attack_node.collision_shape == "Mask" and stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
                         # Rescale the image for pixel-perfect collision
                         stomp_attack_node.rescale_image()
 
                     # Check for a pixel-perfect collision between the bamboo projectile and the current boss
-                    if pygame_sprite_collide_mask(stomp_attack_node, self.game.boss_group.sprite) != None:
+                    if collide_shapes(stomp_attack_node, self.game.boss_group.sprite) != None:
                         
                         # Remove the stomp attack node from the group if there is a collision
                         self.game.stomp_attack_nodes_group.remove(stomp_attack_node)
@@ -534,36 +510,16 @@ class ObjectCollisionDetector:
                     # Building tiles
                     
                     # Check for a pixel-perfect collision between the chilli projectile and the building tile
-                    if pygame_sprite_collide_mask(chilli_projectile, collision_result[0]) != None:
+                    if collide_shapes(chilli_projectile, collision_result[0]) != None:
                         
                         # If the chilli projectile was blocked by a building tile
                         if collision_result[1] == "BuildingTile":
                             
-                            # Take one life away from the building tile
-                            collision_result[0].lives -= 1
-
-                            # If the building tile has run out of lives
-                            if collision_result[0].lives <= 0:
-
-                                # "Create" an empty tile where the building tile was
-                                self.game.empty_tiles_dict[self.game.player.sprite_groups["ReplacedEmptyTiles"][collision_result[0]]] = 0
-                                
-                                # Remove the building tile from the player's replaced empty tiles dict
-                                self.game.player.sprite_groups["ReplacedEmptyTiles"].pop(collision_result[0])
-
-                                # Remove the building tile from the world tiles group
-                                self.game.world_tiles_group.remove(collision_result[0])
-
-                                # Remove the building tile from the world tiles dictionary
-                                self.game.world_tiles_dict.pop(collision_result[0])
-
-                                # Remove the building tile from the existing building tiles list
-                                self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(collision_result[0])
+                            # Take one life away from the building tile, and if the building tile has run out of lives
+                            if self.game.tile_registry.damage_building_tile(building_tile = collision_result[0]) <= 0:
 
-                                # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                                if collision_result[0] in self.game.player.neighbouring_tiles_dict.keys():
-                                    # Remove the building tile
-                                    self.game.player.neighbouring_tiles_dict.pop(collision_result[0])
+                                # Replace the building tile with the empty tile it replaced
+                                self.game.player.remove_building_tile(building_tile = collision_result[0])
 
                                 # Play the sound effect for when a chilli projectile breaks a building tile
                                 self.game.play_manual_sound(
@@ -624,7 +580,7 @@ class ObjectCollisionDetector:
                 if chilli_projectile.rect.colliderect(self.game.player.rect):
                     
                     # Check for a pixel-perfect collision between the chilli projectile and the player
-                    if pygame_sprite_collide_mask(chilli_projectile, self.game.player) != None:
+                    if collide_shapes(chilli_projectile, self.game.player) != None:
 
                         # Remove the chilli projectile from the dict if there is a collision
                         self.game.chilli_projectiles_dict.pop(chilli_projectile)
@@ -678,42 +634,26 @@ class ObjectCollisionDetector:
             # Building tiles
 
             # If there is at least one existing building tile
-            if (len(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"]) > 0):
+            if (len(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesDict"]) > 0):
                 
-                # Find the index of the building tile in the existing building tiles list if there is a rect collision between the tile and the boss
-                building_collision_result_indexes = self.game.boss_group.sprite.dive_bomb_attack_controller.rect.collidelistall(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"])
+                # Find the building tiles in the existing building tiles dict if there is a rect collision between the tile and the dive bomb attack circle
+                building_collision_results = self.game.boss_group.sprite.dive_bomb_attack_controller.rect.collidedictall(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesDict"])
 
                 # If there are any rect collisions
-                if len(building_collision_result_indexes) > 0:
+                if len(building_collision_results) > 0:
                     
-                    # Create a tuple with the indexes of building tiles inside the existing building tiles list, if there is pixel-perfect collision between the tile and the dive bomb attack circle
-                    pixel_perfect_collision_indexes_tuple = tuple(
-                                        building_collision_result_index for building_collision_result_index in building_collision_result_indexes 
-                                        if pygame_sprite_collide_mask(self.game.boss_group.sprite.dive_bomb_attack_controller, self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]) != None
+                    # Create a tuple with the building tiles inside the existing building tiles dict, if there is pixel-perfect collision between the tile and the dive bomb attack circle
+                    # Note: This is created before any building tiles are removed, as removing a building tile changes the existing building tiles dict
+                    pixel_perfect_collision_tiles_tuple = tuple(
+                                        building_tile for building_tile, _ in building_collision_results 
+                                        if collide_shapes(self.game.boss_group.sprite.dive_bomb_attack_controller, building_tile) != None
                                                             )
 
-                    # For each building tile index
-                    for building_collision_result_index in pixel_perfect_collision_indexes_tuple:
+                    # For each building tile
+                    for building_tile_to_remove in pixel_perfect_collision_tiles_tuple:
 
-                        # Temporary variable for the building tile to remove
-                        building_tile_to_remove = self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]
-
-                        # "Create" an empty tile where the building tile was
-                        self.game.empty_tiles_dict[self.game.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
-                        
-                        # Remove the building tile from the player's replaced empty tiles dict
-                        self.game.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
-
-                        # Remove the building tile from the world tiles group
-                        self.game.world_tiles_group.remove(building_tile_to_remove)
-
-                        # Remove the building tile from the world tiles dictionary
-                        self.game.world_tiles_dict.pop(building_tile_to_remove)
-
-                        # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                        if building_tile_to_remove in self.game.player.neighbouring_tiles_dict.keys():
-                            # Remove the building tile
-                            self.game.player.neighbouring_tiles_dict.pop(building_tile_to_remove)
+                        # Replace the building tile with the empty tile it replaced
+                        self.game.player.remove_building_tile(building_tile = building_tile_to_remove)
 
                         # Create many shattered bamboo pieces
                         self.game_ui.create_angled_polygons_effects(
@@ -722,16 +662,11 @@ class ObjectCollisionDetector:
                                                                     specified_number_of_pieces = random_randrange(10, 20)
                                                                     )
 
-                    # Rebuild the existing building tiles list
-                    # Note: This is because, popping whilst iterating over the list would cause an index error
-                    self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"] = [
-                        self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"][i] for i in range(0, len(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"])) if i not in pixel_perfect_collision_indexes_tuple]
-
             # ------------------------------------------------------------------
             # Player
 
             # If there is pixel perfect collision and the player has not been knocked back yet
-            if pygame_sprite_collide_mask(self.game.boss_group.sprite.dive_bomb_attack_controller, self.game.player) and self.game.player.player_gameplay_info_dict["InvincibilityTimer"] == None and (self.game.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] == None):
+            if collide_shapes(self.game.boss_group.sprite.dive_bomb_attack_controller, self.game.player) and self.game.player.player_gameplay_info_dict["InvincibilityTimer"] == None and (self.game.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] == None):
                 
                 # -------------------
                 # Error prevention
@@ -814,39 +749,22 @@ class ObjectCollisionDetector:
             # Building tiles
 
             # If there is at least one existing building tile
-            if (len(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"]) > 0):
+            if (len(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesDict"]) > 0):
             
-                # Find the index of the building tile in the existing building tiles list if there is a rect collision between the tile and the boss
-                building_collision_result_index = self.game.boss_group.sprite.rect.collidelist(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"])
+                # Find the building tile in the existing building tiles dict if there is a rect collision between the tile and the boss
+                building_collision_result = self.game.boss_group.sprite.rect.collidedict(self.game.player.tools["BuildingTool"]["ExistingBuildingTilesDict"])
                 
                 # If there is a collision
-                if building_collision_result_index != -1:
+                if building_collision_result != None:
                     
                     # Check for pixel-perfect collision between the boss and the building tile
-                    if pygame_sprite_collide_mask(self.game.boss_group.sprite, self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]) != None:
+                    if collide_shapes(self.game.boss_group.sprite, building_collision_result[0]) != None:
                         
                         # Temporary variable for the building tile to remove
-                        building_tile_to_remove = self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]
-
-                        # "Create" an empty tile where the building tile was
-                        self.game.empty_tiles_dict[self.game.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
-                        
-                        # Remove the building tile from the player's replaced empty tiles dict
-                        self.game.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
-
-                        # Remove the building tile from the world tiles group
-                        self.game.world_tiles_group.remove(building_tile_to_remove)
-
-                        # Remove the building tile from the world tiles dictionary
-                        self.game.world_tiles_dict.pop(building_tile_to_remove)
-
-                        # Remove the building tile from the existing building tiles list
-                        self.game.player.tools["BuildingTool"]["ExistingBuildingTilesList"].pop(building_collision_result_index)
+                        building_tile_to_remove = building_collision_result[0]
 
-                        # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                        if building_tile_to_remove in self.game.player.neighbouring_tiles_dict.keys():
-                            # Remove the building tile
-                            self.game.player.neighbouring_tiles_dict.pop(building_tile_to_remove)
+                        # Replace the building tile with the empty tile it replaced
+                        self.game.player.remove_building_tile(building_tile = building_tile_to_remove)
 
                         # ------------------------------------------------------------------
                         # Additional effects
@@ -945,7 +863,7 @@ class ObjectCollisionDetector:
                                 self.game.boss_group.sprite.current_action != "Sleep":
 
                 # If there is pixel-perfect collision 
-                if pygame_sprite_collide_mask(self.game.boss_group.sprite, self.game.player):
+                if collide_shapes(self.game.boss_group.sprite, self.game.player):
                     # -------------------
                     # Error prevention
                     """Note: This occurs if the boss has collided with the player before its move method has been called"""
@@ -0,0 +1,96 @@
+from Global.settings import INTERPOLATION_MAXIMUM_STEP_DISTANCE
+
+class RenderInterpolator:
+
+    # Draws the player, the boss, the projectiles and the camera between their positions before and after the last fixed step, so that their movement is smooth when the framerate is not a multiple of the tick rate
+    """ Notes:
+    - The positions before each fixed step are recorded at the start of the step (see record_previous_positions)
+    - When the game is drawn, each object is moved to its previous position plus "alpha" (the fraction of a step that has not been simulated yet) of the distance it moved in the last step, and moved back once the game has been drawn
+    - So nothing that the game uses is changed, the objects are only at their interpolated positions whilst they are being drawn
+    - Objects that moved further than INTERPOLATION_MAXIMUM_STEP_DISTANCE in the last step (e.g. the golden monkey jumping off the screen for its divebomb attack) and objects created in the last step are drawn at their current positions
+    """
+
+    def __init__(self, game):
+
+        # Attribute that references the Game object
+        self.game = game
+
+        # The positions of the objects and the camera before the last fixed step, format: {object: (x, y)} and [x, y]
+        self.previous_positions_dict = {}
+        self.previous_camera_position = None
+
+        # The positions of the objects and the camera whilst they are moved to their interpolated positions (Used to move them back), format: {object: (x, y)} and [x, y]
+        self.current_positions_dict = {}
+        self.current_camera_position = None
+
+    def find_interpolated_objects(self):
+
+        # Returns the objects that are interpolated (The player, the boss and all projectiles)
+        interpolated_objects = [self.game.player]
+
+        if self.game.boss_group.sprite != None:
+            interpolated_objects.append(self.game.boss_group.sprite)
+
+        interpolated_objects.extend(self.game.bamboo_projectiles_group)
+
+        # If the golden monkey's chilli projectiles / the sika deer's stomp attack nodes have been created
+        if hasattr(self.game, "chilli_projectiles_dict") == True:
+            interpolated_objects.extend(self.game.chilli_projectiles_dict.keys())
+        if hasattr(self.game, "stomp_attack_nodes_group") == True:
+            interpolated_objects.extend(self.game.stomp_attack_nodes_group)
+
+        return interpolated_objects
+
+    def record_previous_positions(self):
+
+        # Records the positions of the objects and the camera before a fixed step is performed
+        self.previous_positions_dict = {interpolated_object: interpolated_object.rect.topleft for interpolated_object in self.find_interpolated_objects()}
+
+        # If the camera position has been set (It is 0 until the camera has been updated for the first time)
+        if self.game.camera.position != 0:
+            self.previous_camera_position = tuple(self.game.camera.position)
+
+    def find_interpolated_position(self, previous_position, current_position, alpha):
+
+        # Returns the position between the previous position and the current position (The current position if the object moved too far to be interpolated)
+        if abs(current_position[0] - previous_position[0]) > INTERPOLATION_MAXIMUM_STEP_DISTANCE or abs(current_position[1] - previous_position[1]) > INTERPOLATION_MAXIMUM_STEP_DISTANCE:
+            return current_position
+
+        return (
+                previous_position[0] + ((current_position[0] - previous_position[0]) * alpha),
+                previous_position[1] + ((current_position[1] - previous_position[1]) * alpha)
+                )
+
+    def move_to_interpolated_positions(self, alpha):
+
+        # Moves the objects and the camera to their interpolated positions (until move_to_current_positions is called)
+
+        # Objects
+        self.current_positions_dict = {}
+        for interpolated_object in self.find_interpolated_objects():
+
+            # If the object was created in the last fixed step
+            if interpolated_object not in self.previous_positions_dict:
+                continue
+
+            self.current_positions_dict[interpolated_object] = interpolated_object.rect.topleft
+            interpolated_position = self.find_interpolated_position(previous_position = self.previous_positions_dict[interpolated_object], current_position = interpolated_object.rect.topleft, alpha = alpha)
+            interpolated_object.rect.topleft = (round(interpolated_position[0]), round(interpolated_position[1]))
+
+        # Camera
+        # Note: The camera position list is changed (rather than replaced), as the player and the boss hold references to it
+        self.current_camera_position = None
+        if self.game.camera.position != 0 and self.previous_camera_position != None:
+            self.current_camera_position = tuple(self.game.camera.position)
+            self.game.camera.position[0], self.game.camera.position[1] = self.find_interpolated_position(previous_position = self.previous_camera_position, current_position = self.current_camera_position, alpha = alpha)
+
+    def move_to_current_positions(self):
+
+        # Moves the objects and the camera back to their current positions (after the game has been drawn)
+        for interpolated_object, current_position in self.current_positions_dict.items():
+            interpolated_object.rect.topleft = current_position
+        self.current_positions_dict = {}
+
+        if self.current_camera_position != None:
+            self.game.camera.position[0], self.game.camera.position[1] = self.current_camera_position
+            self.current_camera_position = None
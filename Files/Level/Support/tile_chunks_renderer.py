@@ -0,0 +1,156 @@
+from Global.settings import TILE_SIZE
+
+from pygame import Surface as pygame_Surface
+
+class TileChunksRenderer:
+
+    # The number of tiles along each side of a chunk
+    chunk_size_in_tiles = 16
+
+    # The colour used as the colour key for chunks (i.e. the parts of a chunk which do not contain a tile of that layer)
+    chunk_colour_key = (255, 0, 255)
+
+    def __init__(self, surface):
+
+        # Surface that the chunks are drawn onto
+        self.surface = surface
+
+        # The width and height of each chunk in pixels
+        self.chunk_size = TileChunksRenderer.chunk_size_in_tiles * TILE_SIZE
+
+        # Create the layers of chunks
+        self.create_layers()
+
+    def create_layers(self):
+
+        # Creates the layers of chunks
+        """ Notes:
+        - The world tiles (including building tiles) and the empty tiles are separate layers so that they can still be drawn separately (e.g. the boss divebomb circles should be drawn over the empty tiles but under the world tiles)
+        - "ChunkTiles" is used to find the tiles inside a chunk when re-baking it, without having to loop through every tile in the tile map
+        - "DirtyChunks" holds the chunks that need to be re-baked before they are next drawn
+        """
+        self.layers_dict = {
+                            "WorldTiles": {"ChunkTiles": {}, "ChunkSurfaces": {}, "DirtyChunks": {}},
+                            "EmptyTiles": {"ChunkTiles": {}, "ChunkSurfaces": {}, "DirtyChunks": {}}
+                            }
+
+    def find_chunk(self, tile):
+
+        # Returns the chunk (column, row) that a tile is inside of
+        return (tile.rect.x // self.chunk_size, tile.rect.y // self.chunk_size)
+
+    def bake_chunks(self, world_tiles_dict, empty_tiles_dict):
+
+        # Bakes all of the chunks for the world tiles and empty tiles from scratch
+        # Note: Called when the tile map is created and when the level is reset
+
+        # Remove any existing chunks
+        self.create_layers()
+
+        # Add all of the world tiles and empty tiles to their layers
+        for world_tile in world_tiles_dict.keys():
+            self.add_tile(layer = "WorldTiles", tile = world_tile)
+
+        for empty_tile in empty_tiles_dict.keys():
+            self.add_tile(layer = "EmptyTiles", tile = empty_tile)
+
+        # Bake all of the chunks now, so that the first frame drawn does not have to bake the entire tile map
+        for layer in self.layers_dict.keys():
+            self.bake_dirty_chunks(layer = layer)
+
+    def add_tile(self, layer, tile):
+
+        # Adds a tile to a layer, and marks the chunk it is inside of to be re-baked
+
+        # Find the chunk that the tile is inside of
+        chunk = self.find_chunk(tile = tile)
+
+        # If there are no tiles in this chunk yet, create a dictionary for the tiles in this chunk
+        if chunk not in self.layers_dict[layer]["ChunkTiles"]:
+            self.layers_dict[layer]["ChunkTiles"][chunk] = {}
+
+        # Add the tile to the chunk
+        self.layers_dict[layer]["ChunkTiles"][chunk][tile] = 0
+
+        # Mark the chunk to be re-baked
+        self.layers_dict[layer]["DirtyChunks"][chunk] = 0
+
+    def remove_tile(self, layer, tile):
+
+        # Removes a tile from a layer, and marks the chunk it was inside of to be re-baked
+
+        # Find the chunk that the tile is inside of
+        chunk = self.find_chunk(tile = tile)
+
+        # If the tile is inside this chunk
+        if chunk in self.layers_dict[layer]["ChunkTiles"] and tile in self.layers_dict[layer]["ChunkTiles"][chunk]:
+            # Remove the tile from the chunk
+            self.layers_dict[layer]["ChunkTiles"][chunk].pop(tile)
+
+            # Mark the chunk to be re-baked
+            self.layers_dict[layer]["DirtyChunks"][chunk] = 0
+
+    def bake_dirty_chunks(self, layer):
+
+        # Re-bakes all of the chunks in a layer that have been changed since they were last drawn
+
+        for chunk in self.layers_dict[layer]["DirtyChunks"].keys():
+
+            # If there are no tiles left inside this chunk
+            if len(self.layers_dict[layer]["ChunkTiles"].get(chunk, {})) == 0:
+                # Remove the chunk surface (if it exists), as there is nothing to draw
+                self.layers_dict[layer]["ChunkSurfaces"].pop(chunk, None)
+                continue
+
+            # If a surface has not been created for this chunk yet
+            if chunk not in self.layers_dict[layer]["ChunkSurfaces"]:
+                # Create the chunk surface
+                chunk_surface = pygame_Surface((self.chunk_size, self.chunk_size)).convert()
+                chunk_surface.set_colorkey(TileChunksRenderer.chunk_colour_key)
+                self.layers_dict[layer]["ChunkSurfaces"][chunk] = chunk_surface
+
+            # Otherwise, reuse the existing chunk surface
+            else:
+                chunk_surface = self.layers_dict[layer]["ChunkSurfaces"][chunk]
+
+            # Clear the chunk surface
+            chunk_surface.fill(TileChunksRenderer.chunk_colour_key)
+
+            # Draw each tile inside the chunk onto the chunk surface (relative to the top-left of the chunk)
+            chunk_surface.blits(
+                                blit_sequence = tuple((tile.image, (tile.rect.x - (chunk[0] * self.chunk_size), tile.rect.y - (chunk[1] * self.chunk_size))) for tile in self.layers_dict[layer]["ChunkTiles"][chunk].keys()),
+                                doreturn = False
+                                )
+
+        # Empty the dirty chunks dictionary
+        self.layers_dict[layer]["DirtyChunks"] = {}
+
+    def draw_layer(self, layer, camera_position):
+
+        # Draws all of the chunks in a layer that are within view of the camera (i.e. on the screen)
+
+        # If any chunks have been changed since they were last drawn, re-bake them
+        if len(self.layers_dict[layer]["DirtyChunks"]) > 0:
+            self.bake_dirty_chunks(layer = layer)
+
+        # Round the camera position once, so that every chunk is offset by the same whole number of pixels
+        # Note: Otherwise, pygame would truncate each chunk's position separately, which can leave 1 pixel seams between chunks when the camera position is not a whole number
+        camera_x = int(round(camera_position[0]))
+        camera_y = int(round(camera_position[1]))
+
+        # Find the range of chunks that are within view of the camera
+        first_chunk_column = camera_x // self.chunk_size
+        last_chunk_column = (camera_x + self.surface.get_width()) // self.chunk_size
+        first_chunk_row = camera_y // self.chunk_size
+        last_chunk_row = (camera_y + self.surface.get_height()) // self.chunk_size
+
+        # Draw all of the chunks within view of the camera
+        self.surface.blits(
+                            blit_sequence = tuple(
+                                                (self.layers_dict[layer]["ChunkSurfaces"][(chunk_column, chunk_row)], ((chunk_column * self.chunk_size) - camera_x, (chunk_row * self.chunk_size) - camera_y))
+                                                for chunk_column in range(first_chunk_column, last_chunk_column + 1)
+                                                for chunk_row in range(first_chunk_row, last_chunk_row + 1)
+                                                if (chunk_column, chunk_row) in self.layers_dict[layer]["ChunkSurfaces"]
+                                                ),
+                            doreturn = False
+                            )
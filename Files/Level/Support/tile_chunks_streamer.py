@@ -0,0 +1,147 @@
+from Global.settings import TILE_SIZE, TILE_CHUNKS_LOADING_MARGIN, TILE_CHUNKS_UNLOADING_MARGIN
+
+from Level.Objects.world_objects import WorldTile
+from Level.Support.tile_chunks_renderer import TileChunksRenderer
+
+from pygame import Rect as pygame_Rect
+
+class TileChunksStreamer:
+
+    # Creates the tiles of the tile map only for the chunks near the camera and near active objects (the player, the boss, building tiles and bamboo piles), and removes the tiles of chunks that are far away
+    """ Notes:
+    - The tile map (a NumPy array of tile numbers) is kept for the entire level, so the tiles of a chunk can be created again whenever the chunk is loaded again
+    - The chunks are the same as the chunks of the tile chunks renderer, so unloading a chunk also removes its baked surface
+    - Chunks are loaded within TILE_CHUNKS_LOADING_MARGIN chunks of the camera's view / active objects, but only unloaded once they are further than TILE_CHUNKS_UNLOADING_MARGIN chunks (so that chunks on the edge are not loaded and unloaded repeatedly)
+    - Chunks with building tiles or bamboo piles inside of them are never unloaded, as the empty tiles that they replaced must be restored when they are removed
+    """
+
+    def __init__(self, game):
+
+        # Attribute that references the Game object
+        self.game = game
+
+        # The number of tiles along each side of a chunk and the width and height of each chunk in pixels (The same as the chunks of the tile chunks renderer)
+        self.chunk_size_in_tiles = TileChunksRenderer.chunk_size_in_tiles
+        self.chunk_size = self.chunk_size_in_tiles * TILE_SIZE
+
+        # The tile map and the number of chunks along each side of the tile map
+        self.tile_map = None
+        self.number_of_chunk_columns = 0
+        self.number_of_chunk_rows = 0
+
+        # Dictionary holding the tiles created for each loaded chunk
+        """ Format:
+        self.loaded_chunks_dict[(chunk_column, chunk_row)] = {"WorldTiles": [world_tile, ...], "EmptyTiles": [empty_tile, ...]}
+        """
+        self.loaded_chunks_dict = {}
+
+    def set_tile_map(self, tile_map):
+
+        # Sets the tile map that the tiles are created from, removing the tiles of any loaded chunks
+        for chunk in tuple(self.loaded_chunks_dict.keys()):
+            self.unload_chunk(chunk = chunk)
+
+        self.tile_map = tile_map
+        self.game.tile_registry.set_size(number_of_rows = tile_map.shape[0], number_of_columns = tile_map.shape[1])
+        self.number_of_chunk_columns = -(-tile_map.shape[1] // self.chunk_size_in_tiles)
+        self.number_of_chunk_rows = -(-tile_map.shape[0] // self.chunk_size_in_tiles)
+
+    def find_chunks_near_rect(self, rect, margin, chunks_found_dict):
+
+        # Adds the chunks that are within the margin (in chunks) of the rect to the dictionary of chunks found (Limited to the chunks inside of the tile map)
+        for chunk_column in range(max(0, (rect.left // self.chunk_size) - margin), min(self.number_of_chunk_columns - 1, (rect.right // self.chunk_size) + margin) + 1):
+            for chunk_row in range(max(0, (rect.top // self.chunk_size) - margin), min(self.number_of_chunk_rows - 1, (rect.bottom // self.chunk_size) + margin) + 1):
+                chunks_found_dict[(chunk_column, chunk_row)] = 0
+
+    def find_active_rects(self):
+
+        # Returns the rects of the camera's view and the active objects, that the chunks near them should be loaded for
+
+        # The camera's view (Centered on the player if the camera has not been positioned yet)
+        if self.game.camera.position == 0:
+            camera_view_rect = pygame_Rect((0, 0), self.game.scaled_surface.get_size())
+            camera_view_rect.center = self.game.player.rect.center
+        else:
+            camera_view_rect = pygame_Rect((int(self.game.camera.position[0]), int(self.game.camera.position[1])), self.game.scaled_surface.get_size())
+
+        active_rects_list = [camera_view_rect, self.game.player.rect]
+
+        # The current boss
+        if self.game.boss_group.sprite != None:
+            active_rects_list.append(self.game.boss_group.sprite.rect)
+
+        # The building tiles and the bamboo piles (which have replaced empty tiles)
+        active_rects_list.extend(building_tile.rect for building_tile in self.game.tile_registry.building_tiles_dict.keys())
+        active_rects_list.extend(bamboo_pile.rect for bamboo_pile in self.game.bamboo_piles_group)
+
+        return active_rects_list
+
+    def update(self):
+
+        # Loads the chunks near the camera / active objects that have not been loaded, and unloads the loaded chunks that are far away from them
+
+        # Find the chunks that should be loaded, and the chunks that should stay loaded
+        chunks_to_load_dict = {}
+        chunks_to_keep_dict = {}
+        for active_rect in self.find_active_rects():
+            self.find_chunks_near_rect(rect = active_rect, margin = TILE_CHUNKS_LOADING_MARGIN, chunks_found_dict = chunks_to_load_dict)
+            self.find_chunks_near_rect(rect = active_rect, margin = TILE_CHUNKS_UNLOADING_MARGIN, chunks_found_dict = chunks_to_keep_dict)
+
+        # Unload the chunks that are far away
+        for chunk in tuple(self.loaded_chunks_dict.keys()):
+            if chunk not in chunks_to_keep_dict:
+                self.unload_chunk(chunk = chunk)
+
+        # Load the chunks that are nearby
+        for chunk in chunks_to_load_dict.keys():
+            if chunk not in self.loaded_chunks_dict:
+                self.load_chunk(chunk = chunk)
+
+        # Remove any projectiles that are outside of the loaded chunks (as there are no tiles for them to collide with, they would otherwise never be removed)
+        self.game.bamboo_projectiles_group.remove(*(bamboo_projectile for bamboo_projectile in self.game.bamboo_projectiles_group if self.is_position_loaded(position = bamboo_projectile.rect.center) == False))
+        if hasattr(self.game, "chilli_projectiles_dict") == True:
+            for chilli_projectile in tuple(chilli_projectile for chilli_projectile in self.game.chilli_projectiles_dict.keys() if self.is_position_loaded(position = chilli_projectile.rect.center) == False):
+                self.game.chilli_projectiles_dict.pop(chilli_projectile)
+
+    def is_position_loaded(self, position):
+
+        # Returns whether a position is inside of a loaded chunk
+        return (int(position[0] // self.chunk_size), int(position[1] // self.chunk_size)) in self.loaded_chunks_dict
+
+    def load_chunk(self, chunk):
+
+        # Creates the world tiles and empty tiles of a chunk from the tile map, adding them to the tile registry
+        chunk_tiles_dict = {"WorldTiles": [], "EmptyTiles": []}
+
+        # The first row and column of the chunk inside of the tile map
+        first_row = chunk[1] * self.chunk_size_in_tiles
+        first_column = chunk[0] * self.chunk_size_in_tiles
+
+        # For each tile number inside of the chunk (Converted to a list so that each tile number is a Python int)
+        for row_index, row in enumerate(self.tile_map[first_row:first_row + self.chunk_size_in_tiles, first_column:first_column + self.chunk_size_in_tiles].tolist(), start = first_row):
+            for column_index, tile_map_object in enumerate(row, start = first_column):
+
+                # Identify the tile map object
+                match tile_map_object:
+
+                    # Empty tiles
+                    case 0:
+                        empty_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.game.tile_images[0])
+                        self.game.tile_registry.add_tile(tile = empty_tile, tile_type = "EmptyTile")
+                        chunk_tiles_dict["EmptyTiles"].append(empty_tile)
+
+                    # World tiles
+                    case 1 | 2 | 3:
+                        world_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.game.tile_images[tile_map_object])
+                        self.game.tile_registry.add_tile(tile = world_tile, tile_type = "WorldTile")
+                        chunk_tiles_dict["WorldTiles"].append(world_tile)
+
+        self.loaded_chunks_dict[chunk] = chunk_tiles_dict
+
+    def unload_chunk(self, chunk):
+
+        # Removes the world tiles and empty tiles of a chunk from the tile registry
+        chunk_tiles_dict = self.loaded_chunks_dict.pop(chunk)
+
+        for tile in chunk_tiles_dict["WorldTiles"] + chunk_tiles_dict["EmptyTiles"]:
+            self.game.tile_registry.remove_tile(tile = tile)
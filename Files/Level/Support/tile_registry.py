@@ -0,0 +1,308 @@
+from Global.settings import TILE_SIZE
+
+from math import dist
+
+from numpy import zeros as numpy_zeros
+from numpy import full as numpy_full
+from numpy import uint8 as numpy_uint8
+from numpy import int8 as numpy_int8
+from numpy import int32 as numpy_int32
+
+class TileRegistry:
+
+    # Holds the state of every cell of the tile map (the type of tile, the lives of building tiles and the tile inside of the cell), and keeps the world tiles group, the tile chunks renderer and the tile dictionaries up to date when tiles are placed / removed
+    """ Notes:
+    - Each cell holds a handle to the tile inside of it (an index into self.tiles_list) rather than the tile itself, so that the cells can be stored in NumPy arrays
+    - The handle of the empty tile that each building tile / bamboo pile replaced is kept (in a dictionary, as there are only a few at one time), so that the empty tile can be restored without creating a new one
+    - self.world_tiles_dict, self.empty_tiles_dict and self.building_tiles_dict are views of the cells that the draw and collision code use (e.g. with collidedict), they should only be changed through the registry
+    - Placing, removing and looking up a tile only uses the tile's cell, so it does not depend on the number of tiles
+    """
+
+    # The type of tile inside of a cell (Cells that have not been loaded by the tile chunks streamer are "Unloaded")
+    tile_types_tuple = ("Unloaded", "EmptyTile", "WorldTile", "BuildingTile", "BambooPile")
+    tile_type_numbers_dict = {tile_type: tile_type_number for tile_type_number, tile_type in enumerate(tile_types_tuple)}
+
+    def __init__(self, tile_chunks_renderer, world_tiles_group):
+
+        # The tile chunks renderer and the world tiles group that tiles are added to / removed from
+        self.tile_chunks_renderer = tile_chunks_renderer
+        self.world_tiles_group = world_tiles_group
+
+        # Views of the cells (Format: {world_tile / building_tile: "WorldTile" / "BuildingTile"}, {empty_tile: 0} and {building_tile: 0} in the order they were placed)
+        self.world_tiles_dict = {}
+        self.empty_tiles_dict = {}
+        self.building_tiles_dict = {}
+
+        # Create the cells (Resized when the tile map is created)
+        self.set_size(number_of_rows = 0, number_of_columns = 0)
+
+    def set_size(self, number_of_rows, number_of_columns):
+
+        # Creates the cells for a tile map of this size, removing any existing tiles
+        self.number_of_rows = number_of_rows
+        self.number_of_columns = number_of_columns
+
+        # The type of tile, the lives of the building tile and the handle of the tile inside of each cell (-1 = no tile)
+        self.tile_types = numpy_zeros((number_of_rows, number_of_columns), dtype = numpy_uint8)
+        self.tile_lives = numpy_zeros((number_of_rows, number_of_columns), dtype = numpy_int8)
+        self.tile_handles = numpy_full((number_of_rows, number_of_columns), -1, dtype = numpy_int32)
+
+        # The handles of the empty tiles replaced by building tiles / bamboo piles (Format: {(column, row): handle})
+        self.replaced_tile_handles_dict = {}
+
+        # The tiles that the handles refer to, and the handles that are no longer used (which are reused before self.tiles_list is extended)
+        self.tiles_list = []
+        self.free_handles_list = []
+
+        # Empty the views (The same dictionaries are kept, as other objects hold references to them)
+        self.world_tiles_dict.clear()
+        self.empty_tiles_dict.clear()
+        self.building_tiles_dict.clear()
+
+    # ---------------------------------------------------------------------------------
+    # Handles
+
+    def create_handle(self, tile):
+
+        # Returns a new handle for a tile
+        if len(self.free_handles_list) > 0:
+            handle = self.free_handles_list.pop()
+            self.tiles_list[handle] = tile
+        else:
+            handle = len(self.tiles_list)
+            self.tiles_list.append(tile)
+
+        return handle
+
+    def release_handle(self, handle):
+
+        # Releases a handle so that it can be used for another tile
+        self.tiles_list[handle] = None
+        self.free_handles_list.append(handle)
+
+    # ---------------------------------------------------------------------------------
+    # Lookups
+
+    def find_cell(self, tile):
+
+        # Returns the cell (column, row) that a tile is inside of
+        return (tile.rect.x // TILE_SIZE, tile.rect.y // TILE_SIZE)
+
+    def find_cell_at_position(self, position):
+
+        # Returns the cell (column, row) that a position in the world is inside of
+        return (int(position[0] // TILE_SIZE), int(position[1] // TILE_SIZE))
+
+    def find_tile_at_position(self, position, tile_type):
+
+        # Returns the tile of this type at a position in the world (None if the tile at the position is not of this type)
+        cell = self.find_cell_at_position(position = position)
+
+        if self.find_tile_type(cell = cell) != tile_type:
+            return None
+        return self.find_tile(cell = cell)
+
+    def find_building_tiles_within_distance(self, position, distance):
+
+        # Returns a list of the building tiles whose centers are within the distance of a position in the world
+        """ Note: Only the cells inside the square around the circle are checked, so the cost depends on the distance and not the size of the tile map """
+
+        # The cells inside the square around the circle (Limited to the tile map)
+        first_column = max(0, int((position[0] - distance) // TILE_SIZE))
+        last_column = min(self.number_of_columns - 1, int((position[0] + distance) // TILE_SIZE))
+        first_row = max(0, int((position[1] - distance) // TILE_SIZE))
+        last_row = min(self.number_of_rows - 1, int((position[1] + distance) // TILE_SIZE))
+
+        # If the square is outside of the tile map
+        if first_column > last_column or first_row > last_row:
+            return []
+
+        # The handles of the cells with building tiles inside of the square
+        tile_types_square = self.tile_types[first_row:last_row + 1, first_column:last_column + 1]
+        building_tile_handles = self.tile_handles[first_row:last_row + 1, first_column:last_column + 1][tile_types_square == TileRegistry.tile_type_numbers_dict["BuildingTile"]].tolist()
+
+        # Only keep the building tiles whose centers are within the distance
+        return [self.tiles_list[handle] for handle in building_tile_handles if dist(position, self.tiles_list[handle].rect.center) <= distance]
+
+    def find_tile_type(self, cell):
+
+        # Returns the type of tile inside of a cell ("Unloaded" for cells outside of the tile map)
+        if (0 <= cell[0] < self.number_of_columns and 0 <= cell[1] < self.number_of_rows) == False:
+            return "Unloaded"
+        return TileRegistry.tile_types_tuple[self.tile_types[cell[1], cell[0]]]
+
+    def find_tile(self, cell):
+
+        # Returns the tile inside of a cell (None if there is no tile or the cell is outside of the tile map)
+        if (0 <= cell[0] < self.number_of_columns and 0 <= cell[1] < self.number_of_rows) == False:
+            return None
+
+        handle = self.tile_handles[cell[1], cell[0]]
+        return self.tiles_list[handle] if handle != -1 else None
+
+    def find_tiles_near_rect(self, rect, distance):
+
+        # Returns a dictionary of all the world tiles and building tiles whose centers are within the rect extended by the distance in each direction
+        """ Notes:
+        - Only the cells that overlap the extended rect are checked, so the cost depends on the size of the rect and not the size of the tile map
+        - The tiles are in the same order as they were in the world tiles dictionary before tiles were streamed in chunks (world tiles row by row, in the order they were created from the tile map, then building tiles in the order they were placed)
+          This keeps the order that collidedict finds colliding tiles in (and so the tile that an object is pushed out of) the same
+        """
+
+        # The extended rect's boundaries
+        left = rect.left - distance
+        right = rect.right + distance
+        top = rect.top - distance
+        bottom = rect.bottom + distance
+
+        # The cells that overlap the extended rect (Limited to the tile map)
+        first_column = max(0, int(left // TILE_SIZE))
+        last_column = min(self.number_of_columns - 1, int(right // TILE_SIZE))
+        first_row = max(0, int(top // TILE_SIZE))
+        last_row = min(self.number_of_rows - 1, int(bottom // TILE_SIZE))
+
+        # Dictionary to hold the tiles found
+        tiles_found_dict = {}
+
+        # If the extended rect is outside of the tile map
+        if first_column > last_column or first_row > last_row:
+            return tiles_found_dict
+
+        # The types and handles of the cells, row by row (Converted to lists so that each cell is a Python int)
+        tile_types_list = self.tile_types[first_row:last_row + 1, first_column:last_column + 1].tolist()
+        tile_handles_list = self.tile_handles[first_row:last_row + 1, first_column:last_column + 1].tolist()
+        world_tile_type_number = TileRegistry.tile_type_numbers_dict["WorldTile"]
+        building_tile_type_number = TileRegistry.tile_type_numbers_dict["BuildingTile"]
+
+        # Whether any building tiles are inside of the extended rect's cells
+        building_tiles_found = False
+
+        for row_tile_types, row_tile_handles in zip(tile_types_list, tile_handles_list):
+            for tile_type_number, handle in zip(row_tile_types, row_tile_handles):
+
+                # If this cell has a world tile whose center is within the extended rect, add it to the tiles found
+                if tile_type_number == world_tile_type_number:
+                    tile = self.tiles_list[handle]
+                    if (left <= tile.rect.centerx <= right) and (top <= tile.rect.centery <= bottom):
+                        tiles_found_dict[tile] = 0
+
+                elif tile_type_number == building_tile_type_number:
+                    building_tiles_found = True
+
+        # If there are building tiles inside of the extended rect's cells, add the ones whose centers are within the extended rect (in the order they were placed)
+        # Note: All of the building tiles are checked, as the player can only have a few at one time (see "MaximumNumberOfTilesAtOneTime")
+        if building_tiles_found == True:
+            for building_tile in self.building_tiles_dict.keys():
+                if (left <= building_tile.rect.centerx <= right) and (top <= building_tile.rect.centery <= bottom):
+                    tiles_found_dict[building_tile] = 0
+
+        return tiles_found_dict
+
+    # ---------------------------------------------------------------------------------
+    # World tiles and empty tiles (Created from the tile map by the tile chunks streamer)
+
+    def add_tile(self, tile, tile_type):
+
+        # Adds a world tile or an empty tile to its cell
+        column, row = self.find_cell(tile = tile)
+        self.tile_types[row, column] = TileRegistry.tile_type_numbers_dict[tile_type]
+        self.tile_handles[row, column] = self.create_handle(tile = tile)
+
+        if tile_type == "WorldTile":
+            self.world_tiles_dict[tile] = "WorldTile"
+            self.world_tiles_group.add(tile)
+            self.tile_chunks_renderer.add_tile(layer = "WorldTiles", tile = tile)
+        else:
+            self.empty_tiles_dict[tile] = 0
+            self.tile_chunks_renderer.add_tile(layer = "EmptyTiles", tile = tile)
+
+    def remove_tile(self, tile):
+
+        # Removes a world tile or an empty tile from its cell (Building tiles and bamboo piles, and the empty tiles they replaced, are left inside their cells)
+        column, row = self.find_cell(tile = tile)
+
+        match TileRegistry.tile_types_tuple[self.tile_types[row, column]]:
+
+            case "WorldTile":
+                self.world_tiles_dict.pop(tile)
+                self.world_tiles_group.remove(tile)
+                self.tile_chunks_renderer.remove_tile(layer = "WorldTiles", tile = tile)
+
+            case "EmptyTile":
+                self.empty_tiles_dict.pop(tile)
+                self.tile_chunks_renderer.remove_tile(layer = "EmptyTiles", tile = tile)
+
+            case _:
+                return
+
+        self.release_handle(handle = int(self.tile_handles[row, column]))
+        self.tile_types[row, column] = TileRegistry.tile_type_numbers_dict["Unloaded"]
+        self.tile_handles[row, column] = -1
+
+    # ---------------------------------------------------------------------------------
+    # Building tiles and bamboo piles (Which replace empty tiles)
+
+    def replace_empty_tile(self, empty_tile, new_tile, tile_type):
+
+        # Replaces an empty tile with a building tile / bamboo pile, keeping the handle of the empty tile so that it can be restored
+        column, row = self.find_cell(tile = empty_tile)
+        self.empty_tiles_dict.pop(empty_tile)
+        self.tile_chunks_renderer.remove_tile(layer = "EmptyTiles", tile = empty_tile)
+
+        self.replaced_tile_handles_dict[(column, row)] = int(self.tile_handles[row, column])
+        self.tile_handles[row, column] = self.create_handle(tile = new_tile)
+        self.tile_types[row, column] = TileRegistry.tile_type_numbers_dict[tile_type]
+
+    def restore_empty_tile(self, replacing_tile):
+
+        # Replaces a building tile / bamboo pile with the empty tile that it replaced
+        column, row = self.find_cell(tile = replacing_tile)
+        self.release_handle(handle = int(self.tile_handles[row, column]))
+
+        handle = self.replaced_tile_handles_dict.pop((column, row))
+        self.tile_handles[row, column] = handle
+        self.tile_types[row, column] = TileRegistry.tile_type_numbers_dict["EmptyTile"]
+        self.tile_lives[row, column] = 0
+
+        empty_tile = self.tiles_list[handle]
+        self.empty_tiles_dict[empty_tile] = 0
+        self.tile_chunks_renderer.add_tile(layer = "EmptyTiles", tile = empty_tile)
+
+    def place_building_tile(self, empty_tile, building_tile):
+
+        # Replaces an empty tile with a building tile
+        self.replace_empty_tile(empty_tile = empty_tile, new_tile = building_tile, tile_type = "BuildingTile")
+        column, row = self.find_cell(tile = building_tile)
+        self.tile_lives[row, column] = building_tile.lives
+
+        self.world_tiles_dict[building_tile] = "BuildingTile"
+        self.building_tiles_dict[building_tile] = 0
+        self.world_tiles_group.add(building_tile)
+        self.tile_chunks_renderer.add_tile(layer = "WorldTiles", tile = building_tile)
+
+    def remove_building_tile(self, building_tile):
+
+        # Replaces a building tile with the empty tile that it replaced
+        self.world_tiles_dict.pop(building_tile)
+        self.building_tiles_dict.pop(building_tile)
+        self.world_tiles_group.remove(building_tile)
+        self.tile_chunks_renderer.remove_tile(layer = "WorldTiles", tile = building_tile)
+
+        self.restore_empty_tile(replacing_tile = building_tile)
+
+    def damage_building_tile(self, building_tile):
+
+        # Takes one life away from a building tile, returning the number of lives it has left
+        column, row = self.find_cell(tile = building_tile)
+        self.tile_lives[row, column] -= 1
+        return int(self.tile_lives[row, column])
+
+    def place_bamboo_pile(self, empty_tile, bamboo_pile):
+
+        # Replaces an empty tile with a bamboo pile (The bamboo pile is drawn in place of the empty tile)
+        self.replace_empty_tile(empty_tile = empty_tile, new_tile = bamboo_pile, tile_type = "BambooPile")
+
+    def remove_bamboo_pile(self, bamboo_pile):
+
+        # Replaces a bamboo pile with the empty tile that it replaced
+        self.restore_empty_tile(replacing_tile = bamboo_pile)
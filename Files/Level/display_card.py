@@ -1,5 +1,6 @@
 from Global.functions import draw_text
 from Global.settings import BAR_ALPHA_LEVEL
+from Global.texture_atlas import blit_images
 
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import line as pygame_draw_line
@@ -188,10 +189,10 @@ class DisplayCard:
         dy = inner_body_rect.centery - (self.image.get_height() / 2)
 
         # Blit the icon image at the center of the second alpha surface
-        self.second_alpha_surface.blit(
-                        self.image, 
-                        ((dx, dy))
-                        )
+        blit_images(
+                    surface = self.second_alpha_surface, 
+                    blit_sequence = ((self.image, (dx, dy)),)
+                    )
         
         # Draw the display card number
         draw_text(
@@ -214,11 +215,22 @@ class DisplayCard:
                                         self.rect.y + inner_body_rect.y + self.extra_information_dict["starting_position_from_inner_rect"][1]
                                     )
 
-        # Draw the building tile image 
-        self.surface.blit(self.images[0], building_tile_image_position)
+        # Position of the bamboo resource image (underneath the building tile image)
+        bamboo_resource_image_position = (
+                    building_tile_image_position[0],
+                    building_tile_image_position[1] + self.images_size[1][1] + self.extra_information_dict["spacing_y_between_stats"])
+
+        # Draw the building tile image and the bamboo resource image (with one call)
+        blit_images(
+                    surface = self.surface, 
+                    blit_sequence = (
+                                    (self.images[0], building_tile_image_position),
+                                    (self.images[1], bamboo_resource_image_position)
+                                    )
+                    )
 
         # The text that displays how many building tiles exist inside the map currently
-        existing_building_tiles_text = f'Number of tiles: {len(player_tools["BuildingTool"]["ExistingBuildingTilesList"])}/{player_tools["BuildingTool"]["MaximumNumberOfTilesAtOneTime"]}'
+        existing_building_tiles_text = f'Number of tiles: {len(player_tools["BuildingTool"]["ExistingBuildingTilesDict"])}/{player_tools["BuildingTool"]["MaximumNumberOfTilesAtOneTime"]}'
 
         # Draw the text displaying the number of building tiles that exist inside the map currently
         draw_text(
@@ -234,13 +246,6 @@ class DisplayCard:
         # -----------------------------------------------------------------
         # Drawing the amount of bamboo resource that the player has (used for ammo and building tiles)
 
-        bamboo_resource_image_position = (
-                    building_tile_image_position[0],
-                    building_tile_image_position[1] + self.images_size[1][1] + self.extra_information_dict["spacing_y_between_stats"])
-
-        # Building tile image 
-        self.surface.blit(self.images[1], bamboo_resource_image_position)
-
         # The text that displays how much bamboo resource the player has
         amount_of_bamboo_resource_text = f'Bamboo: {player_gameplay_info_dict["AmountOfBambooResource"]} / {player_gameplay_info_dict["MaximumAmountOfBambooResource"]}'
         # Save the text inside the dictionary so that the effect text can be positioned randomly across the text 
@@ -2,6 +2,12 @@ class EffectText:
 
     # effect_text_group = []
 
+    # Dictionary holding the alpha surfaces of effect text that has been removed, so that they can be re-used by new effect text with the same size
+    """ Format:
+    alpha_surfaces_pool_dict[(width, height)] = [alpha_surface, alpha_surface, ...]
+    """
+    alpha_surfaces_pool_dict = {}
+
     def __init__(self, x, y, colour, display_time, text, font, alpha_surface, alpha_level, type_of_effect_text):
 
         # Colour of the text
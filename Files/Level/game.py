@@ -1,25 +1,29 @@
-from Global.settings import TILE_SIZE, screen_height, screen_width
+from Global.settings import TILE_SIZE, screen_height, screen_width, SCALED_SURFACE_PRESENTATION_MODE, USE_FIXED_TIMESTEP
+from Global.functions import create_rotated_images_dict
+from Global.input_recorder import mouse_get_pressed as input_mouse_get_pressed
+from Global.dirty_rects import mark_full_screen_dirty
+from Global.asset_manager import load_image, request_sound, list_asset_directory, prefetch_asset, prefetch_asset_directory
 
 from Level.Player.player import Player
 from Level.game_ui import GameUI
 from Level.Objects.world_objects import BambooPile
-from Level.Objects.world_objects import WorldTile
+from Level.Objects.projectiles import BambooProjectile, ChilliProjectile
 from Level.Support.objects_collision_detector import ObjectCollisionDetector
 from Level.Support.camera import Camera
 from Level.Support.boss_spawner import BossSpawner
+from Level.Support.tile_chunks_renderer import TileChunksRenderer
+from Level.Support.tile_registry import TileRegistry
+from Level.Support.tile_chunks_streamer import TileChunksStreamer
+from Level.Support.render_interpolator import RenderInterpolator
 
 from random import choice as random_choice
 from math import sin, cos, dist, atan2, degrees, pi
-from os import listdir as os_listdir
 
 from pygame import Surface as pygame_Surface
 from pygame.display import get_surface as pygame_display_get_surface
 from pygame.sprite import Group as pygame_sprite_Group
 from pygame.sprite import GroupSingle as pygame_sprite_GroupSingle
-from pygame.image import load as pygame_image_load
 from pygame.transform import scale as pygame_transform_scale
-from pygame.mixer import Sound as pygame_mixer_Sound
-from pygame.mouse import get_pressed as pygame_mouse_get_pressed
 
 
 class Game:
@@ -28,10 +32,27 @@ class Game:
         # Screen
         self.screen = pygame_display_get_surface()  
 
+        # Start decoding the images of the player, the player's tools and the game UI, so that they have been decoded by the time the level is loaded (whilst the menus are being shown)
+        # Note: Only the images that the level loads are prefetched (e.g. not the images in "graphics/Misc" used by the menus or loaded when the game is imported), as anything prefetched but never loaded would be decoded for nothing
+        for asset_directory in ("graphics/Player", "graphics/Weapons", "graphics/Misc/DeathAnimation"):
+            prefetch_asset_directory(directory = asset_directory)
+        for asset_path in ("graphics/Misc/BambooResource.png", "graphics/Misc/IntroText1.png", "graphics/Misc/IntroText2.png"):
+            prefetch_asset(path = asset_path)
+
         # Create a surface for which all objects will be drawn onto. This surface is then scaled and drawn onto the main screen
         self.scale_multiplier = 2
         self.scaled_surface = pygame_Surface((screen_width / self.scale_multiplier, screen_height / self.scale_multiplier))
 
+        # How the scaled surface is scaled onto the screen (see draw_scaled_surface)
+        # Note: Scaling straight into the screen requires the screen to have the same pixel format as the scaled surface, otherwise the buffer is used
+        self.presentation_mode = SCALED_SURFACE_PRESENTATION_MODE
+        if self.presentation_mode == "Direct" and self.screen.get_bitsize() != self.scaled_surface.get_bitsize():
+            self.presentation_mode = "Buffer"
+
+        # The surface that the scaled surface is scaled into when using the buffer (Created once instead of every frame)
+        if self.presentation_mode == "Buffer":
+            self.presentation_buffer = pygame_Surface((screen_width, screen_height))
+
         # Attribute which is monitored by the game states controller (Set to True when the player enters the game)
         self.running = False
 
@@ -47,6 +68,9 @@ class Game:
         # Load the tile map images
         self.load_tile_map_images()
 
+        # Create the tile chunks renderer (The tiles are pre-rendered into chunks, which are drawn instead of each individual tile)
+        self.tile_chunks_renderer = TileChunksRenderer(surface = self.scaled_surface)
+
         # --------------------------------------------------------------------------------------
         # Camera
 
@@ -60,15 +84,22 @@ class Game:
 
         # --------------------------------------------------------------------------------------
         # Groups
-        self.world_tiles_dict = {} # Dictionary used to hold all the world tiles 
         self.world_tiles_group = pygame_sprite_Group()
+        self.tile_registry = TileRegistry(tile_chunks_renderer = self.tile_chunks_renderer, world_tiles_group = self.world_tiles_group) # Registry holding the tile inside of each cell of the tile map (Used to place / remove tiles and to find neighbouring tiles without looping through every world tile)
+        self.world_tiles_dict = self.tile_registry.world_tiles_dict # Dictionary used to hold all the world tiles (Only the world tiles of the loaded chunks)
         # self.player_group = pygame_sprite_GroupSingle(self.player) This was created inside the create_objects_tile_map method
         self.bamboo_projectiles_group = pygame_sprite_Group() # Group for all bamboo projectiles for the player
-        self.empty_tiles_dict = {} # Dictionary used to hold all of the empty tiles in the tile map
+        self.empty_tiles_dict = self.tile_registry.empty_tiles_dict # Dictionary used to hold all of the empty tiles in the tile map (Only the empty tiles of the loaded chunks)
         self.bamboo_piles_group = pygame_sprite_Group()
         self.boss_group = pygame_sprite_GroupSingle()
         # self.stomp_attack_nodes_group
 
+        # Create the tile chunks streamer (The tiles are only created for the chunks near the camera and active objects)
+        self.tile_chunks_streamer = TileChunksStreamer(game = self)
+
+        # Create the render interpolator (When the game is updated in fixed steps, the player, the boss, the projectiles and the camera are drawn between their positions before and after the last step)
+        self.render_interpolator = RenderInterpolator(game = self)
+
         # --------------------------------------------------------------------------------------
         # Boss and player guidelines
 
@@ -82,9 +113,14 @@ class Game:
         self.guidelines_surface.set_alpha(self.guidelines_surface_default_alpha_level)
 
         # ---------------------------------------------------------------------------------
-        # Cursor images
+        # Projectile images
 
-        self.default_cursor_image = pygame_image_load("graphics/Cursors/Default.png").convert_alpha()
+        # Create the rotated images of the projectiles at every angle step (so that spawning a projectile does not need to rotate its image)
+        BambooProjectile.RotatedImagesDict = {
+                                            "Default": create_rotated_images_dict(image = BambooProjectile.projectile_image, scale = BambooProjectile.projectile_image_scale),
+                                            "Launcher": create_rotated_images_dict(image = BambooProjectile.launcher_projectile_image, scale = BambooProjectile.projectile_image_scale)
+                                            }
+        ChilliProjectile.RotatedImagesDict = create_rotated_images_dict(image = ChilliProjectile.chilli_image, scale = ChilliProjectile.projectile_image_scale)
 
         # --------------------------------------------------------------------------------------
         # Bamboo piles
@@ -93,18 +129,13 @@ class Game:
         # Note: number of segments depends on how many number of piles there can be at one time
         self.bamboo_piles_segments_taken_dict = {i: i for i in range(0, BambooPile.bamboo_pile_info_dict["MaximumNumberOfPilesAtOneTime"])}
 
-        # Dictionary to hold replaced empty tiles 
-        """Format:
-        self.replaced_empty_tiles_dict[bamboo_pile] = empty_tile
-        self.player.sprite_groups[ReplacedEmptyTiles][building_tile] = empty_tile
-        """
-        self.replaced_empty_tiles_dict = {}
-
         # --------------------------------------------------------------------------------------
         # Sound
 
         # [Sound, Timer]
-        self.sounds_dictionary = {os_listdir("sounds")[i].strip(".wav"): [pygame_mixer_Sound(f"sounds/{os_listdir('sounds')[i]}"), None] for i in range(0, len(os_listdir("sounds")))}
+        # Note: All of the sounds are requested before any are resolved, so that they are decoded at the same time
+        sound_handles_dict = {sound_file_name.strip(".wav"): request_sound(path = f"sounds/{sound_file_name}") for sound_file_name in list_asset_directory(directory = "sounds")}
+        self.sounds_dictionary = {sound_name: [sound_handle.resolve(), None] for sound_name, sound_handle in sound_handles_dict.items()}
         self.sound_cooldown_timer = None
 
         # Adjusting volume
@@ -145,7 +176,7 @@ class Game:
         if self.player.player_gameplay_info_dict["CanStartOperating"] == True:
 
             # If the player is trying to shoot or build and they have enough bamboo resourcesas
-            if pygame_mouse_get_pressed()[0] == True and \
+            if input_mouse_get_pressed()[0] == True and \
                 self.player.player_gameplay_info_dict["AmountOfBambooResource"] - self.player.tools[players_current_tool]["BambooResourceDepletionAmount"]> 0:
 
                 # If the player is trying to shoot
@@ -200,7 +231,7 @@ class Game:
         # Loads the images of all the world tiles
 
         # Create a dictionary filled with all of the tiles' images
-        self.tile_images = {int(os_listdir("graphics/Tiles")[i].strip(".png")): pygame_image_load(f"graphics/Tiles/{os_listdir('graphics/Tiles')[i]}").convert() for i in range(0, len(os_listdir("graphics/Tiles")))} 
+        self.tile_images = {int(tile_file_name.strip(".png")): load_image(path = f"graphics/Tiles/{tile_file_name}", conversion = "Opaque") for tile_file_name in list_asset_directory(directory = "graphics/Tiles")} 
 
     def create_objects_tile_map(self, non_transformed_tile_map):
 
@@ -211,67 +242,39 @@ class Game:
         # Used so that the divebomb mechanic for the golden monkey boss doesn't result in him being spawned inside a tile)
         self.tile_map = non_transformed_tile_map
 
-        # For all rows of objects in the tile map
-        for row_index, row in enumerate(non_transformed_tile_map):
-            # For each item in each row
-            for column_index, tile_map_object in enumerate(row):
-                
-                # -------------------------------------------------
-                # If this is the tile in the middle of the tile map
-                """ Note: This is used for calculating the spawning locations of the bamboo piles"""
-                if row_index == int(len(non_transformed_tile_map) / 2) and column_index == int(len(non_transformed_tile_map[row_index]) / 2):
-                    # Set this to be the middle tile position
-                    self.middle_tile_position = (column_index * TILE_SIZE, row_index * TILE_SIZE)
-
-                    # Create the player
-                    self.player = Player(
-                                        x = (column_index * TILE_SIZE), 
-                                        y = (row_index * TILE_SIZE), 
-                                        surface = self.scaled_surface, 
-                                        sprite_groups = {"WorldTiles": self.world_tiles_group, "BambooProjectiles": self.bamboo_projectiles_group, "ReplacedEmptyTiles": self.replaced_empty_tiles_dict}
-                                        )
+        # The tile in the middle of the tile map
+        """ Note: This is used for calculating the spawning locations of the bamboo piles"""
+        middle_row_index = int(len(non_transformed_tile_map) / 2)
+        middle_column_index = int(len(non_transformed_tile_map[middle_row_index]) / 2)
+        self.middle_tile_position = (middle_column_index * TILE_SIZE, middle_row_index * TILE_SIZE)
 
-                    # Add the player to its group
-                    self.player_group = pygame_sprite_GroupSingle(self.player)
+        # The player spawns on the middle tile, so the middle tile must be an empty tile (so that the player can place a building tile on that tile)
+        non_transformed_tile_map[middle_row_index][middle_column_index] = 0
 
-        
-                    # Create an empty tile where the player spawned (so that the player can place a building tile on that tile)
-                    empty_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.tile_images[0])
-                    self.empty_tiles_dict[empty_tile] = 0
-
-                # Identify the tile map object
-                match tile_map_object:
-                    
-                    # Empty tiles
-                    case 0:     
-                        
-                        # Create an empty tile where the player spawned (so that the player can place a building tile on that tile)
-                        empty_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.tile_images[0])
-                        self.empty_tiles_dict[empty_tile] = 0
-                        
-                    # World tile 1
-                    case _ if tile_map_object == 1 or tile_map_object == 2 or tile_map_object == 3:
-
-                        # Create a world tile
-                        world_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.tile_images[tile_map_object])
-
-                        # Add the world tile to the world tiles dictionary
-                        # The key is the world tile because we use pygame.rect.collidedict in other areas of the code, the value is the type of world tile (The other type is building tiles)
-                        self.world_tiles_dict[world_tile] = "WorldTile"
-
-                        # Add it to the group of world tiles (For collisions with other objects, excluding the player)
-                        self.world_tiles_group.add(world_tile)
+        # Create the player
+        self.player = Player(
+                            x = (middle_column_index * TILE_SIZE), 
+                            y = (middle_row_index * TILE_SIZE), 
+                            surface = self.scaled_surface, 
+                            sprite_groups = {"WorldTiles": self.world_tiles_group, "BambooProjectiles": self.bamboo_projectiles_group}
+                            )
 
+        # Add the player to its group
+        self.player_group = pygame_sprite_GroupSingle(self.player)
 
         # Save the last tile position so that we can update the camera and limit the player's movement
         self.last_tile_position = [len(non_transformed_tile_map[0]) * TILE_SIZE, len(non_transformed_tile_map) * TILE_SIZE]
         self.player.last_tile_position = self.last_tile_position
 
-        # Save a copy of the world tiles dict for the player, this is for updating the world tiles dict when building tiles are created.
-        self.player.world_tiles_dict = self.world_tiles_dict
+        # Save a reference to the tile registry for the player, so that the player can find the tiles under the mouse and building tiles can be placed / removed
+        self.player.tile_registry = self.tile_registry
+
+        # The player's existing building tiles are the building tiles inside the tile registry
+        self.player.tools["BuildingTool"]["ExistingBuildingTilesDict"] = self.tile_registry.building_tiles_dict
 
-        # Save a copy of the empty tiles dict for the player, allowing the player to see which tiles can be replaced with building tiles
-        self.player.empty_tiles_dict = self.empty_tiles_dict
+        # Create the world tiles and empty tiles of the chunks around the player (which are added to the tile registry and baked into the tile chunks)
+        self.tile_chunks_streamer.set_tile_map(tile_map = non_transformed_tile_map)
+        self.tile_chunks_streamer.update()
 
         # Set the camera mode 
         self.camera.set_mode()
@@ -300,27 +303,13 @@ class Game:
 
     def draw_empty_tiles(self):
         
-        # Draws the empty tiles
-
-        for empty_tile in self.empty_tiles_dict.keys():
-            # If the empty tile is within view of the camera (i.e. on the screen)
-            if self.camera.position[0] - TILE_SIZE <= empty_tile.rect.x <= (self.camera.position[0] + (self.scaled_surface.get_width())) + TILE_SIZE and \
-                self.camera.position[1] - TILE_SIZE <= empty_tile.rect.y <= (self.camera.position[1] + (self.scaled_surface.get_height())) + TILE_SIZE:
-                
-                # Draw the empty tile onto the screen
-                empty_tile.draw(surface = self.scaled_surface, x = (empty_tile.rect.x - self.camera.position[0]), y = (empty_tile.rect.y - self.camera.position[1])) 
+        # Draws the empty tiles (Only the chunks within view of the camera are drawn)
+        self.tile_chunks_renderer.draw_layer(layer = "EmptyTiles", camera_position = self.camera.position)
 
     def draw_world_tiles(self):
 
-        # Draws the world tiles
-
-        for tile in self.world_tiles_dict.keys():
-            # If the tile object is within view of the camera (i.e. on the screen)
-            if self.camera.position[0] - TILE_SIZE <= tile.rect.x <= (self.camera.position[0] + (self.scaled_surface.get_width())) + TILE_SIZE and \
-                self.camera.position[1] - TILE_SIZE <= tile.rect.y <= (self.camera.position[1] + (self.scaled_surface.get_height())) + TILE_SIZE:
-                
-                # Draw the world / building tile onto the screen
-                tile.draw(surface = self.scaled_surface, x = (tile.rect.x - self.camera.position[0]), y = (tile.rect.y - self.camera.position[1]))         
+        # Draws the world tiles and building tiles (Only the chunks within view of the camera are drawn)
+        self.tile_chunks_renderer.draw_layer(layer = "WorldTiles", camera_position = self.camera.position)
 
     def draw_tiles(self):
         
@@ -383,44 +372,45 @@ class Game:
         # pygame.draw.line(self.scaled_surface, "pink", ((self.player.rect.left - TILE_SIZE) * 1 - self.camera.position[0], 0 - self.camera.position[1]), ((self.player.rect.left - TILE_SIZE) * 1 - self.camera.position[0], screen_height))
         # pygame.draw.line(self.scaled_surface, "pink", ((self.player.rect.right + TILE_SIZE) * 1 - self.camera.position[0], 0 - self.camera.position[1]), ((self.player.rect.right + TILE_SIZE) * 1 - self.camera.position[0], screen_height))
 
-        # For each tile in the world tiles dictionary (Can be a building tile or a world tile)
-        for tile in self.world_tiles_dict.keys():
+        # ------------------------------------------------------------------------
+        # Player
+
+        # Find the tiles within 2 tiles of the player (horizontally and vertically) (Can be a building tile or a world tile)
+        self.update_neighbouring_tiles(
+                                    neighbouring_tiles_dict = self.player.neighbouring_tiles_dict, 
+                                    tiles_found_dict = self.tile_registry.find_tiles_near_rect(rect = self.player.rect, distance = TILE_SIZE * 2)
+                                    )
 
+        # ------------------------------------------------------------------------
+        # Bosses
 
-            # ------------------------------------------------------------------------
-            # Player
+        # If there is a current boss that has been spawned
+        if self.boss_group.sprite != None:
 
-            # If the tile is within 2 tiles of the player (horizontally and vertically)
-            if (self.player.rect.left  - (TILE_SIZE * 2) <= tile.rect.centerx <= self.player.rect.right + (TILE_SIZE * 2)) and (self.player.rect.top - (TILE_SIZE * 2) <= tile.rect.centery <= (self.player.rect.bottom + TILE_SIZE * 2)):
-                # Add it to the player's neighbouring tiles dictionary
-                self.player.neighbouring_tiles_dict[tile] = 0 
+            # Find the world tiles within 3 tiles of the current boss (horizontally and vertically)
+            # Note: Building tiles are not included, as the boss destroys building tiles when colliding with them
+            self.update_neighbouring_tiles(
+                                        neighbouring_tiles_dict = self.boss_group.sprite.neighbouring_tiles_dict, 
+                                        tiles_found_dict = {
+                                                            tile: 0 for tile in self.tile_registry.find_tiles_near_rect(rect = self.boss_group.sprite.rect, distance = TILE_SIZE * 3).keys()
+                                                            if self.world_tiles_dict[tile] != "BuildingTile"
+                                                            }
+                                        )
 
-            # If the tile is not within 2 tiles of the player (horizontally and vertically)
-            else:
-                # If the tile is inside the player's neighbouring tiles dict's keys
-                if tile in self.player.neighbouring_tiles_dict.keys():
-                    # Remove the world/ building tile from the player's neighbouring tiles dictionary
-                    self.player.neighbouring_tiles_dict.pop(tile)
-                    
-            # ------------------------------------------------------------------------
-            # Bosses
+    def update_neighbouring_tiles(self, neighbouring_tiles_dict, tiles_found_dict):
 
-            # If there is a current boss that has been spawned
-            if self.boss_group.sprite != None:
+        # Updates a neighbouring tiles dictionary with the tiles found near an object
+        # Note: Tiles that were already neighbouring tiles keep their position in the dictionary and new tiles are added to the end, which keeps the order that collidedict finds colliding tiles in
+
+        # Remove the tiles that are no longer near the object
+        for tile in tuple(neighbouring_tiles_dict.keys()):
+            if tile not in tiles_found_dict:
+                neighbouring_tiles_dict.pop(tile)
+
+        # Add the tiles that are now near the object
+        for tile in tiles_found_dict.keys():
+            neighbouring_tiles_dict[tile] = 0
 
-                # If the tile is within 2 tiles of the current boss (horizontally and vertically)
-                if (self.boss_group.sprite.rect.left  - (TILE_SIZE * 3) <= tile.rect.centerx <= self.boss_group.sprite.rect.right + (TILE_SIZE * 3)) and (self.boss_group.sprite.rect.top - (TILE_SIZE * 3) <= tile.rect.centery <= (self.boss_group.sprite.rect.bottom + TILE_SIZE * 3)):
-                    
-                    if self.world_tiles_dict[tile] != "BuildingTile":
-                        # Add it to the current boss' neighbouring tiles dictionary
-                        self.boss_group.sprite.neighbouring_tiles_dict[tile] = 0 
-                # If the tile is not within 2 tiles of the current boss (horizontally and vertically)
-                else:
-                    # If the tile is inside the current boss' neighbouring tiles dict's keys
-                    if tile in self.boss_group.sprite.neighbouring_tiles_dict.keys():
-                        # Remove the world/ building tile from the current boss' neighbouring tiles dictionary
-                        self.boss_group.sprite.neighbouring_tiles_dict.pop(tile)
-                        
     def spawn_bamboo_pile(self, delta_time):
 
         # ----------------------------------------------------------------------------
@@ -464,6 +454,10 @@ class Game:
                                                                     BambooPile.bamboo_pile_info_dict["MaximumSpawningDistanceFromMiddle"]
                                                                     )
 
+                # If none of the empty tiles are a valid distance away from the middle of the tile map (only the empty tiles of the loaded chunks are inside the empty tiles dict), try again on the next frame
+                if len(valid_distance_away_from_player_tiles_list) == 0:
+                    return
+
                 # If there are no bamboo piles already
                 if len(self.bamboo_piles_group) == 0:
                         
@@ -485,11 +479,8 @@ class Game:
                     # Set the current segment chosen to be taken
                     self.bamboo_piles_segments_taken_dict[segment] = new_bamboo_pile
 
-                    # Save the empty tile in the replaced empty tiles dict so that we do not need to create a new empty tile every time a bamboo pile is spawned / removed
-                    self.replaced_empty_tiles_dict[new_bamboo_pile] = valid_tile
-
-                    # Remove the empty tile from the empty tiles dict
-                    self.empty_tiles_dict.pop(valid_tile)
+                    # Replace the empty tile with the bamboo pile inside the tile registry (The empty tile is kept so that we do not need to create a new empty tile every time a bamboo pile is spawned / removed)
+                    self.tile_registry.place_bamboo_pile(empty_tile = valid_tile, bamboo_pile = new_bamboo_pile)
 
                 # If there are any existing bamboo piles
                 elif len(self.bamboo_piles_group) > 0:
@@ -554,6 +545,10 @@ class Game:
                     # --------------------------------------------------------------------------------------------------------
                     # Select a random tile from this new segment 
 
+                    # If there are no empty tiles in this segment (i.e. the segment is not inside the loaded chunks), try again on the next frame
+                    if len(possible_tiles) == 0:
+                        return
+
                     random_spawning_tile = random_choice(possible_tiles)
 
                     # --------------------------------------------------------------------------------------------------------  
@@ -572,11 +567,8 @@ class Game:
                     # Set the current segment selected as taken
                     self.bamboo_piles_segments_taken_dict[random_segment] = new_bamboo_pile
 
-                    # Save the empty tile in the replaced empty tiles dict so that we do not need to create a new empty tile every time a bamboo pile is spawned / removed
-                    self.replaced_empty_tiles_dict[new_bamboo_pile] = random_spawning_tile
-
-                    # Remove the empty tile from the empty tiles dict
-                    self.empty_tiles_dict.pop(random_spawning_tile)
+                    # Replace the empty tile with the bamboo pile inside the tile registry (The empty tile is kept so that we do not need to create a new empty tile every time a bamboo pile is spawned / removed)
+                    self.tile_registry.place_bamboo_pile(empty_tile = random_spawning_tile, bamboo_pile = new_bamboo_pile)
 
     # -------------------------------------------
     # Bosses
@@ -626,37 +618,26 @@ class Game:
 
             # Run the boss
             self.boss_group.sprite.run()
+
+    def draw_boss(self):
+
+        # Draws the current boss (The boss is updated in update_and_run_boss)
+
+        # Update the current boss' camera position 
+        self.boss_group.sprite.camera_position = self.camera.position
+
+        # Draw the boss
+        self.boss_group.sprite.draw_boss()
     
-    def draw_boss_guidelines(self, delta_time):
+    def update_boss_guidelines(self, delta_time):
+
+        # Updates the blinking visual effect of the boss guidelines (and the targeting animation duration) for the SikaDeer boss
 
         # If the current boss is the "SikaDeer"
         if self.boss_spawner.bosses_dict["CurrentBoss"] == "SikaDeer":
 
-            # If the current action is neither "Target" or "Charge"
-            if self.boss_group.sprite.current_action != "Target" and self.boss_group.sprite.current_action != "Charge":
-                # Draw guidelines between the player and the boss
-                self.game_ui.draw_guidelines_between_a_and_b(
-                                                            a = self.boss_group.sprite.rect.center, 
-                                                            b = self.player.rect.center, 
-                                                            colour = "white",
-                                                            camera_position = self.camera.position, 
-                                                            guidelines_segments_thickness = self.guidelines_segments_thickness,
-                                                            guidelines_surface = self.guidelines_surface,
-                                                            main_surface = self.scaled_surface
-                                                            )
             # If the current action is "Target"
-            elif self.boss_group.sprite.current_action == "Target":
-
-                # Draw red dashed guidelines between the player and the boss
-                self.game_ui.draw_guidelines_between_a_and_b(
-                                                            a = self.boss_group.sprite.rect.center, 
-                                                            b = self.player.rect.center, 
-                                                            colour = "red",
-                                                            camera_position = self.camera.position, 
-                                                            guidelines_segments_thickness = self.guidelines_segments_thickness,
-                                                            guidelines_surface = self.guidelines_surface,
-                                                            main_surface = self.scaled_surface
-                                                            )
+            if self.boss_group.sprite.current_action == "Target":
 
                 # The new angle time gradient in relation to the current time left
                 self.boss_group.sprite.behaviour_patterns_dict["Target"]["BlinkingVisualEffectAngleTimeGradient"] = (self.boss_group.sprite.behaviour_patterns_dict["Target"]["BlinkingVisualEffectAngleChange"] - 0) / (self.boss_group.sprite.behaviour_patterns_dict["DurationTimer"] / 1000)
@@ -689,6 +670,40 @@ class Game:
                     # Reset the current sin angle for the blinking visual effect back to 0
                     self.boss_group.sprite.behaviour_patterns_dict["Target"]["BlinkingVisualEffectCurrentSinAngle"]
 
+    def draw_boss_guidelines(self):
+
+        # If the current boss is the "SikaDeer"
+        if self.boss_spawner.bosses_dict["CurrentBoss"] == "SikaDeer":
+
+            # If the current action is neither "Target" or "Charge"
+            if self.boss_group.sprite.current_action != "Target" and self.boss_group.sprite.current_action != "Charge":
+                # Draw guidelines between the player and the boss
+                self.game_ui.draw_guidelines_between_a_and_b(
+                                                            a = self.boss_group.sprite.rect.center, 
+                                                            b = self.player.rect.center, 
+                                                            colour = "white",
+                                                            camera_position = self.camera.position, 
+                                                            guidelines_segments_thickness = self.guidelines_segments_thickness,
+                                                            guidelines_surface = self.guidelines_surface,
+                                                            main_surface = self.scaled_surface
+                                                            )
+            # If the current action is "Target"
+            elif self.boss_group.sprite.current_action == "Target":
+
+                # Draw red dashed guidelines between the player and the boss
+                self.game_ui.draw_guidelines_between_a_and_b(
+                                                            a = self.boss_group.sprite.rect.center, 
+                                                            b = self.player.rect.center, 
+                                                            colour = "red",
+                                                            camera_position = self.camera.position, 
+                                                            guidelines_segments_thickness = self.guidelines_segments_thickness,
+                                                            guidelines_surface = self.guidelines_surface,
+                                                            main_surface = self.scaled_surface
+                                                            )
+
+            # If the current action is "Charge"
+            elif self.boss_group.sprite.current_action == "Charge":
+
                 # Calculate a new length and point depending on where the angle at which the boss is charging at 
                 # Note: (Extends the line from the current position of the boss and last locked in position of the player)
                 new_length = dist(self.boss_group.sprite.behaviour_patterns_dict["Charge"]["PlayerPosAtChargeTime"], self.boss_group.sprite.rect.center) + screen_width / 2
@@ -1020,29 +1035,10 @@ class Game:
         # ------------------------------------------------------
         # Building tiles
 
-        # Find building tiles and remove them from the world tiles dict and the world tiles group
-        # Note: Once removed, all empty tiles will be re-added
-
-        # If there are any existing building tiles
-        if len(self.player.tools["BuildingTool"]["ExistingBuildingTilesList"]) > 0:
-
-            # For each building tile
-            for building_tile_to_remove in self.player.tools["BuildingTool"]["ExistingBuildingTilesList"]:
-
-                # Replace the building tile with an empty tile
-                self.empty_tiles_dict[self.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
-
-                # Remove the building tile from the replaced empty tiles dict
-                self.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
-
-                # Remove the building tile from the world tiles group
-                self.world_tiles_group.remove(building_tile_to_remove)
-
-                # Remove the building tile from the world tiles list
-                self.world_tiles_dict.pop(building_tile_to_remove)
-
-            # Empty the player's existing building tiles list
-            self.player.tools["BuildingTool"]["ExistingBuildingTilesList"] = []
+        # Replace each building tile with the empty tile it replaced
+        # Note: A tuple is created as the building tiles dict is changed whilst removing the building tiles
+        for building_tile_to_remove in tuple(self.tile_registry.building_tiles_dict.keys()):
+            self.tile_registry.remove_building_tile(building_tile = building_tile_to_remove)
 
         # ------------------------------------------------------
         # Resetting player position
@@ -1053,14 +1049,12 @@ class Game:
         # More on bamboo piles
 
         self.bamboo_piles_segments_taken_dict = {i: i for i in range(0, BambooPile.bamboo_pile_info_dict["MaximumNumberOfPilesAtOneTime"])}
-        """ Note:
-        self.replaced_empty_tiles_dict and self.player.replaced_empty_tiles_dict will both be reset as the bamboo piles and existing building tiles will be replaced with empty tiles"""
-        # If there are any bamboo piles (meaning that there must be bamboo piles inside self.replaced_empty_tiles_dict)
+        # If there are any bamboo piles
         if len(self.bamboo_piles_group) > 0:
             # For all bamboo piles
             for bamboo_pile in self.bamboo_piles_group:
-                # Replace the bamboo pile with an empty tile
-                self.empty_tiles_dict[self.replaced_empty_tiles_dict[bamboo_pile]] = 0
+                # Replace the bamboo pile with the empty tile it replaced
+                self.tile_registry.remove_bamboo_pile(bamboo_pile = bamboo_pile)
 
                 # Remove the bamboo pile from the bamboo piles group
                 self.bamboo_piles_group.remove(bamboo_pile)
@@ -1080,7 +1074,31 @@ class Game:
             # Empty the dict
             self.chilli_projectiles_dict = {}
 
-    def run(self, delta_time):
+    def draw_scaled_surface(self):
+
+        # Scales the scaled surface up to the size of the screen and draws it onto the screen (so the entire screen has changed)
+        # Note: Both modes avoid creating a new screen-sized surface every frame (The scale multiplier is a whole number, so the scaling is a nearest-neighbour pixel duplication)
+
+        match self.presentation_mode:
+
+            # Scale straight into the screen
+            case "Direct":
+                pygame_transform_scale(surface = self.scaled_surface, size = (screen_width, screen_height), dest_surface = self.screen)
+
+            # Scale into the buffer and draw the buffer onto the screen
+            case "Buffer":
+                pygame_transform_scale(surface = self.scaled_surface, size = (screen_width, screen_height), dest_surface = self.presentation_buffer)
+                self.screen.blit(self.presentation_buffer, (0, 0))
+
+        mark_full_screen_dirty()
+
+    def update(self, delta_time):
+
+        # Updates the game by one step (Nothing is drawn here, the game is drawn in draw)
+
+        # If the game is updated in fixed steps, record the positions before this step (so that the game can be drawn between the positions before and after the step)
+        if USE_FIXED_TIMESTEP == True:
+            self.render_interpolator.record_previous_positions()
         
         # -----------------------------------------------------------
         # Sound
@@ -1091,9 +1109,6 @@ class Game:
         # Update the sound cooldown timers for each sound
         self.update_sound_cooldown_timers(delta_time = delta_time)
 
-        # Fill the scaled surface with a colour
-        self.scaled_surface.fill((20, 20, 20)) # (15, 16, 8)
-
         # Check if the player has just "died"
         if self.player.player_gameplay_info_dict["CurrentHealth"] <= 0:
             
@@ -1140,6 +1155,9 @@ class Game:
                 # Update the camera position depending on who the focus subject is
                 self.camera.update_position(delta_time = delta_time, focus_subject_center_pos = self.camera.update_focus_subject())
 
+                # Load the chunks of tiles near the camera and active objects, and unload the chunks that are far away
+                self.tile_chunks_streamer.update()
+
                 # If the player has finished the introduction
                 if hasattr(self.game_ui, "introduction_box_dict") == True and self.game_ui.introduction_box_dict["IntroductionCompleted"] == True:
                     # Look for input to spawn the boss
@@ -1157,6 +1175,101 @@ class Game:
                 # Find the neighbouring tiles for the player and the current boss
                 self.find_neighbouring_tiles()
 
+            # ---------------------------------------------------------
+            # Hierarchy of updating (The same order that the objects are drawn in)
+
+            # If there is no boss
+            if self.boss_group.sprite == None:
+
+                # If a valid spawning position has been found and a boss has not been spawned yet
+                if hasattr(self.boss_spawner, "bosses_dict") and self.boss_spawner.bosses_dict["ValidSpawningPosition"] != None and len(self.boss_group) == 0:
+                    # Update the spawning effect and call spawn boss method
+                    self.boss_spawner.update_spawning_effect_and_call_spawn_boss(delta_time = delta_time)
+
+                # Update the angled polygon visual effects
+                self.game_ui.update_angled_polygons_effects(delta_time = delta_time)
+
+                # Run the player methods
+                self.player.run(delta_time = delta_time)
+            
+            # If the current boss is alive
+            if self.boss_group.sprite != None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
+
+                # If the player is also alive
+                if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
+
+                    # Update the boss guidelines' visual effect
+                    self.update_boss_guidelines(delta_time = delta_time)
+
+                    # If the current boss is the "GoldenMonkey"
+                    if self.boss_spawner.bosses_dict["CurrentBoss"] == "GoldenMonkey":
+
+                        # If they are currently targeting the player for a divebomb attack
+                        if self.boss_group.sprite.current_action == "DiveBomb" and self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["CurrentDiveBombStage"] == "Target":
+                            # Update the divebomb circles
+                            self.boss_group.sprite.update_divebomb_circles(delta_time = delta_time)
+
+                        # If there are shockwave circles (After the boss has just landed after performing a dive bomb attack)
+                        if self.boss_group.sprite.dive_bomb_attack_controller.shockwave_circle_alive_timer != None:
+                            # Update the shockwave circles
+                            self.boss_group.sprite.update_shockwave_circles(delta_time = delta_time)
+
+                    # Run the player methods
+                    self.player.run(delta_time = delta_time)
+
+                    # Update and run the boss
+                    self.update_and_run_boss(delta_time = delta_time)
+                    
+                    # Update the angled polygon visual effects
+                    self.game_ui.update_angled_polygons_effects(delta_time = delta_time)
+
+                # If the player is not alive
+                elif self.player.player_gameplay_info_dict["CurrentHealth"] <= 0:
+
+                    # Run the player methods
+                    self.player.run(delta_time = delta_time)
+
+                    # If the boss' image is not the starting image
+                    # Note: This is to set the image of the boss to be them standing still and upright
+                    if self.boss_group.sprite.image != self.boss_group.sprite.starting_image:
+                        # Set their image as the starting image
+                        self.boss_group.sprite.image =  self.boss_group.sprite.starting_image
+
+            # If the current boss is not alive
+            elif self.boss_group.sprite != None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] <= 0:
+
+                # Update and run the boss
+                self.update_and_run_boss(delta_time = delta_time)
+
+                # Update the angled polygon visual effects
+                self.game_ui.update_angled_polygons_effects(delta_time = delta_time)
+
+                # Run the player methods
+                self.player.run(delta_time = delta_time)
+            
+            # ---------------------------------------------------------
+
+            # Update the game UI
+            self.update_game_ui(delta_time = delta_time)
+            self.game_ui.update()
+
+        # Update the guide text
+        self.game_ui.update_guide_text(delta_time = delta_time)
+
+    def draw(self, delta_time):
+
+        # Draws the game (Called once for every frame that is displayed, after the game has been updated)
+        """ Notes: 
+        - The delta time is the time since the last frame was displayed, which is only used for visual effects (e.g. the effect text and the guide text) 
+        - Nothing that affects the game (or uses the random number generator) is changed here, so that the game is the same regardless of how often it is drawn
+        """
+
+        # Fill the scaled surface with a colour
+        self.scaled_surface.fill((20, 20, 20)) # (15, 16, 8)
+
+        # If the game is not over
+        if self.game_over == False:
+
             # ---------------------------------------------------------
             # Hierarchy of drawing 
 
@@ -1171,17 +1284,17 @@ class Game:
 
                 # If a valid spawning position has been found and a boss has not been spawned yet
                 if hasattr(self.boss_spawner, "bosses_dict") and self.boss_spawner.bosses_dict["ValidSpawningPosition"] != None and len(self.boss_group) == 0:
-                    # Draw the spawning effect and call spawn boss method
-                    self.boss_spawner.draw_spawning_effect_and_call_spawn_boss(delta_time = delta_time)
+                    # Draw the spawning effect
+                    self.boss_spawner.draw_spawning_effect()
 
                 # Draw the angled polygon visual effects
-                self.game_ui.draw_angled_polygons_effects(camera_position = self.camera.position, delta_time = delta_time)
+                self.game_ui.draw_angled_polygons_effects(camera_position = self.camera.position)
 
-                # Run the player methods
-                self.player.run(delta_time = delta_time)
+                # Draw the player
+                self.player.draw_player()
 
                 # If the current boss is spawning
-                if self.boss_group.sprite == None and hasattr(self.boss_spawner, "bosses_dict") == True and self.boss_spawner.bosses_dict["ValidSpawningPosition"] != None:
+                if hasattr(self.boss_spawner, "bosses_dict") == True and self.boss_spawner.bosses_dict["ValidSpawningPosition"] != None:
                     # Draw guidelines between the player and the boss' spawning location
                     self.game_ui.draw_guidelines_between_a_and_b(
                                                                 a = self.boss_spawner.bosses_dict["ValidSpawningPosition"].rect.center, 
@@ -1194,7 +1307,7 @@ class Game:
                                                                 )
             
             # If the current boss is alive
-            if self.boss_group.sprite != None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
+            elif self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
 
                 # If the player is also alive
                 if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
@@ -1211,19 +1324,19 @@ class Game:
                     self.draw_bamboo_piles()
 
                     # Draw the boss guidelines underneath the player and the boss
-                    self.draw_boss_guidelines(delta_time = delta_time)
+                    self.draw_boss_guidelines()
 
                     # If the current boss is the "GoldenMonkey" and they are currently targeting the player for a divebomb attack
                     if self.boss_spawner.bosses_dict["CurrentBoss"] == "GoldenMonkey":
 
                         if self.boss_group.sprite.current_action == "DiveBomb" and self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["CurrentDiveBombStage"] == "Target":
-                            # Update and draw the divebomb circles UNDER the player
-                            self.boss_group.sprite.update_and_draw_divebomb_circles(delta_time = delta_time)
+                            # Draw the divebomb circles UNDER the player
+                            self.boss_group.sprite.draw_divebomb_circles()
 
                         # If there are shockwave circles to be drawn (After the boss has just landed after performing a dive bomb attack)
                         if self.boss_group.sprite.dive_bomb_attack_controller.shockwave_circle_alive_timer != None:
                             # Draw the shockwave circles
-                            self.boss_group.sprite.draw_shockwave_circles(delta_time = delta_time)
+                            self.boss_group.sprite.draw_shockwave_circles()
 
                     # Draw projectiles OVER the divebomb circles
                     self.draw_bamboo_projectiles()
@@ -1231,14 +1344,14 @@ class Game:
                     # Draw the world tiles
                     self.draw_world_tiles()
 
-                    # Run the player methods
-                    self.player.run(delta_time = delta_time)
+                    # Draw the player
+                    self.player.draw_player()
 
-                    # Update and run the boss
-                    self.update_and_run_boss(delta_time = delta_time)
+                    # Draw the boss
+                    self.draw_boss()
                     
                     # Draw the angled polygon visual effects
-                    self.game_ui.draw_angled_polygons_effects(camera_position = self.camera.position, delta_time = delta_time)
+                    self.game_ui.draw_angled_polygons_effects(camera_position = self.camera.position)
 
                 # If the player is not alive
                 elif self.player.player_gameplay_info_dict["CurrentHealth"] <= 0:
@@ -1249,16 +1362,10 @@ class Game:
                     # Draw tiles and tile map objects inside the tile map / level
                     self.draw_tile_map_objects()
 
-                    # Run the player methods
-                    self.player.run(delta_time = delta_time)
-
-                    # If the boss' image is not the starting image
-                    # Note: This is to set the image of the boss to be them standing still and upright
-                    if self.boss_group.sprite.image != self.boss_group.sprite.starting_image:
-                        # Set their image as the starting image
-                        self.boss_group.sprite.image =  self.boss_group.sprite.starting_image
+                    # Draw the player
+                    self.player.draw_player()
 
-                    # Only draw the boss (Do not update them)
+                    # Only draw the boss (They are not updated whilst the player is not alive)
                     self.boss_group.sprite.draw(
                                                 surface = self.scaled_surface, 
                                                 x = (self.boss_group.sprite.rect.x - ((self.boss_group.sprite.image.get_width() / 2)  - (self.boss_group.sprite.rect.width / 2))) - self.camera.position[0], 
@@ -1266,41 +1373,38 @@ class Game:
                                                     )
 
             # If the current boss is not alive
-            elif self.boss_group.sprite != None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] <= 0:
+            elif self.boss_group.sprite.extra_information_dict["CurrentHealth"] <= 0:
 
                 """ Draws the player over the skull """
 
-
                 # Draw all tiles
                 self.draw_tiles()
 
                 # Draw all objects inside the tile map / level
                 self.draw_tile_map_objects()
 
-                # Update and run the boss
-                self.update_and_run_boss(delta_time = delta_time)
+                # Draw the boss
+                self.draw_boss()
 
                 # Draw the angled polygon visual
-                self.game_ui.draw_angled_polygons_effects(camera_position = self.camera.position, delta_time = delta_time)
+                self.game_ui.draw_angled_polygons_effects(camera_position = self.camera.position)
 
-                # Run the player methods
-                self.player.run(delta_time = delta_time)
+                # Draw the player
+                self.player.draw_player()
             
             # ---------------------------------------------------------
 
-            # Update the game UI
-            self.update_game_ui(delta_time = delta_time)
+            # Set the game UI's delta time to be the time since the last frame was displayed (for the visual effects of the game UI)
+            self.game_ui.delta_time = delta_time
 
             # Run the game UI when the player is alive
             self.game_ui.run(camera_position = self.camera.position)
 
         # Draw the scaled surface onto the screen
-        self.screen.blit(pygame_transform_scale(self.scaled_surface, (screen_width, screen_height)), (0, 0))
+        self.draw_scaled_surface()
 
         # Display the introduction box and text if the player has not seen it yet
         self.game_ui.display_introduction(surface = self.screen)
 
         # Draw the guide text
         self.game_ui.draw_guide_text(surface = self.screen, delta_time = delta_time)
-
-
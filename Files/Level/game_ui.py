@@ -1,5 +1,7 @@
 from Global.settings import TILE_SIZE, BAR_ALPHA_LEVEL
 from Global.functions import draw_text, sin_change_object_colour, move_item_vertically_sin
+from Global.asset_manager import load_image
+from Global.texture_atlas import pack_images, blit_images
 from Level.display_card import DisplayCard
 from Level.effect_text import EffectText
 
@@ -11,7 +13,6 @@ from pygame import Surface as pygame_Surface
 from pygame.font import Font as pygame_font_Font
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import line as pygame_draw_line
-from pygame.image import load as pygame_image_load
 
 
 class GameUI:
@@ -104,7 +105,7 @@ class GameUI:
 
         # A dictionary containing the images for the player stats
         self.stats_images_dict = {
-                        "BambooResource": pygame_image_load("graphics/Misc/BambooResource.png").convert_alpha(),
+                        "BambooResource": load_image(path = "graphics/Misc/BambooResource.png"),
                         "BuildingTiles": self.player_tools["BuildingTool"]["Images"]["TileImage"]
                                  }
 
@@ -183,7 +184,10 @@ class GameUI:
 
         # ------------------------------------------------------------
         # Cursor image
-        self.default_cursor_image = pygame_image_load("graphics/Cursors/Default.png").convert_alpha()
+        self.default_cursor_image = load_image(path = "graphics/Cursors/Default.png")
+
+        # Pack the HUD images into one texture atlas sheet (The building tile image is not packed as it is opaque)
+        self.stats_images_dict, self.default_cursor_image = pack_images(images = (self.stats_images_dict, self.default_cursor_image))
     
         """ 'Hidden' attributes:
 
@@ -278,6 +282,11 @@ class GameUI:
 
         # If there are any effect text in the list
         if len(EffectText.effect_text_list) > 0:
+
+            # Return the alpha surfaces of all the effect text to the pool
+            for effect_text in EffectText.effect_text_list:
+                self.release_effect_text_alpha_surface(alpha_surface = effect_text.alpha_surface)
+
             # Clear the list
             EffectText.effect_text_list = []
 
@@ -286,10 +295,9 @@ class GameUI:
         # Resets visual effects dictionaries
         
         # If there are any angled polygons effects
-        if hasattr(self, "angled_polygons_controller") and len(self.angled_polygons_controller.polygons_dict) > 0:
-            # Empty the dictionary and reset the amount of polygons created
-            self.angled_polygons_controller.polygons_dict = {}
-            self.angled_polygons_controller.polygons_created = 0
+        if hasattr(self, "angled_polygons_controller") and self.angled_polygons_controller.number_of_polygons > 0:
+            # Remove all of the polygons
+            self.angled_polygons_controller.number_of_polygons = 0
     
     # ---------------------------------------------------------------------
     # Display methods
@@ -482,7 +490,7 @@ class GameUI:
             if self.dimensions.get("golden_monkey_energy_indicator") == None:
                 # Load the image and text font and calculate the x and y positions that the image will be blitted at
                 self.dimensions["golden_monkey_energy_indicator"] = {
-                                                                    "Image": pygame_image_load("graphics/Misc/Energy.png").convert_alpha(),
+                                                                    "Image": load_image(path = "graphics/Misc/Energy.png"),
                                                                     "x": self.dimensions["boss_bar"]["x"] + self.dimensions["boss_bar"]["width"],
                                                                     "y": self.dimensions["boss_bar"]["y"] + (self.dimensions["boss_bar"]["height"] / 2),
                                                                     "Font": self.dimensions["boss_bar"]["text_font"],
@@ -611,8 +619,9 @@ class GameUI:
             darker_colour = lambda x: x - 10
 
             # Set the frenzy mode bar colour (A tuple because the bar is made up of two rectangles)
+            # Note: The RGB values are limited to 0 - 255 because the midpoint colour is rounded, so the visual effect colour can be 1 higher than the maximum colour at the peak of the sin wave
             frenzy_mode_bar_colour = (
-                                    self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"], 
+                                    tuple(min(max(self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"][i], 0), 255) for i in range(0, len(self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"]))), 
                                     tuple(min(max(darker_colour(self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"][i]), 0), 255) for i in range(0, len(self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"])))
                                     
                                     )
@@ -735,7 +744,7 @@ class GameUI:
         # Draws the new cursor
 
         # Blit the cursor image at the mouse position, subtracting half of the cursor image's width and height
-        self.surface.blit(self.default_cursor_image, (self.mouse_position[0] - (self.default_cursor_image.get_width()/ 2), self.mouse_position[1]- (self.default_cursor_image.get_height() / 2)))
+        blit_images(surface = self.surface, blit_sequence = ((self.default_cursor_image, (self.mouse_position[0] - (self.default_cursor_image.get_width()/ 2), self.mouse_position[1]- (self.default_cursor_image.get_height() / 2))),))
 
     def draw_camera_pan_bars(self):
 
@@ -863,8 +872,8 @@ class GameUI:
             # Create a dictionary containing info for the introduction box
             self.introduction_box_dict = {
                                                     "Images": (
-                                                                    pygame_image_load("graphics/Misc/IntroText1.png").convert_alpha(),
-                                                                    pygame_image_load("graphics/Misc/IntroText2.png").convert_alpha()
+                                                                    load_image(path = "graphics/Misc/IntroText1.png"),
+                                                                    load_image(path = "graphics/Misc/IntroText2.png")
                                                                     ),
                                                     "IntroductionCompleted": False,
                                                     "IntroductionBoxSize": (700, 800),
@@ -914,12 +923,43 @@ class GameUI:
                         )
                         )
 
+    def update_guide_text(self, delta_time):
+
+        # Updates the display time of the current guide text (There can only be one guide text being drawn at a time)
+        
+        # If there are any guide text to be drawn
+        if len(self.guide_text_list) > 0:
+
+            # If the display time for the current guide text is greater than 0
+            if self.guide_text_dict["DisplayTime"] > 0:
+
+                # If the text isn't the spawn boss text or the congratulations text
+                if self.guide_text_list[0] != self.guide_text_dict["AllGuideTextMessages"]["SpawnBoss"][0] and \
+                    self.guide_text_list[0] != self.guide_text_dict["AllGuideTextMessages"]["GameCompletion"][0]:
+
+                    # Reduce the display time
+                    self.guide_text_dict["DisplayTime"] -= delta_time
+            
+            # If the display time for the current guide text is less than or equal to 0
+            elif self.guide_text_dict["DisplayTime"] <= 0:
+                
+                # Set the display time back to its original value
+                self.guide_text_dict["DisplayTime"] = self.guide_text_dict["OriginalDisplayTime"]
+
+                # Reset the position of the guide text so the next guide text is centered properly
+                self.guide_text_dict["OriginalPosition"] = None
+                self.guide_text_dict["CurrentPosition"] = None
+
+                # Remove the first guide text in the list (i.e. the current one)
+                self.guide_text_list.pop(0)
+
     def draw_guide_text(self, delta_time, surface):
         
         # There can only be one guide text being drawn at a time
+        # Note: The display time is updated in update_guide_text (as the guide text list is checked by the game / boss spawner)
     
         # If there are any guide text to be drawn
-        if len(self.guide_text_list) > 0:
+        if len(self.guide_text_list) > 0 and self.guide_text_dict["DisplayTime"] > 0:
             
             # If an original position has not been set yet
             if self.guide_text_dict["OriginalPosition"] == None:
@@ -945,50 +985,27 @@ class GameUI:
 
 
                 self.guide_text_dict["CurrentPosition"] = [self.guide_text_dict["OriginalPosition"][0], self.guide_text_dict["OriginalPosition"][1]]
-
-            # If the display time for the current guide text is greater than 0
-            if self.guide_text_dict["DisplayTime"] > 0:
                                                     
-                # Change the current position and sin angle
-                self.guide_text_dict["CurrentPosition"], self.guide_text_dict["CurrentSinAngle"] = move_item_vertically_sin(
-                                                                                                                            current_sin_angle = self.guide_text_dict["CurrentSinAngle"],
-                                                                                                                            angle_time_gradient = self.guide_text_dict["AngleTimeGradient"],
-                                                                                                                            displacement = self.guide_text_dict["Displacement"],
-                                                                                                                            original_position = self.guide_text_dict["OriginalPosition"],
-                                                                                                                            current_position = self.guide_text_dict["CurrentPosition"],
-                                                                                                                            delta_time = delta_time,
-
-                                                                                                                            )
-
-                # If the text isn't the spawn boss text or the congratulations text
-                if self.guide_text_list[0] != self.guide_text_dict["AllGuideTextMessages"]["SpawnBoss"][0] and \
-                    self.guide_text_list[0] != self.guide_text_dict["AllGuideTextMessages"]["GameCompletion"][0]:
-
-                    # Reduce the display time
-                    self.guide_text_dict["DisplayTime"] -= delta_time
-
-                # Draw the text onto the surface
-                draw_text(
-                        text = self.guide_text_list[0], 
-                        text_colour = "white", 
-                        font = self.guide_text_dict["Font"],
-                        x = self.guide_text_dict["CurrentPosition"][0],
-                        y = self.guide_text_dict["CurrentPosition"][1],
-                        surface = surface
-                        )
-            
-            # If the display time for the current guide text is less than or equal to 0
-            elif self.guide_text_dict["DisplayTime"] <= 0:
-                
-                # Set the display time back to its original value
-                self.guide_text_dict["DisplayTime"] = self.guide_text_dict["OriginalDisplayTime"]
-
-                # Reset the position of the guide text so the next guide text is centered properly
-                self.guide_text_dict["OriginalPosition"] = None
-                self.guide_text_dict["CurrentPosition"] = None
-
-                # Remove the first guide text in the list (i.e. the current one)
-                self.guide_text_list.pop(0)
+            # Change the current position and sin angle
+            self.guide_text_dict["CurrentPosition"], self.guide_text_dict["CurrentSinAngle"] = move_item_vertically_sin(
+                                                                                                                        current_sin_angle = self.guide_text_dict["CurrentSinAngle"],
+                                                                                                                        angle_time_gradient = self.guide_text_dict["AngleTimeGradient"],
+                                                                                                                        displacement = self.guide_text_dict["Displacement"],
+                                                                                                                        original_position = self.guide_text_dict["OriginalPosition"],
+                                                                                                                        current_position = self.guide_text_dict["CurrentPosition"],
+                                                                                                                        delta_time = delta_time,
+
+                                                                                                                        )
+
+            # Draw the text onto the surface
+            draw_text(
+                    text = self.guide_text_list[0], 
+                    text_colour = "white", 
+                    font = self.guide_text_dict["Font"],
+                    x = self.guide_text_dict["CurrentPosition"][0],
+                    y = self.guide_text_dict["CurrentPosition"][1],
+                    surface = surface
+                    )
                         
 
     # -----------------------------------------------------------------------------
@@ -1100,11 +1117,19 @@ class GameUI:
                 # Positioned from the bottom of the bar with a random y offset
                 text_position_y = ((self.dimensions["player_stats"]["frenzy_mode_bar_y"] + self.dimensions["player_stats"]["frenzy_mode_bar_height"]) - (font_size[1])) - random_y_offset
 
-        # Alpha surface
-        new_alpha_surface = pygame_Surface(font_size)
-        new_alpha_surface.set_colorkey("black")
+        # Alpha surface (re-used from the pool if possible)
+        new_alpha_surface = self.find_effect_text_alpha_surface(size = font_size)
         new_alpha_surface.set_alpha(self.effect_text_info_dict[type_of_effect_text]["DefaultAlphaLevel"])
 
+        # Draw the text onto the alpha surface once (only the position and alpha level of the alpha surface are changed afterwards)
+        draw_text(
+            text = text,
+            text_colour = self.effect_text_info_dict[type_of_effect_text]["Colour"],
+            font = font_selected,
+            x = 0,
+            y = 0,
+            surface = new_alpha_surface,
+            )
 
         # Create the effect text (Automatically added to the effect text group)
         EffectText(
@@ -1119,6 +1144,37 @@ class GameUI:
                     type_of_effect_text = type_of_effect_text
                     )
 
+    def find_effect_text_alpha_surface(self, size):
+
+        # Returns a cleared alpha surface for effect text with the given size, re-using one from the pool if there is one available
+
+        # If there is an alpha surface with this size in the pool
+        if len(EffectText.alpha_surfaces_pool_dict.get(size, [])) > 0:
+            # Take the alpha surface from the pool
+            alpha_surface = EffectText.alpha_surfaces_pool_dict[size].pop()
+
+        # If there are no alpha surfaces with this size in the pool
+        else:
+            # Create a new alpha surface
+            alpha_surface = pygame_Surface(size)
+            alpha_surface.set_colorkey("black")
+
+        # Clear the alpha surface
+        alpha_surface.fill("black")
+
+        return alpha_surface
+
+    def release_effect_text_alpha_surface(self, alpha_surface):
+
+        # Returns the alpha surface of an effect text that has been removed to the pool, so that it can be re-used
+
+        # If there are no alpha surfaces with this size in the pool yet, create a list for them
+        if alpha_surface.get_size() not in EffectText.alpha_surfaces_pool_dict:
+            EffectText.alpha_surfaces_pool_dict[alpha_surface.get_size()] = []
+
+        # Add the alpha surface to the pool
+        EffectText.alpha_surfaces_pool_dict[alpha_surface.get_size()].append(alpha_surface)
+
     def draw_and_update_effect_text(self):
         
         # Draws and updates the effect text
@@ -1134,23 +1190,13 @@ class GameUI:
                     # Remove it from the effect text list
                     EffectText.effect_text_list.pop(index)
 
+                    # Return its alpha surface to the pool
+                    self.release_effect_text_alpha_surface(alpha_surface = effect_text.alpha_surface)
+
                 # If their display time is greater than 0
                 if effect_text.display_time > 0:
                     
-                    # Fill the effect text's alpha surface with black
-                    effect_text.alpha_surface.fill("black")
-
-                    # Draw the text
-                    draw_text(
-                        text = effect_text.text,
-                        text_colour = effect_text.colour,
-                        font = effect_text.font,
-                        x = 0,
-                        y = 0,
-                        surface = effect_text.alpha_surface,
-                        )
-
-                    # Draw the alpha surface onto the main surface
+                    # Draw the alpha surface (which the text was drawn onto when the effect text was created) onto the main surface
                     self.surface.blit(effect_text.alpha_surface, (effect_text.x, effect_text.y))
                     
                     # Decrease the y-pos of the effect text over time
@@ -1356,20 +1402,37 @@ class GameUI:
 
                                                 )
 
-    def draw_angled_polygons_effects(self, camera_position, delta_time):
+    def update_angled_polygons_effects(self, delta_time):
+
+        # If there are any angled polygons to update
+        if hasattr(self, "angled_polygons_controller") and self.angled_polygons_controller.number_of_polygons > 0:
+            # Move the angled polygons (and remove the polygons that have travelled the complete distance)
+            self.angled_polygons_controller.update(delta_time = delta_time)
+
+    def draw_angled_polygons_effects(self, camera_position):
         
         # Fill the angled polygons surface as black
         self.angled_polygons_surface.fill("black")
 
         # If there are any angled polygons to draw
-        if hasattr(self, "angled_polygons_controller") and len(self.angled_polygons_controller.polygons_dict) > 0:
+        if hasattr(self, "angled_polygons_controller") and self.angled_polygons_controller.number_of_polygons > 0:
             # Draw the angled polygons
-            self.angled_polygons_controller.draw(delta_time = delta_time, camera_position = camera_position)
+            self.angled_polygons_controller.draw(camera_position = camera_position)
 
         # Blit the angled polygons surface onto the main surface
         self.surface.blit(self.angled_polygons_surface, (0, 0))
 
 
+    def update(self):
+
+        # Updates the game UI (Called every fixed step, whereas "run" is only called when the game is drawn)
+
+        # If the player is alive and a boss has been spawned and the camera has been panned back to the player
+        if self.player_gameplay_info_dict["CurrentHealth"] > 0 and self.player_gameplay_info_dict["CanStartOperating"] == True:
+            # Create shooting angled polygons effects
+            # Note: This is done here because the angled polygons are created with random colours, so that the random number generator is used the same number of times regardless of the framerate
+            self.create_angled_polygons_effects(purpose = "Shooting")
+
     def run(self, camera_position):
 
         # If the player is alive
@@ -1381,9 +1444,6 @@ class GameUI:
             # If a boss has been spawned and the camera has been panned back to the player
             if self.player_gameplay_info_dict["CanStartOperating"] == True:
 
-                # Create shooting angled polygons effects
-                self.create_angled_polygons_effects(purpose = "Shooting")
-
                 # Draw the display cards onto the screen
                 self.draw_display_cards()
 
@@ -1,4 +1,5 @@
 from Global.functions import draw_text
+from Global.dirty_rects import mark_dirty_rect
 
 from random import randrange as random_randrange
 
@@ -338,4 +339,8 @@ class Button:
             font = self.text_font, 
             x = self.rect.centerx - (self.text_font_size[0] / 2),
              y = self.rect.centery - (self.text_font_size[1] / 2), 
-             surface = self.surface)
\ No newline at end of file
+             surface = self.surface)
+
+        # The button, its highlight and its border animation have changed (The highlight and border animation are drawn around the edges of the button)
+        dirty_rect_margin = max(self.button_highlighting_info_dict["highlight_width"], self.border_animation_radius) + 1
+        mark_dirty_rect(rect = self.rect.inflate(dirty_rect_margin * 2, dirty_rect_margin * 2))
\ No newline at end of file
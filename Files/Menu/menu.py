@@ -1,5 +1,9 @@
 from Global.settings import screen_width, screen_height
 from Global.functions import draw_text, move_item_vertically_sin
+from Global.input_recorder import mouse_get_pos as input_mouse_get_pos
+from Global.input_recorder import mouse_get_pressed as input_mouse_get_pressed
+from Global.dirty_rects import mark_dirty_rect, mark_full_screen_dirty
+from Global.asset_manager import load_image
 from Menu.button import Button
 
 from sys import exit as sys_exit
@@ -8,11 +12,8 @@ from pygame import Rect as pygame_Rect
 from pygame import quit as pygame_quit
 from pygame.display import get_surface as pygame_display_get_surface
 from pygame.font import Font as pygame_font_Font
-from pygame.mouse import get_pos as pygame_mouse_get_pos
-from pygame.mouse import get_pressed as pygame_mouse_get_pressed
 from pygame.mouse import set_visible as pygame_mouse_set_visible
 from pygame.draw import rect as pygame_draw_rect
-from pygame.image import load as pygame_image_load
 
 class Menu:
     def __init__(self):
@@ -39,6 +40,9 @@ class Menu:
         # Stores the menu to transition to
         self.transition_to_which_menu = "Nothing"
 
+        # Stores the menu that was drawn in the last frame (The entire screen changes when a different menu is drawn)
+        self.last_drawn_menu = None
+
         # Stores whether the player decided to exit the session, in that case the game would need to be reset again
         self.session_exit = False
 
@@ -130,7 +134,7 @@ class Menu:
         # Creates a mouse rect and updates the mouse rect depending on the mouse position 
 
         # Retrieve the mouse position
-        self.mouse_position = pygame_mouse_get_pos()
+        self.mouse_position = input_mouse_get_pos()
 
         # If a mouse rect has not been created already
         if hasattr(self, "mouse_rect") == False:
@@ -178,6 +182,20 @@ class Menu:
             # Play the button's border animation
             button.play_border_animations()
 
+    def is_idle(self):
+
+        # Returns whether nothing is happening in the menu (i.e. the mouse is not hovering over any buttons, the left mouse button is not being pressed and the menu is not being transitioned from)
+
+        # If the menu has not been run yet (so the mouse rect has not been created)
+        if hasattr(self, "mouse_rect") == False:
+            return False
+
+        return (
+                self.transition_to_which_menu == "Nothing" and 
+                input_mouse_get_pressed()[0] == 0 and 
+                self.mouse_rect.collidelist(self.menu_buttons_dict[self.current_menu]["ButtonsList"]) == -1
+                )
+
     def draw_title(self, delta_time):
         
         # Change the current position and sin angle
@@ -201,6 +219,9 @@ class Menu:
                 surface = self.surface
                 )
 
+        # The title moves, so the region of the screen that it is drawn in has changed
+        mark_dirty_rect(rect = (self.title_text_current_position[0], self.title_text_current_position[1], self.title_text_font_size[0] + 1, self.title_text_font_size[1] + 1))
+
     def run(self, delta_time):
 
         # Update delta time 
@@ -210,12 +231,17 @@ class Menu:
         self.mouse_position_updating()
 
         # Check if the left mouse button has been released, and if it has, set the attribute to True
-        if pygame_mouse_get_pressed()[0] == 0:
+        if input_mouse_get_pressed()[0] == 0:
             self.left_mouse_button_released = True
 
         # Fill the surface with a colour
         self.surface.fill((40, 40, 40))
 
+        # If a different menu is being drawn to the last frame, the entire screen has changed
+        if self.current_menu != self.last_drawn_menu:
+            mark_full_screen_dirty()
+            self.last_drawn_menu = self.current_menu
+
         # ---------------------------------------------
         # Main menu
 
@@ -228,7 +254,7 @@ class Menu:
             self.update_buttons(menu_buttons_list = self.menu_buttons_dict["main_menu"]["ButtonsList"])
 
             # If the left mouse button is pressed and the left mouse button isn't being pressed already
-            if pygame_mouse_get_pressed()[0] == True and self.left_mouse_button_released == True:
+            if input_mouse_get_pressed()[0] == True and self.left_mouse_button_released == True:
 
                     # Set the left mouse button as not released
                     self.left_mouse_button_released = False   
@@ -277,7 +303,7 @@ class Menu:
             if hasattr(self, "controls_menu_dict") == False:
                 # Create it
                 self.controls_menu_dict = {
-                                        "Image": pygame_image_load("graphics/Misc/ControlsDisplay.png").convert_alpha(),
+                                        "Image": load_image(path = "graphics/Misc/ControlsDisplay.png"),
                                         "BoxSize": (1000, 600),
                                         }
 
@@ -320,7 +346,7 @@ class Menu:
                             )
 
             # If the left mouse button is pressed and the left mouse button isn't being pressed already
-            if pygame_mouse_get_pressed()[0] == 1 and self.left_mouse_button_released == True:
+            if input_mouse_get_pressed()[0] == 1 and self.left_mouse_button_released == True:
 
                 # Set the left mouse button as not released
                 self.left_mouse_button_released = False          
@@ -360,7 +386,7 @@ class Menu:
             self.update_buttons(menu_buttons_list = self.menu_buttons_dict["paused_menu"]["ButtonsList"])
 
             # If the left mouse button is pressed and the left mouse button isn't being pressed already
-            if pygame_mouse_get_pressed()[0] == 1 and self.left_mouse_button_released == True:
+            if input_mouse_get_pressed()[0] == 1 and self.left_mouse_button_released == True:
 
                 # Set the left mouse button as not released
                 self.left_mouse_button_released = False          
@@ -405,7 +431,7 @@ class Menu:
             self.update_buttons(menu_buttons_list = self.menu_buttons_dict["restart_menu"]["ButtonsList"])
 
             # If the left mouse button is pressed and the left mouse button isn't being pressed already
-            if pygame_mouse_get_pressed()[0] == 1 and self.left_mouse_button_released == True:
+            if input_mouse_get_pressed()[0] == 1 and self.left_mouse_button_released == True:
 
                 # Set the left mouse button as not released
                 self.left_mouse_button_released = False          
@@ -1,20 +1,38 @@
-from math import sqrt, radians, cos, sin
+from math import radians, cos, sin
 from random import randint as random_randint
 
-from pygame import Surface as pygame_Surface
+from numpy import zeros as numpy_zeros
+from numpy import flatnonzero as numpy_flatnonzero
+from numpy import sqrt as numpy_sqrt
+from numpy import abs as numpy_abs
+from numpy import int32 as numpy_int32
+
 from pygame.draw import polygon as pygame_draw_polygon
 
 class AngledPolygons:
 
+    # The maximum number of polygons that can exist at one time (Any polygons created once this has been reached are not added)
+    maximum_number_of_polygons = 1024
+
     def __init__(self, surface):
 
         self.surface = surface
 
-        # Dictionary to hold all the polygons created
-        self.polygons_dict = {}
+        # The number of polygons currently alive (The polygons are stored at the start of each array, from index 0 to self.number_of_polygons - 1)
+        self.number_of_polygons = 0
 
-        # Number of polygons created, used as the key for each polygon created
-        self.polygons_created = 0
+        """ Arrays holding the information of all the polygons (One row for each polygon):
+        - points = The ordered points of the polygon (4 points, each with an x and y position)
+        - gradients = The gradients / rate of change of the x and y co-ordinates based on the distance the polygon needs to travel and the time period given
+        - distance_travelled = Holds the distance travelled on the x and y axis
+        - distance_to_disappear = The distance the polygon must travel before disappearing
+        - colour_indexes = The index of the polygon's colour inside of self.colours_list
+        """
+        self.points = numpy_zeros((AngledPolygons.maximum_number_of_polygons, 4, 2))
+        self.gradients = numpy_zeros((AngledPolygons.maximum_number_of_polygons, 2))
+        self.distance_travelled = numpy_zeros((AngledPolygons.maximum_number_of_polygons, 2))
+        self.distance_to_disappear = numpy_zeros(AngledPolygons.maximum_number_of_polygons)
+        self.colour_indexes = numpy_zeros(AngledPolygons.maximum_number_of_polygons, dtype = numpy_int32)
 
         # Colour palettes for the different polygons
         self.polygons_colour_palettes = {
@@ -29,6 +47,13 @@ class AngledPolygons:
                                         }
 
 
+        # A list of the colours of all the colour palettes, and the index of the first colour of each colour palette inside of the list (Used for the colour indexes of the polygons)
+        self.colours_list = []
+        self.colour_palettes_starting_index_dict = {}
+        for colour_palette_name, colour_palette in self.polygons_colour_palettes.items():
+            self.colour_palettes_starting_index_dict[colour_palette_name] = len(self.colours_list)
+            self.colours_list.extend(colour_palette)
+
         # Attribute set to True whenever the user wants to switch the colour palette
         self.switch_colour_palette = False
 
@@ -61,19 +86,11 @@ class AngledPolygons:
                             
         ]
 
-        # Calculate the largest and smallest x and y positions
+        # Calculate the smallest x and y positions
         # Note: The lambda function is so that only the x or y positions are compared
-        largest_x_pos =  max(self.points_list, key = lambda x: x[0])[0]
         smallest_x_pos = min(self.points_list, key = lambda x: x[0])[0]
-        largest_y_pos = max(self.points_list, key = lambda x: x[1])[1]
         smallest_y_pos = min(self.points_list, key = lambda x: x[1])[1]
 
-        # The width would be the largest x pos minus the smallest x pos
-        polygon_width = largest_x_pos - smallest_x_pos
-
-        # The width would be the largest y pos minus the smallest y pos
-        polygon_height = largest_y_pos - smallest_y_pos
-
         # ------------------------------------------------------------------
         # Correcting co-ordinates so that the polygon is drawn properly onto the polygon surface
 
@@ -149,57 +166,77 @@ class AngledPolygons:
                 self.ordered_points_list[3], self.ordered_points_list[2] = self.ordered_points_list[2], self.ordered_points_list[3]
     
         # -----------------------------------------------------------------
-        # Adding additional polygon functionality e.g. movement
+        # Adding the polygon to the arrays
+
+        # If the maximum number of polygons has been reached, do not add the polygon
+        if self.number_of_polygons == AngledPolygons.maximum_number_of_polygons:
+            return
+
+        # The index of the new polygon (after all the polygons currently alive)
+        index = self.number_of_polygons
+
         # Declare the distance the polygon must travel before disappearing and the time 
         distance_polygon_must_travel_to_disappear = distance_to_travel
 
-        """ Dictionary to store all of the polygons' information
-        - id = Used to remove the polygon from the list once it has travelled the full distance
-        - distance_travelled = Holds the distance travelled on the x and y axis
-        - gradients = The gradients / rate of change of the x and y co-ordinates based on the distance the polygon needs to travel and the time period given
-        - ordered_points_list = The ordered list of all the points of the polygon.
-        """ 
-        self.polygons_dict[self.polygons_created] = {
-            "id": self.polygons_created,
-            "distance_travelled": [0, 0],
-            "distance_polygon_must_travel_to_disappear": distance_polygon_must_travel_to_disappear,
-            "gradients": ((distance_polygon_must_travel_to_disappear * cos(angle))/ time_to_travel_distance, (distance_polygon_must_travel_to_disappear * sin(angle)) / time_to_travel_distance),
-            "colour": self.polygons_colour_palettes[colour_palette][random_randint(0, len(self.polygons_colour_palettes[colour_palette]) - 1)],
-            "polygon_surface": pygame_Surface((polygon_width, polygon_height)),
-            "ordered_points_list": self.ordered_points_list,
-            "blend_rgb_add_boolean": blend_rgb_add_boolean
-            }
-
-        # Increment the number of polygons created
-        self.polygons_created += 1
-
-    def draw(self, delta_time, camera_position):     
-        
-        # Loop through the dictionary of each polygon
-        for polygon_points_dict in self.polygons_dict.copy().values():
-            
-            # If the polygon has not travelled the complete distance
-            if sqrt((polygon_points_dict["distance_travelled"][0] ** 2) + (polygon_points_dict["distance_travelled"][1] ** 2)) < polygon_points_dict["distance_polygon_must_travel_to_disappear"]:
-
-                # For all points inside the ordered polygon points list
-                for i in range(0, len(polygon_points_dict["ordered_points_list"])):
-                    # Increasing the x position of the polygon
-                    polygon_points_dict["ordered_points_list"][i][0] += polygon_points_dict["gradients"][0] * delta_time
-                    # Increasing the y position of the polygon
-                    polygon_points_dict["ordered_points_list"][i][1] -= polygon_points_dict["gradients"][1] * delta_time
-
-                # Increase the distance travelled by the entire polygon
-                polygon_points_dict["distance_travelled"][0] += abs(polygon_points_dict["gradients"][0] * delta_time)
-                polygon_points_dict["distance_travelled"][1] += abs(polygon_points_dict["gradients"][1] * delta_time)
-
-                # Create a generator for the polygon points, minus the camera position (Where the polygon will be drawn) 
-                # Note: This is converted into a tuple to save memory
-                camera_polygon_points = ([polygon_points_dict["ordered_points_list"][i][0] - camera_position[0], polygon_points_dict["ordered_points_list"][i][1] - camera_position[1] ] for i in range(0, len(polygon_points_dict["ordered_points_list"])))
-
-                # Draw the polygon onto the angled polygons surface
-                pygame_draw_polygon(surface = self.surface, color = polygon_points_dict["colour"], points = tuple(camera_polygon_points))
-
-            # If the polygon has travelled the complete distance
-            else:
-                # Delete the polygon from the polygons dictionary
-                self.polygons_dict.pop(polygon_points_dict["id"])
\ No newline at end of file
+        # Save the polygon's information
+        self.points[index] = self.ordered_points_list
+        self.gradients[index] = ((distance_polygon_must_travel_to_disappear * cos(angle))/ time_to_travel_distance, (distance_polygon_must_travel_to_disappear * sin(angle)) / time_to_travel_distance)
+        self.distance_travelled[index] = (0, 0)
+        self.distance_to_disappear[index] = distance_polygon_must_travel_to_disappear
+        self.colour_indexes[index] = self.colour_palettes_starting_index_dict[colour_palette] + random_randint(0, len(self.polygons_colour_palettes[colour_palette]) - 1)
+
+        # Increment the number of polygons
+        self.number_of_polygons += 1
+
+    def remove_polygons(self, polygons_to_remove):
+
+        # Removes polygons by moving the polygons at the end of the arrays into their positions (swap-remove), so that all of the polygons alive stay at the start of the arrays
+        """ Note: polygons_to_remove is an array holding the indexes of the polygons to remove, in ascending order """
+
+        # The number of polygons alive after removing the polygons
+        remaining_number_of_polygons = self.number_of_polygons - len(polygons_to_remove)
+
+        # The indexes of the removed polygons that are inside of the remaining polygons (i.e. the "holes" that need to be filled)
+        holes = polygons_to_remove[polygons_to_remove < remaining_number_of_polygons]
+
+        # The indexes of the polygons alive that are after the remaining polygons (i.e. the polygons that need to be moved into the holes)
+        is_removed = numpy_zeros(self.number_of_polygons - remaining_number_of_polygons, dtype = bool)
+        is_removed[polygons_to_remove[polygons_to_remove >= remaining_number_of_polygons] - remaining_number_of_polygons] = True
+        polygons_to_move = numpy_flatnonzero(is_removed == False) + remaining_number_of_polygons
+
+        # Move the polygons into the holes
+        for array in (self.points, self.gradients, self.distance_travelled, self.distance_to_disappear, self.colour_indexes):
+            array[holes] = array[polygons_to_move]
+
+        # Set the new number of polygons
+        self.number_of_polygons = remaining_number_of_polygons
+
+    def update(self, delta_time):
+
+        # Remove the polygons that have travelled the complete distance
+        polygons_to_remove = numpy_flatnonzero(numpy_sqrt((self.distance_travelled[:self.number_of_polygons, 0] ** 2) + (self.distance_travelled[:self.number_of_polygons, 1] ** 2)) >= self.distance_to_disappear[:self.number_of_polygons])
+        if len(polygons_to_remove) > 0:
+            self.remove_polygons(polygons_to_remove = polygons_to_remove)
+
+        # The number of polygons that have not travelled the complete distance
+        number_of_polygons = self.number_of_polygons
+
+        # Increase the x position and decrease the y position of all the points of the polygons
+        self.points[:number_of_polygons, :, 0] += (self.gradients[:number_of_polygons, 0] * delta_time)[:, None]
+        self.points[:number_of_polygons, :, 1] -= (self.gradients[:number_of_polygons, 1] * delta_time)[:, None]
+
+        # Increase the distance travelled by the polygons
+        self.distance_travelled[:number_of_polygons] += numpy_abs(self.gradients[:number_of_polygons] * delta_time)
+
+    def draw(self, camera_position):
+
+        # The number of polygons alive
+        number_of_polygons = self.number_of_polygons
+
+        # Find the polygon points minus the camera position (Where the polygons will be drawn) 
+        camera_polygons_points = (self.points[:number_of_polygons] - (camera_position[0], camera_position[1])).tolist()
+        colour_indexes = self.colour_indexes[:number_of_polygons].tolist()
+
+        # Draw the polygons onto the angled polygons surface
+        for i in range(0, number_of_polygons):
+            pygame_draw_polygon(surface = self.surface, color = self.colours_list[colour_indexes[i]], points = camera_polygons_points[i])
@@ -0,0 +1,273 @@
+from headless import HeadlessMain
+from Global.settings import TILE_SIZE
+from Global.input_recorder import input_recorder_dict
+from Global.input_recorder import begin_frame as input_begin_frame
+from Global.input_recorder import seed_random_number_generators
+from Global.frame_profiler import profiler_sections, profiler_dict, enable_profiler, begin_profiler_frame, end_profiler_frame
+
+from argparse import ArgumentParser
+from json import dump as json_dump
+from json import load as json_load
+from math import radians
+from random import randrange as random_randrange
+from sys import exit as sys_exit
+
+from pygame import K_SPACE as pygame_K_SPACE
+
+""" Benchmark runner:
+- Runs scripted scenarios headlessly (see headless.py) for a number of frames, timing each section of every frame with the frame profiler
+- Reports the mean, 95th percentile and 99th percentile frame time of each section, for each scenario
+- The results can be written to a JSON file, and compared against the results of a previous run (the baseline)
+- Run from the root of the repository, e.g.
+    python Files/benchmark.py --output baseline.json
+    python Files/benchmark.py --baseline baseline.json
+"""
+
+# ------------------------------------------------------------------------------
+# Scenario helpers
+
+def keep_player_alive(game):
+
+    # Keeps the player at full health so that the scenario does not end early
+    game.player.player_gameplay_info_dict["CurrentHealth"] = game.player.player_gameplay_info_dict["MaximumHealth"]
+
+def spawn_boss(game, boss_name):
+
+    # Spawns a boss straight away (without waiting for the spawning effect) and lets the boss and the player start operating
+    game.boss_spawner.find_valid_boss_spawning_position()
+    game.boss_spawner.bosses_dict["CurrentBoss"] = boss_name
+    game.boss_spawner.bosses_dict["RemainingBossesList"] = [boss_name]
+    game.boss_spawner.bosses_dict["ValidSpawningPosition"] = game.boss_spawner.bosses_dict["RandomSpawningPosition"]
+    game.boss_spawner.spawn_boss(boss_name)
+    game.boss_group.sprite.extra_information_dict["CanStartOperating"] = True
+    game.player.player_gameplay_info_dict["CanStartOperating"] = True
+
+def finish_cooldown(boss, action):
+
+    # Finishes the cooldown of one of the boss's actions (The boss's cooldown timers will then reset the timer back to None, allowing the action to be chosen)
+    if boss.behaviour_patterns_dict[action]["CooldownTimer"] != None:
+        boss.behaviour_patterns_dict[action]["CooldownTimer"] = 0
+
+def set_scenario_input(frame_number, pressed_keys = (), mouse_position = (0, 0), mouse_buttons_pressed = (0, 0, 0), events = ()):
+
+    # Sets the input for the next frame (The input recorder replays the frames added here)
+    input_recorder_dict["Mode"] = "Replay"
+    input_recorder_dict["FrameIndex"] = len(input_recorder_dict["Frames"])
+    input_recorder_dict["Frames"].append([None, list(pressed_keys), list(mouse_position), list(mouse_buttons_pressed), list(events)])
+
+# ------------------------------------------------------------------------------
+# Scenarios
+
+""" Each scenario has:
+- "Setup": Called once after the level has been loaded
+- "EveryFrame": Called before every frame is run
+"""
+
+def idle_map_setup(game):
+    pass
+
+def idle_map_every_frame(game, frame_number):
+    keep_player_alive(game = game)
+
+def sika_deer_stomp_wave_setup(game):
+    spawn_boss(game = game, boss_name = "SikaDeer")
+
+def sika_deer_stomp_wave_every_frame(game, frame_number):
+
+    keep_player_alive(game = game)
+
+    # Whenever the boss is chasing, make the stomp attack the only action available so that the boss stomps over and over again
+    # Note: The boss chases for the first second so that its movement has started (the same as when the boss is first spawned normally)
+    boss = game.boss_group.sprite
+    if boss.current_action == "Chase" and frame_number >= 60:
+        finish_cooldown(boss = boss, action = "Stomp")
+        boss.behaviour_patterns_dict["Target"]["CooldownTimer"] = boss.behaviour_patterns_dict["Target"]["Cooldown"]
+        boss.extra_information_dict["NoActionTimer"] = None
+
+def golden_monkey_spiral_and_divebomb_setup(game):
+    spawn_boss(game = game, boss_name = "GoldenMonkey")
+
+def golden_monkey_spiral_and_divebomb_every_frame(game, frame_number):
+
+    keep_player_alive(game = game)
+
+    # Whenever the boss is chasing, allow the spiral attack and the divebomb attack straight away (and never let the boss run out of energy and sleep)
+    # Note: The boss chases for the first second so that its movement has started
+    boss = game.boss_group.sprite
+    boss.energy_amount = max(boss.energy_amount, 1)
+    if boss.current_action == "Chase" and frame_number >= 60:
+        finish_cooldown(boss = boss, action = "SpiralAttack")
+        finish_cooldown(boss = boss, action = "DiveBomb")
+        boss.extra_information_dict["NoActionTimer"] = None
+
+def building_tiles_and_frenzy_launcher_setup(game):
+    game.player.player_gameplay_info_dict["CanStartOperating"] = True
+
+def building_tiles_and_frenzy_launcher_every_frame(game, frame_number):
+
+    keep_player_alive(game = game)
+
+    # The position of the player on the screen
+    player_screen_position = (
+                            (game.player.rect.centerx - game.camera.position[0]) * game.scale_multiplier,
+                            (game.player.rect.centery - game.camera.position[1]) * game.scale_multiplier
+                            )
+
+    # For the first second, place the maximum number of building tiles around the player (one tile every few frames, in a circle around the player)
+    if frame_number < 60:
+        game.player.player_gameplay_info_dict["AmountOfBambooResource"] = game.player.player_gameplay_info_dict["MaximumAmountOfBambooResource"]
+        game.player.switch_tool(tool = "BuildingTool")
+        placing_position = (
+                            player_screen_position[0] + ((3 * TILE_SIZE * game.scale_multiplier) * [1, 0, -1, 0, 1][(frame_number // 12) % 5]),
+                            player_screen_position[1] + ((3 * TILE_SIZE * game.scale_multiplier) * [0, 1, 0, -1, 1][(frame_number // 12) % 5])
+                            )
+        set_scenario_input(frame_number = frame_number, mouse_position = placing_position, mouse_buttons_pressed = (frame_number % 12 == 6, 0, 0))
+
+    # Afterwards, shoot the bamboo launcher in frenzy mode at random angles
+    else:
+        game.player.player_gameplay_info_dict["AmountOfBambooResource"] = game.player.player_gameplay_info_dict["MaximumAmountOfBambooResource"]
+        # Refill the frenzy mode meter whenever frenzy mode has ended, so that it is activated again straight away
+        if game.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
+            game.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = game.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+        game.player.switch_tool(tool = "BambooLauncher")
+        aiming_position = (player_screen_position[0] + random_randrange(-300, 300), player_screen_position[1] + random_randrange(-300, 300))
+        set_scenario_input(frame_number = frame_number, pressed_keys = (pygame_K_SPACE,), mouse_position = aiming_position, mouse_buttons_pressed = (1, 0, 0))
+
+def thousand_chilli_projectiles_setup(game):
+    spawn_boss(game = game, boss_name = "GoldenMonkey")
+
+def thousand_chilli_projectiles_every_frame(game, frame_number):
+
+    keep_player_alive(game = game)
+
+    # Keep the number of chilli projectiles at one thousand (Chilli projectiles are removed once they collide with a tile or the player)
+    boss = game.boss_group.sprite
+    for _ in range(len(boss.chilli_projectile_controller.projectiles_dict), 1000):
+        boss.chilli_projectile_controller.create_chilli_projectile(
+                                                                x_pos = boss.rect.centerx,
+                                                                y_pos = boss.rect.centery,
+                                                                angle = radians(random_randrange(0, 360)),
+                                                                damage_amount = 0
+                                                                )
+
+scenarios_dict = {
+                "IdleMap": {"Setup": idle_map_setup, "EveryFrame": idle_map_every_frame},
+                "SikaDeerStompWave": {"Setup": sika_deer_stomp_wave_setup, "EveryFrame": sika_deer_stomp_wave_every_frame},
+                "GoldenMonkeySpiralAndDiveBomb": {"Setup": golden_monkey_spiral_and_divebomb_setup, "EveryFrame": golden_monkey_spiral_and_divebomb_every_frame},
+                "BuildingTilesAndFrenzyLauncher": {"Setup": building_tiles_and_frenzy_launcher_setup, "EveryFrame": building_tiles_and_frenzy_launcher_every_frame},
+                "ThousandChilliProjectiles": {"Setup": thousand_chilli_projectiles_setup, "EveryFrame": thousand_chilli_projectiles_every_frame},
+                }
+
+# ------------------------------------------------------------------------------
+# Running and reporting
+
+def find_percentile(sorted_values, percentile):
+
+    # Returns the value at a percentile (0 - 100) of a sorted list of values
+    return sorted_values[min(int(len(sorted_values) * (percentile / 100)), len(sorted_values) - 1)]
+
+def summarise_frames(frames_list):
+
+    # Returns the mean, 95th percentile and 99th percentile (in milliseconds) of the total frame time and each section's time
+    summary_dict = {}
+    for section in ("Frame",) + profiler_sections:
+        sorted_times = sorted(frame_times[section] * 1000 for frame_times in frames_list)
+        summary_dict[section] = {
+                                "Mean": sum(sorted_times) / len(sorted_times),
+                                "P95": find_percentile(sorted_values = sorted_times, percentile = 95),
+                                "P99": find_percentile(sorted_values = sorted_times, percentile = 99)
+                                }
+    return summary_dict
+
+def run_scenario(scenario_name, number_of_frames, delta_time, seed):
+
+    # Runs a scenario headlessly for the number of frames given, returning the summary of the frame times
+
+    # Seed the random number generator so that every run of the scenario is the same, and start from live input
+    seed_random_number_generators(seed = seed)
+    input_recorder_dict["Mode"] = "Live"
+    input_recorder_dict["Frames"] = []
+
+    # Create the game without a display and run one frame to load the level
+    headless_main = HeadlessMain(delta_time = delta_time, skip_menu = True)
+    game_states_controller = headless_main.game_states_controller
+    game_states_controller.run(delta_time)
+    game = game_states_controller.game
+
+    # Set up the scenario
+    scenarios_dict[scenario_name]["Setup"](game = game)
+
+    # Time every frame with the profiler
+    enable_profiler(keep_all_frames = True)
+    profiler_dict["FramesList"] = []
+    for frame_number in range(0, number_of_frames):
+
+        # Perform the scenario's actions for this frame
+        scenarios_dict[scenario_name]["EveryFrame"](game = game, frame_number = frame_number)
+
+        # Capture the input for this frame (Scenario input has no recorded delta time, so the synthetic delta time is always used)
+        input_begin_frame(delta_time = delta_time)
+
+        begin_profiler_frame()
+        game_states_controller.run(delta_time)
+        end_profiler_frame()
+
+    return summarise_frames(frames_list = profiler_dict["FramesList"])
+
+def print_results(results_dict, baseline_dict = None):
+
+    # Prints the results (and the change from the baseline if a baseline was given)
+    for scenario_name, summary_dict in results_dict.items():
+        print(f"\n{scenario_name}")
+        for section, times in summary_dict.items():
+            line = f"    {section:<16} mean {times['Mean']:8.3f} ms   p95 {times['P95']:8.3f} ms   p99 {times['P99']:8.3f} ms"
+            if baseline_dict != None and scenario_name in baseline_dict and baseline_dict[scenario_name][section]["Mean"] > 0:
+                line += f"   ({((times['Mean'] / baseline_dict[scenario_name][section]['Mean']) - 1) * 100:+.1f}% mean)"
+            print(line)
+
+def find_regressions(results_dict, baseline_dict, tolerance):
+
+    # Returns a list of the scenarios whose mean or 95th percentile frame time is slower than the baseline by more than the tolerance (e.g. 0.1 = 10%)
+    regressions_list = []
+    for scenario_name, summary_dict in results_dict.items():
+        if scenario_name in baseline_dict:
+            for statistic in ("Mean", "P95"):
+                if summary_dict["Frame"][statistic] > baseline_dict[scenario_name]["Frame"][statistic] * (1 + tolerance):
+                    regressions_list.append(f"{scenario_name} ({statistic})")
+    return regressions_list
+
+if __name__ == "__main__":
+
+    # Command-line arguments
+    argument_parser = ArgumentParser(description = "Runs the benchmark scenarios headlessly and reports the frame times of each section")
+    argument_parser.add_argument("--scenarios", nargs = "+", default = list(scenarios_dict.keys()), choices = list(scenarios_dict.keys()), help = "The scenarios to run")
+    argument_parser.add_argument("--frames", type = int, default = 600, help = "The number of frames to run for each scenario")
+    argument_parser.add_argument("--delta-time", type = float, default = 1 / 60, help = "The delta time (in seconds) used for every frame")
+    argument_parser.add_argument("--seed", type = int, default = 0, help = "The seed for the random number generator")
+    argument_parser.add_argument("--output", default = None, help = "Write the results to this JSON file (e.g. to use as a baseline)")
+    argument_parser.add_argument("--baseline", default = None, help = "Compare the results against this JSON file")
+    argument_parser.add_argument("--tolerance", type = float, default = 0.1, help = "How much slower (as a proportion) a scenario can be than the baseline before it counts as a regression")
+    arguments = argument_parser.parse_args()
+
+    # Run each scenario
+    results_dict = {scenario_name: run_scenario(scenario_name = scenario_name, number_of_frames = arguments.frames, delta_time = arguments.delta_time, seed = arguments.seed) for scenario_name in arguments.scenarios}
+
+    # Load the baseline
+    baseline_dict = None
+    if arguments.baseline != None:
+        with open(arguments.baseline, "r") as baseline_file:
+            baseline_dict = json_load(baseline_file)
+
+    print_results(results_dict = results_dict, baseline_dict = baseline_dict)
+
+    # Write the results
+    if arguments.output != None:
+        with open(arguments.output, "w") as output_file:
+            json_dump(results_dict, output_file, indent = 4)
+
+    # If any scenario has regressed compared to the baseline, exit with an error code
+    if baseline_dict != None:
+        regressions_list = find_regressions(results_dict = results_dict, baseline_dict = baseline_dict, tolerance = arguments.tolerance)
+        if len(regressions_list) > 0:
+            print(f"\nRegressions (slower than the baseline by more than {arguments.tolerance * 100:.0f}%): {', '.join(regressions_list)}")
+            sys_exit(1)
@@ -0,0 +1,32 @@
+from Global.level_format import text_tile_maps_path, binary_tile_maps_path, parse_text_tile_maps, write_binary_tile_maps, read_binary_tile_map
+
+from argparse import ArgumentParser
+
+""" Level tile maps converter:
+- Converts the text file of tile maps (level_tile_maps.txt) into the binary file of tile maps (level_tile_maps.bin) that the game loads levels from (see Global/level_format.py)
+- Must be run again whenever the text file of tile maps is changed
+- Run from the root of the repository, e.g.
+    python Files/convert_level_tile_maps.py
+    python Files/convert_level_tile_maps.py --compress
+"""
+
+if __name__ == "__main__":
+
+    # Command-line arguments
+    argument_parser = ArgumentParser(description = "Converts the text file of tile maps into the binary file of tile maps")
+    argument_parser.add_argument("--input", default = text_tile_maps_path, help = "The text file of tile maps")
+    argument_parser.add_argument("--output", default = binary_tile_maps_path, help = "The binary file of tile maps")
+    argument_parser.add_argument("--compress", action = "store_true", help = "Compress the tile grid of each level (zlib)")
+    arguments = argument_parser.parse_args()
+
+    tile_maps_list = parse_text_tile_maps(file_path = arguments.input)
+    write_binary_tile_maps(tile_maps_list = tile_maps_list, file_path = arguments.output, compress = arguments.compress)
+
+    # Check that every level is read back the same as the text file
+    for level_number, tile_map in enumerate(tile_maps_list, start = 1):
+        if (read_binary_tile_map(level_number = level_number, file_path = arguments.output) == tile_map).all() == False:
+            raise ValueError(f"Level {level_number} was not written correctly to {arguments.output}")
+
+        print(f"Level {level_number}: {tile_map.shape[0]} rows x {tile_map.shape[1]} columns")
+
+    print(f"Wrote {len(tile_maps_list)} levels to {arguments.output}")
@@ -1,4 +1,9 @@
 from Global.settings import screen_width, screen_height
+from Global.input_recorder import event_get as input_event_get
+from Global.frame_profiler import enable_profiler, disable_profiler
+from Global.profiler_overlay import ProfilerOverlay
+from Global.dirty_rects import mark_dirty_rect, mark_full_screen_dirty
+from Global.level_format import read_binary_tile_map
 from Menu.menu import Menu
 from Level.game import Game
 
@@ -8,12 +13,12 @@ from pygame.display import set_mode as pygame_display_set_mode
 from pygame import SCALED as pygame_SCALED
 from pygame import FULLSCREEN as pygame_FULLSCREEN
 from pygame import HWSURFACE as pygame_HWSURFACE
-from pygame.event import get as pygame_event_get
 from pygame import QUIT as pygame_QUIT
 from pygame import quit as pygame_quit
 from pygame import KEYDOWN as pygame_KEYDOWN
 from pygame import K_ESCAPE as pygame_K_ESCAPE
 from pygame import K_F11 as pygame_K_F11
+from pygame import K_F3 as pygame_K_F3
 from pygame import K_1 as pygame_K_1
 from pygame import K_2 as pygame_K_2
 from pygame import K_3 as pygame_K_3
@@ -22,13 +27,20 @@ from pygame.mouse import set_visible as pygame_mouse_set_visible
 from pygame.draw import rect as pygame_draw_rect
 
 class GameStatesController():
-    def __init__(self):
+    def __init__(self, headless = False):
 
         # Screen
-        # Set the screen to be full screen 
-        self.surface = pygame_display_set_mode((screen_width, screen_height), flags = pygame_SCALED + pygame_FULLSCREEN + pygame_HWSURFACE)
-
-        self.full_screen = True
+        # If the game is being run with a display
+        if headless == False:
+            # Set the screen to be full screen 
+            self.surface = pygame_display_set_mode((screen_width, screen_height), flags = pygame_SCALED + pygame_FULLSCREEN + pygame_HWSURFACE)
+            self.full_screen = True
+
+        # If the game is being run without a display (i.e. with the dummy video driver)
+        elif headless == True:
+            # Create a plain screen surface (Full screen and hardware surfaces are not available without a display)
+            self.surface = pygame_display_set_mode((screen_width, screen_height))
+            self.full_screen = False
 
         # Game states
         self.menu = Menu()
@@ -37,6 +49,16 @@ class GameStatesController():
         # Attribute so that we only load the level once, and not every frame
         self.level_loaded = False
 
+        # Attribute which is monitored by main (Set to True when nothing is happening in the menus, so that the framerate can be lowered)
+        self.idle = False
+
+        # The number of events that were handled in the last frame
+        self.number_of_events_handled = 0
+
+        # Profiler overlay (Toggled with the "F3" key, the frame profiler is only enabled whilst the overlay is shown)
+        self.profiler_overlay = ProfilerOverlay()
+        self.show_profiler_overlay = False
+
         # ------------------------------------------------------------------------------------------------------------------------------------------------
         # Restart menu functionality
 
@@ -46,6 +68,9 @@ class GameStatesController():
         # The height of the black bars
         self.bar_height = 0
 
+        # The height of the black bars before they were last changed (This is the height that is drawn, see draw_transition)
+        self.bar_drawn_height = 0
+
         self.bar_height_change_time = 125
         self.bar_lock_in_time = 225 
 
@@ -76,51 +101,10 @@ class GameStatesController():
         if self.level_loaded == False:
 
             # ------------------------------------------------------------------------
-            # Loading the tile map from the level tile maps text file
-
-            # Open the text file which holds 
-            with open("Files/Level/level_tile_maps.txt", "r") as level_tile_maps_file:
-                
-                for line_number, tile_map in enumerate(level_tile_maps_file.readlines()):
-                    # If the line number is equal to the chosen level minus one (This is because the tile maps are zero indexed in order)
-                    if line_number == (chosen_level_number - 1):
-                        # [1:-1] to get rid of the "?" separator and the "\n" line break for each tile map
-                        tile_map_to_convert = tile_map[1:-1]
+            # Loading the tile map from the level tile maps binary file (created from the level tile maps text file by convert_level_tile_maps.py)
 
-            # ----------------------------------------------------------------------------------------
-            # Convert the tile map into a series of tile numbers, so that inside the level, we can create objects 
-
-
-            non_transformed_tile_map = [] # Holds the tile map of the tile's numbers
-            tile_number = "" # Used as some tiles may have double digit tile numbers
-            row_of_tiles_list = [] # Used to hold all the tiles in one row
-
-            # For all characters in the tile map
-            for i in range(0, len(tile_map_to_convert)):
-                
-                # Identify what the character is
-                match tile_map_to_convert[i]:
-
-                    # Comma separator
-                    case ",":
-                    
-                        # Add the row of tiles to the final tile map
-                        non_transformed_tile_map.append(row_of_tiles_list)
-
-                        # Empty the row of tiles list
-                        row_of_tiles_list = []
-
-                    # Exclamation mark separator
-                    case "!":
-                        # Add the tile number to the row of tiles 
-                        row_of_tiles_list.append(int(tile_number))
-
-                        # Reset the tile number
-                        tile_number = ""
-
-                    # If it is neither a comma separator or an exclamation mark separator
-                    case _: # Can also be "case other"
-                        tile_number += tile_map_to_convert[i]
+            # The tile map of the chosen level, as a NumPy array of tile numbers (a row for each row of tiles)
+            non_transformed_tile_map = read_binary_tile_map(level_number = chosen_level_number)
 
             # Create the level's object tile map, which is a tile map consisting of the objects (the actual game tile map)
             self.game.create_objects_tile_map(non_transformed_tile_map)
@@ -130,8 +114,12 @@ class GameStatesController():
             
     def event_loop(self):
 
+        # Retrieve the events for this frame
+        events = input_event_get()
+        self.number_of_events_handled = len(events)
+
         # Event handler
-        for event in pygame_event_get():
+        for event in events:
                 
             # Identify the type of event
             match event.type:
@@ -169,6 +157,24 @@ class GameStatesController():
                                 self.surface = pygame_display_set_mode((screen_width, screen_height), pygame_SCALED + pygame_FULLSCREEN + pygame_HWSURFACE)
                                 self.full_screen = True
 
+                            # The display has been created again, so the entire screen has changed
+                            mark_full_screen_dirty()
+
+                        # "F3" key
+                        case _ if event.key == pygame_K_F3:
+
+                            # Showing the profiler overlay
+                            if self.show_profiler_overlay == False:
+                                # Start timing the sections of each frame
+                                enable_profiler()
+                                self.show_profiler_overlay = True
+
+                            # Hiding the profiler overlay
+                            elif self.show_profiler_overlay == True:
+                                # Stop timing the sections of each frame
+                                disable_profiler()
+                                self.show_profiler_overlay = False
+
                     # ------------------------------------------------------------
                     # In-game / Level events
 
@@ -270,40 +276,16 @@ class GameStatesController():
                 # Set the menu session exit attribute back to False
                 self.menu.session_exit = False
 
-    def perform_transition(self, delta_time):
+    def update_transition(self, delta_time):
 
-        # Performs the transition between game states (i.e. changes between the menu and draws the transition)
+        # Performs the transition between game states (i.e. changes between the menus / game and changes the size of the bars)
+
+        # Save the height of the bars before they are changed
+        self.bar_drawn_height = self.bar_height
 
         # If a transition has been set to start
         if self.transition_where != "Nothing":
 
-            # Top black bar
-            pygame_draw_rect(
-                surface = self.surface,
-                color = (113, 179, 64),
-                rect = (
-                        0, 
-                        0, 
-                        self.surface.get_width(), 
-                        self.bar_height
-                        ),
-                width = 0
-                )
-
-            # Bottom black bar
-            pygame_draw_rect(
-                surface = self.surface,
-                color = (113, 179, 64),
-                rect = (
-                        0, 
-                        self.surface.get_height() - self.bar_height, 
-                        self.surface.get_width(), 
-                        self.bar_height
-                        ),
-                width = 0
-                )            
-
-
             # Updating the size of the black bar
 
             # Temp variable for the time elapsed
@@ -352,10 +334,50 @@ class GameStatesController():
                 self.transition_where = "Nothing"
                 self.menu.transition_to_which_menu = "Nothing"
 
-    def run(self, delta_time):
-        
-        # Run the event loop
-        self.event_loop()
+    def draw_transition(self):
+
+        # Draws the transition between game states (The bars are resized in update_transition)
+        """ Note: The bars are drawn with their height from before they were last changed, so that they are shown the same as when the transition was drawn before it was updated
+        - i.e. the first frame of a transition (with no bars) is shown, and the bars are still drawn on the frame that the transition ends
+        """
+
+        # If the bars have a height
+        if self.bar_drawn_height > 0:
+
+            # Top black bar
+            pygame_draw_rect(
+                surface = self.surface,
+                color = (113, 179, 64),
+                rect = (
+                        0, 
+                        0, 
+                        self.surface.get_width(), 
+                        self.bar_drawn_height
+                        ),
+                width = 0
+                )
+
+            # Bottom black bar
+            pygame_draw_rect(
+                surface = self.surface,
+                color = (113, 179, 64),
+                rect = (
+                        0, 
+                        self.surface.get_height() - self.bar_drawn_height, 
+                        self.surface.get_width(), 
+                        self.bar_drawn_height
+                        ),
+                width = 0
+                )            
+
+            # The regions of the screen that the bars are drawn in have changed
+            mark_dirty_rect(rect = (0, 0, self.surface.get_width(), self.bar_drawn_height))
+            mark_dirty_rect(rect = (0, self.surface.get_height() - self.bar_drawn_height, self.surface.get_width(), self.bar_drawn_height))
+
+    def update(self, delta_time):
+
+        # Updates the game states by one step (Nothing is drawn here)
+        # Note: The events are handled separately in event_loop, so that they are only handled once per frame regardless of the number of steps
 
         # Check if we need to reset the game, and reset the game if we do
         self.detect_and_perform_game_over_reset()
@@ -371,13 +393,67 @@ class GameStatesController():
 
             # If the player has not died
             if self.game.game_over == False:
-                # Run the game
-                self.game.run(delta_time)
+                # Update the game
+                self.game.update(delta_time)
+
+        # Update the transition between game states (i.e. changes between the menus and the game)
+        self.update_transition(delta_time = delta_time)
+
+    def draw(self, delta_time, alpha = 1):
+
+        # Draws the game states (Called once for every frame that is displayed, with the time since the last frame was displayed)
+        """ Note: alpha is the fraction of a fixed step that has passed since the last fixed step was performed (Always 1 if the game is not updated in fixed steps) """
+
+        # If none of the menus are being shown (and the level has been loaded, as the transition may have just changed to the game)
+        if self.menu.current_menu == "game" and self.level_loaded == True:
+
+            # If the player has not died
+            if self.game.game_over == False:
+
+                # If the game should be drawn between the last two fixed steps
+                if alpha < 1:
+                    # Move the player, the boss, the projectiles and the camera to their interpolated positions
+                    self.game.render_interpolator.move_to_interpolated_positions(alpha = alpha)
+
+                    # Draw the game
+                    self.game.draw(delta_time)
+
+                    # Move them back to their current positions
+                    self.game.render_interpolator.move_to_current_positions()
+                else:
+                    # Draw the game
+                    self.game.draw(delta_time)
 
         # If any menus are being shown
         elif self.menu.current_menu != "game":
             # Run the menus
+            # Note: The menus are not part of the game's simulation, so they are run (handling the buttons and drawing) once per frame
             self.menu.run(delta_time)
 
-        # Performs the transition between game states (i.e. changes between the menu and draws the transition)
-        self.perform_transition(delta_time = delta_time)
\ No newline at end of file
+        # Draw the transition between game states
+        self.draw_transition()
+
+        # Draw the profiler overlay on top of everything else
+        if self.show_profiler_overlay == True:
+            self.profiler_overlay.draw(surface = self.surface)
+
+        # Check whether nothing is happening (A menu is being shown without any transition or input)
+        self.idle = (
+                    self.menu.current_menu != "game" and 
+                    self.transition_where == "Nothing" and 
+                    self.number_of_events_handled == 0 and 
+                    self.menu.is_idle() == True
+                    )
+
+    def run(self, delta_time):
+
+        # Runs a single frame, updating the game states with the delta time of the frame
+        
+        # Run the event loop
+        self.event_loop()
+
+        # Update the game states (e.g. changing game states from the menu to in-game)
+        self.update(delta_time)
+
+        # Draw the game states
+        self.draw(delta_time)
\ No newline at end of file
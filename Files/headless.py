@@ -0,0 +1,109 @@
+from os import environ as os_environ
+
+# Use the dummy video and audio drivers, so that the game can be run without a display or sound device
+# Note: These must be set before pygame is initialised
+os_environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os_environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from Global.input_recorder import begin_frame as input_begin_frame
+from Global.input_recorder import start_replay as input_start_replay
+from Global.input_recorder import replay_finished as input_replay_finished
+from Global.trace_exporter import trace_exporter_dict, start_tracing, begin_trace_frame, end_trace_frame
+from game_states_controller import GameStatesController
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+from pygame import init as pygame_init
+from pygame.mixer import pre_init as pygame_mixer_pre_init
+from pygame.mixer import init as pygame_mixer_init
+
+class HeadlessMain:
+
+    """ Note: Runs the game loop without a display, as fast as possible (uncapped) with a synthetic delta time. 
+    - Used for soak-testing the game (e.g. boss fights) much faster than real time
+    - Run from the root of the repository (the same as main.py) so that the assets can be found, e.g. python Files/headless.py --frames 100000
+    """
+    def __init__(self, delta_time, skip_menu, replay_file_path = None, trace_file_path = None):
+
+        # Sound
+        pygame_mixer_pre_init(44100, -16, 2, 512)
+        pygame_mixer_init()
+
+        # Pygame set-up
+        pygame_init()
+
+        # If a recorded session should be replayed, load it (This must be done before the game states controller is created, so that the random number generator is seeded first)
+        if replay_file_path != None:
+            input_start_replay(file_path = replay_file_path)
+
+        # Create a game states controller without a display
+        self.game_states_controller = GameStatesController(headless = True)
+
+        # If the frames should be traced, start writing spans to the trace file
+        if trace_file_path != None:
+            start_tracing(file_path = trace_file_path)
+
+        # The delta time passed into the game states controller every frame (the same every frame, regardless of how long each frame actually takes)
+        self.delta_time = delta_time
+
+        # If the menus should be skipped, start inside the game (Recorded sessions always start from the main menu)
+        if skip_menu == True and replay_file_path == None:
+            self.game_states_controller.menu.current_menu = "game"
+
+    def run(self, number_of_frames):
+
+        # Runs the game states controller for the number of frames given (or until a recorded session has been fully replayed), returning the time taken for each frame (in seconds)
+
+        # List holding the time taken for each frame
+        frame_times = []
+
+        for _ in range(0, number_of_frames):
+
+            # If a recorded session has been fully replayed, stop running
+            if input_replay_finished() == True:
+                break
+
+            # Record the time that the frame started
+            frame_start_time = perf_counter()
+            
+            # Capture the input for this frame (When replaying a recorded session, the recorded delta time is used instead)
+            delta_time = input_begin_frame(delta_time = self.delta_time)
+
+            # If the frames are being traced, start the span of this frame
+            if trace_exporter_dict["Enabled"] == True:
+                begin_trace_frame()
+
+            # Run the game states controller
+            # Note: The display is never updated, as there is no display
+            self.game_states_controller.run(delta_time)
+
+            # If the frames are being traced, record the span of this frame
+            if trace_exporter_dict["Enabled"] == True:
+                end_trace_frame()
+
+            # Save the time taken for this frame
+            frame_times.append(perf_counter() - frame_start_time)
+
+        return frame_times
+
+if __name__ == "__main__":
+
+    # Command-line arguments
+    argument_parser = ArgumentParser(description = "Runs Panda's Wit without a display, uncapped with a synthetic delta time")
+    argument_parser.add_argument("--frames", type = int, default = 10000, help = "The number of frames to run")
+    argument_parser.add_argument("--delta-time", type = float, default = 1 / 60, help = "The delta time (in seconds) used for every frame")
+    argument_parser.add_argument("--show-menu", action = "store_true", help = "Start at the main menu instead of inside the game")
+    argument_parser.add_argument("--replay", default = None, help = "Replay a session recorded with main.py --record (Runs every recorded frame, unless --frames is smaller)")
+    argument_parser.add_argument("--trace", default = None, help = "Write the spans of each frame to this file in the Chrome trace event format")
+    arguments = argument_parser.parse_args()
+
+    # Instantiate headless main and run it
+    headless_main = HeadlessMain(delta_time = arguments.delta_time, skip_menu = arguments.show_menu == False, replay_file_path = arguments.replay, trace_file_path = arguments.trace)
+    frame_times = headless_main.run(number_of_frames = arguments.frames)
+
+    # Display the results
+    time_taken = sum(frame_times)
+    sorted_frame_times = sorted(frame_times)
+    print(f"Ran {len(frame_times)} frames in {time_taken:.2f} seconds ({len(frame_times) / time_taken:.1f} frames per second)")
+    print(f"Frame times (ms): mean {(time_taken / len(frame_times)) * 1000:.3f}, median {sorted_frame_times[len(frame_times) // 2] * 1000:.3f}, 99th percentile {sorted_frame_times[int(len(frame_times) * 0.99)] * 1000:.3f}, max {sorted_frame_times[-1] * 1000:.3f}")
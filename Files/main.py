@@ -1,5 +1,15 @@
+from Global.settings import USE_FIXED_TIMESTEP, SIMULATION_TICK_RATE, MAXIMUM_SIMULATION_STEPS_PER_FRAME, IDLE_FRAMERATE
+from Global.input_recorder import begin_frame as input_begin_frame
+from Global.input_recorder import start_recording as input_start_recording
+from Global.input_recorder import start_replay as input_start_replay
+from Global.input_recorder import replay_finished as input_replay_finished
+from Global.input_recorder import input_recorder_dict
+from Global.frame_profiler import profiler_dict, begin_profiler_frame, end_profiler_frame
+from Global.trace_exporter import trace_exporter_dict, start_tracing, begin_trace_frame, end_trace_frame
+from Global.dirty_rects import present_dirty_rects
 from game_states_controller import GameStatesController
 
+from argparse import ArgumentParser
 from time import perf_counter
 
 from pygame import init as pygame_init
@@ -7,10 +17,13 @@ from pygame.mixer import pre_init as pygame_mixer_pre_init
 from pygame.mixer import init as pygame_mixer_init
 from pygame.display import set_caption as pygame_display_set_caption
 from pygame.time import Clock as pygame_time_Clock
-from pygame.display import update as pygame_display_update
+from pygame.event import wait as pygame_event_wait
+from pygame.event import post as pygame_event_post
+from pygame import NOEVENT as pygame_NOEVENT
+from pygame import quit as pygame_quit
 
 class Main:
-    def __init__(self):
+    def __init__(self, record_file_path = None, replay_file_path = None, seed = None, trace_file_path = None):
 
         # Sound
         pygame_mixer_pre_init(44100, -16, 2, 512)
@@ -21,10 +34,21 @@ class Main:
 
         # Set the caption
         pygame_display_set_caption("Panda's Wit")
+
+        # Input recording / replaying
+        # Note: This must be done before the game states controller is created, so that the random number generator is seeded before anything random happens
+        if record_file_path != None:
+            input_start_recording(file_path = record_file_path, seed = seed)
+        elif replay_file_path != None:
+            input_start_replay(file_path = replay_file_path)
         
         # Create a game states controller
         self.game_states_controller = GameStatesController()
 
+        # If the frames should be traced, start writing spans to the trace file
+        if trace_file_path != None:
+            start_tracing(file_path = trace_file_path)
+
         # Times
         # Record the previous frame that was played
         self.previous_frame = perf_counter()
@@ -32,10 +56,21 @@ class Main:
         # Create an object to track time
         self.clock = pygame_time_Clock()
         self.chosen_framerate = 60
+
+        # Fixed timestep
+        # The delta time of each fixed step
+        self.fixed_delta_time = 1 / SIMULATION_TICK_RATE
+        # The time that has passed which has not been simulated yet
+        self.accumulated_time = 0
         
     def run(self):
  
         while True:
+
+            # If nothing is happening in the menus, wait for input (or until the next idle frame)
+            # Note: Not done when replaying a recorded session, as the input comes from the recording
+            if self.game_states_controller.idle == True and input_recorder_dict["Mode"] != "Replay":
+                self.wait_while_idle()
             
             # Limit FPS to 60
             self.clock.tick(self.chosen_framerate)
@@ -44,16 +79,102 @@ class Main:
             delta_time = perf_counter() - self.previous_frame
             self.previous_frame = perf_counter()
 
-            # Run the game states controller
-            # Note: This is where we can change game states, e.g. from the menu to ingame
-            self.game_states_controller.run(delta_time)
+            # If a recorded session has been fully replayed, close the program
+            if input_replay_finished() == True:
+                pygame_quit()
+                return
+
+            # Capture the input for this frame (When replaying a recorded session, the recorded delta time is used instead)
+            delta_time = input_begin_frame(delta_time = delta_time)
+
+            # If the frame profiler is enabled, start timing this frame (The profiler can be enabled / disabled during the frame, e.g. with the profiler overlay's key)
+            profiling_frame = profiler_dict["Enabled"]
+            if profiling_frame == True:
+                begin_profiler_frame()
+
+            # If the frames are being traced, start the span of this frame
+            if trace_exporter_dict["Enabled"] == True:
+                begin_trace_frame()
+
+            # If the game should be updated with a variable delta time
+            if USE_FIXED_TIMESTEP == False:
+                # Run the game states controller
+                # Note: This is where we can change game states, e.g. from the menu to ingame
+                self.game_states_controller.run(delta_time)
+
+            # If the game should be updated in fixed steps
+            elif USE_FIXED_TIMESTEP == True:
+                # Handle the events for this frame (Once per frame, regardless of the number of steps performed)
+                self.game_states_controller.event_loop()
+
+                # Update the game states in fixed steps for the time that has passed
+                self.run_fixed_steps(delta_time = delta_time)
+
+                # Draw the game states once for this frame, between the last two fixed steps using the time left over
+                self.game_states_controller.draw(delta_time, alpha = self.accumulated_time / self.fixed_delta_time)
             
             # -------------------------------------
-            # Update display
-            pygame_display_update() 
+            # Update display (Only the regions of the screen that changed)
+            present_dirty_rects()
+
+            # Stop timing this frame (if the profiler was enabled for the entire frame)
+            if profiling_frame == True and profiler_dict["Enabled"] == True:
+                end_profiler_frame()
+
+            # If the frames are being traced, record the span of this frame
+            if trace_exporter_dict["Enabled"] == True:
+                end_trace_frame()
+
+    def wait_while_idle(self):
+
+        # Blocks until an event is received or until it is time for the next idle frame (so that almost no CPU is used when nothing is happening)
+
+        # Wait for an event
+        event = pygame_event_wait(timeout = round(1000 / IDLE_FRAMERATE))
+
+        # If an event was received, put it back so that it is handled by the game states controller
+        if event.type != pygame_NOEVENT:
+            pygame_event_post(event)
+
+    def run_fixed_steps(self, delta_time):
+
+        # Updates the game states controller in fixed steps for the time that has passed since the last frame
+        """ Notes:
+        - Each step is always the same length, so the movement / physics of the player and bosses are the same regardless of the framerate
+        - Any time left over (less than a single step) is carried over to the next frame
+        - Only the update is performed for each step, the game states are drawn once per displayed frame afterwards (so the cost of drawing does not grow with the number of steps)
+        - The time left over is used to draw the player, the boss, the projectiles and the camera between their positions before and after the last step (See RenderInterpolator), so that movement is smooth when the framerate is not a multiple of the tick rate
+        """
+
+        # Add the time that has passed
+        self.accumulated_time += delta_time
+
+        # Perform as many fixed steps as possible (up to the maximum number of steps per frame)
+        steps_performed = 0
+        while self.accumulated_time >= self.fixed_delta_time and steps_performed < MAXIMUM_SIMULATION_STEPS_PER_FRAME:
+
+            # Update the game states controller with the fixed delta time
+            self.game_states_controller.update(self.fixed_delta_time)
+
+            # Remove the simulated time
+            self.accumulated_time -= self.fixed_delta_time
+            steps_performed += 1
+
+        # If the maximum number of steps was reached, discard the time that could not be simulated (so that the game slows down instead of performing more and more steps to catch up)
+        if steps_performed == MAXIMUM_SIMULATION_STEPS_PER_FRAME:
+            self.accumulated_time = min(self.accumulated_time, self.fixed_delta_time)
             
 
 if __name__ == "__main__":
+
+    # Command-line arguments
+    argument_parser = ArgumentParser(description = "Panda's Wit")
+    argument_parser.add_argument("--record", default = None, help = "Record the session's input to this file")
+    argument_parser.add_argument("--replay", default = None, help = "Replay a session's input from this file")
+    argument_parser.add_argument("--seed", type = int, default = 0, help = "The seed for the random number generator when recording")
+    argument_parser.add_argument("--trace", default = None, help = "Write the spans of each frame to this file in the Chrome trace event format")
+    arguments = argument_parser.parse_args()
+
     # Instantiate main and run it
-    main = Main()
+    main = Main(record_file_path = arguments.record, replay_file_path = arguments.replay, seed = arguments.seed, trace_file_path = arguments.trace)
     main.run()
\ No newline at end of file